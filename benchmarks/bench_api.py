@@ -0,0 +1,368 @@
+"""
+In-process load benchmark of the API.
+
+Drives src.main.app through httpx ASGITransport against a seeded scratch
+database and reports throughput and p50/p95/p99 latencies per scenario:
+signup, signin, get-user, list-users (shallow and deep pages), patch and
+delete. Results can be saved as JSON and compared against a baseline,
+a scenario regresses when its throughput drops or its p95 grows beyond
+the tolerance.
+
+By default a temporary SQLite file is used. A local PostgreSQL stand-in
+can be given with --database-url, its tables are dropped and recreated.
+
+Usage: python -m benchmarks.bench_api [--requests 200] [--concurrency 4]
+           [--users 5000] [--output results.json]
+           [--baseline benchmarks/baselines/bench_api.json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from statistics import quantiles
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from httpx import ASGITransport, AsyncClient, Response
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.company_entity import Company
+from src.domain.entities.user_entity import User
+from src.domain.entities.user_role import UserRole
+from src.infrastructure.db.session import Base, get_db
+from src.infrastructure.repositories.company_repository_sqlalchemy import (
+    CompanyRepositorySQLAlchemy,
+)
+from src.infrastructure.repositories.user_repository_sqlalchemy import (
+    UserRepositorySQLAlchemy,
+)
+from src.infrastructure.security.password_hasher_bcrypt import (
+    PasswordHasherBcrypt,
+)
+from src.main import app
+
+ADMIN_EMAIL = 'admin@bench.com'
+PASSWORD = '123456789'
+
+Scenario = Callable[[AsyncClient, int], Awaitable[Response]]
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @classmethod
+    def from_latencies(
+        cls, name: str, latencies: List[float], elapsed: float
+    ) -> 'ScenarioResult':
+        percentiles = quantiles(latencies, n=100, method='inclusive')
+
+        return cls(
+            name=name,
+            requests=len(latencies),
+            throughput=round(len(latencies) / elapsed, 2),
+            p50_ms=round(percentiles[49] * 1000, 2),
+            p95_ms=round(percentiles[94] * 1000, 2),
+            p99_ms=round(percentiles[98] * 1000, 2),
+        )
+
+
+@dataclass
+class BenchContext:
+    headers: Dict[str, str]
+    user_ids: List[str]
+    deletable_ids: List[str]
+
+
+async def seed(
+    AsyncSessionLocal: sessionmaker, users_count: int, deletable: int
+) -> tuple[List[str], List[str]]:
+    """
+    Create the benchmark company, its admin and users.
+
+    :return: Ids of the listed users and of the users to be deleted.
+    """
+    # Hash once, bcrypt would dominate seeding otherwise
+    password = await PasswordHasherBcrypt().async_hash(PASSWORD)
+
+    async with AsyncSessionLocal() as session:
+        company = await CompanyRepositorySQLAlchemy(session).create(
+            Company('Bench Company')
+        )
+        user_repository = UserRepositorySQLAlchemy(session)
+        await user_repository.create(
+            User(
+                name='admin',
+                email=ADMIN_EMAIL,
+                password=password,
+                role=UserRole.ADMIN,
+                company_id=company.id,
+            )
+        )
+        users = await user_repository.create_many(
+            [
+                User(
+                    name=f'user {i}',
+                    email=f'user{i}@bench.com',
+                    password=password,
+                    company_id=company.id,
+                )
+                for i in range(users_count + deletable)
+            ]
+        )
+
+    ids = [str(user.id) for user in users]
+
+    return ids[:users_count], ids[users_count:]
+
+
+def build_scenarios(
+    context: BenchContext, users_count: int
+) -> Dict[str, Scenario]:
+    headers = context.headers
+    user_ids = context.user_ids
+    deep_offset = max(users_count - 100, 0)
+
+    async def signup(client: AsyncClient, i: int) -> Response:
+        return await client.post(
+            '/auth/signup',
+            json={
+                'company_name': f'Signup Company {i}',
+                'name': f'signup {i}',
+                'email': f'signup{i}@bench.com',
+                'password': PASSWORD,
+            },
+        )
+
+    async def signin(client: AsyncClient, i: int) -> Response:
+        return await client.post(
+            '/auth/signin',
+            data={'username': ADMIN_EMAIL, 'password': PASSWORD},
+        )
+
+    async def get_user(client: AsyncClient, i: int) -> Response:
+        return await client.get(
+            f'/users/{user_ids[i % len(user_ids)]}', headers=headers
+        )
+
+    async def list_users_shallow(client: AsyncClient, i: int) -> Response:
+        return await client.get('/users/?limit=100', headers=headers)
+
+    async def list_users_deep(client: AsyncClient, i: int) -> Response:
+        return await client.get(
+            f'/users/?limit=100&offset={deep_offset}', headers=headers
+        )
+
+    async def patch_user(client: AsyncClient, i: int) -> Response:
+        return await client.patch(
+            f'/users/{user_ids[i % len(user_ids)]}',
+            json={'name': f'patched {i}'},
+            headers=headers,
+        )
+
+    async def delete_user(client: AsyncClient, i: int) -> Response:
+        return await client.delete(
+            f'/users/{context.deletable_ids[i]}', headers=headers
+        )
+
+    return {
+        'signup': signup,
+        'signin': signin,
+        'get-user': get_user,
+        'list-users-shallow': list_users_shallow,
+        'list-users-deep': list_users_deep,
+        'patch-user': patch_user,
+        'delete-user': delete_user,
+    }
+
+
+async def run_scenario(
+    client: AsyncClient,
+    name: str,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+) -> ScenarioResult:
+    latencies: List[float] = []
+    indexes = iter(range(requests))
+
+    async def worker():
+        # Workers share the iterator, each index is requested once
+        for i in indexes:
+            started_at = perf_counter()
+            response = await scenario(client, i)
+            latencies.append(perf_counter() - started_at)
+
+            if response.is_error:
+                raise RuntimeError(
+                    f'{name} failed with {response.status_code}: '
+                    f'{response.text}'
+                )
+
+    started_at = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return ScenarioResult.from_latencies(
+        name, latencies, perf_counter() - started_at
+    )
+
+
+def compare(
+    results: List[ScenarioResult],
+    baseline: Dict[str, Any],
+    tolerance: float,
+) -> bool:
+    """
+    Print the results against a baseline.
+
+    :return: True if any scenario regressed beyond the tolerance.
+    """
+    baseline_results = {r['name']: r for r in baseline['results']}
+    regressed = False
+
+    print(f'\n{"scenario":<20} {"req/s":>9} {"p95":>9}  vs baseline')
+
+    for result in results:
+        previous = baseline_results.get(result.name)
+
+        if previous is None:
+            print(f'{result.name:<20} {"-":>9} {"-":>9}  new')
+            continue
+
+        throughput_delta = result.throughput / previous['throughput'] - 1
+        p95_delta = result.p95_ms / previous['p95_ms'] - 1
+        status = (
+            'REGRESSION'
+            if throughput_delta < -tolerance or p95_delta > tolerance
+            else 'ok'
+        )
+        regressed = regressed or status == 'REGRESSION'
+
+        print(
+            f'{result.name:<20} {throughput_delta:>+9.1%} '
+            f'{p95_delta:>+9.1%}  {status}'
+        )
+
+    return regressed
+
+
+async def main(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database_url = (
+            args.database_url or f'sqlite+aiosqlite:///{tmpdir}/bench.db'
+        )
+        engine = create_async_engine(database_url)
+        AsyncSessionLocal = sessionmaker(
+            bind=engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+        async def override_get_db():
+            async with AsyncSessionLocal() as session:
+                yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+
+        user_ids, deletable_ids = await seed(
+            AsyncSessionLocal, args.users, args.requests
+        )
+        transport = ASGITransport(app=app)
+
+        async with AsyncClient(
+            transport=transport, base_url='http://bench'
+        ) as client:
+            response = await client.post(
+                '/auth/signin',
+                data={'username': ADMIN_EMAIL, 'password': PASSWORD},
+            )
+            token = response.json()['access_token']
+            context = BenchContext(
+                headers={'Authorization': f'Bearer {token}'},
+                user_ids=user_ids,
+                deletable_ids=deletable_ids,
+            )
+            scenarios = build_scenarios(context, args.users)
+            results: List[ScenarioResult] = []
+
+            print(
+                f'{"scenario":<20} {"req/s":>9} {"p50 (ms)":>9} '
+                f'{"p95 (ms)":>9} {"p99 (ms)":>9}'
+            )
+
+            for name, scenario in scenarios.items():
+                if args.scenarios and name not in args.scenarios:
+                    continue
+
+                result = await run_scenario(
+                    client, name, scenario, args.requests, args.concurrency
+                )
+                results.append(result)
+
+                print(
+                    f'{result.name:<20} {result.throughput:>9.1f} '
+                    f'{result.p50_ms:>9.2f} {result.p95_ms:>9.2f} '
+                    f'{result.p99_ms:>9.2f}'
+                )
+
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+    report = {
+        'python': platform.python_version(),
+        'database': engine.dialect.name,
+        'requests': args.requests,
+        'concurrency': args.concurrency,
+        'users': args.users,
+        'results': [asdict(result) for result in results],
+    }
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + '\n')
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+
+        if compare(results, baseline, args.tolerance):
+            return 1
+
+    return 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--users', type=int, default=5000)
+    parser.add_argument('--scenarios', nargs='+')
+    parser.add_argument('--database-url')
+    parser.add_argument('--output', help='Write the results as JSON')
+    parser.add_argument('--baseline', help='JSON results to compare with')
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help='Allowed relative throughput drop or p95 growth',
+    )
+
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,115 @@
+"""
+Per-object cost of UserOutputDTO.model_validate against:
+
+- legacy: the previous BaseDTO override that walked and mutated the
+  source entity
+- core: the same DTO with the id kept as a UUID, validated without any
+  Python call, to measure the IdStr validator
+
+Usage: python -m benchmarks.bench_dto_validate [--objects 10000] [--repeat 5]
+"""
+
+import argparse
+from dataclasses import fields
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import List
+from uuid import UUID
+
+from pydantic import AwareDatetime, BaseModel, ConfigDict
+from uuid_extensions import uuid7
+
+from src.application.dtos.base_dto import BaseDTO
+from src.application.dtos.user.user_output_dto import UserOutputDTO
+from src.domain.entities.user_entity import User
+from src.domain.entities.user_role import UserRole
+
+
+class LegacyBaseDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def model_validate(cls, obj):
+        for attr in fields(obj):
+            value = getattr(obj, attr.name)
+
+            if isinstance(value, UUID):
+                setattr(obj, attr.name, str(value))
+
+            if isinstance(value, datetime):
+                if value.tzinfo is None:
+                    setattr(obj, attr.name, value.replace(tzinfo=timezone.utc))
+
+        return super().model_validate(obj)
+
+
+class LegacyUserOutputDTO(LegacyBaseDTO):
+    id: str
+    name: str
+    email: str
+    role: UserRole
+    avatar: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class CoreUserOutputDTO(BaseDTO):
+    id: UUID
+    name: str
+    email: str
+    role: UserRole
+    avatar: str
+    created_at: AwareDatetime
+    updated_at: AwareDatetime
+
+
+def build_users(count: int) -> List[User]:
+    company_id = uuid7()
+
+    return [
+        User(
+            name=f'user {i}',
+            email=f'user{i}@bench.com',
+            password='hashed',
+            company_id=company_id,
+        )
+        for i in range(count)
+    ]
+
+
+def measure(dto: type[BaseModel], count: int, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        # Fresh entities per run, the legacy path mutates its input
+        users = build_users(count)
+
+        started_at = perf_counter()
+
+        for user in users:
+            dto.model_validate(user)
+
+        best = min(best, (perf_counter() - started_at) / count)
+
+    return best
+
+
+def main(count: int, repeat: int) -> None:
+    print(f'{"dto":>8} {"us/object":>10}')
+
+    for name, dto in (
+        ('legacy', LegacyUserOutputDTO),
+        ('native', UserOutputDTO),
+        ('core', CoreUserOutputDTO),
+    ):
+        per_object = measure(dto, count, repeat)
+        print(f'{name:>8} {per_object * 1_000_000:>10.2f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--objects', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    main(args.objects, args.repeat)
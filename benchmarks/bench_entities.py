@@ -0,0 +1,101 @@
+"""
+Memory and construction time of slotted User entities against the
+previous dict-based dataclass with reflective timezone normalization.
+
+Usage: python -m benchmarks.bench_entities [--users 100000]
+"""
+
+import argparse
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Callable, List, Optional, Tuple
+from uuid import UUID
+
+from uuid_extensions import uuid7
+
+from src.domain.entities.user_entity import User
+from src.domain.entities.user_role import UserRole
+
+
+@dataclass
+class LegacyBaseEntity:
+    def __post_init__(self):
+        for attr, value in vars(self).items():
+            if isinstance(value, datetime):
+                if value.tzinfo is None:
+                    setattr(self, attr, value.replace(tzinfo=timezone.utc))
+
+
+@dataclass
+class LegacyUser(LegacyBaseEntity):
+    name: str
+    email: str
+    password: str
+    company_id: UUID | str | int | bytes
+    role: Optional[UserRole] = UserRole.USER
+    id: Optional[UUID | str | int | bytes] = field(default_factory=uuid7)
+    avatar: Optional[str] = ''
+    created_at: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+
+
+def build(entity: Callable, count: int) -> List:
+    # Naive datetimes, as read from SQLite, so normalization does real work
+    created_at = datetime(2024, 1, 1, 12, 0, 0)
+
+    return [
+        entity(
+            f'user {i}',
+            f'user{i}@bench.com',
+            'hashed',
+            'company-id',
+            UserRole.USER,
+            f'user-id-{i}',
+            '',
+            created_at,
+            created_at,
+        )
+        for i in range(count)
+    ]
+
+
+def measure(entity: Callable, count: int) -> Tuple[float, int]:
+    started_at = perf_counter()
+    build(entity, count)
+    elapsed = perf_counter() - started_at
+
+    # Memory is traced in a separate run, tracing distorts the timings
+    tracemalloc.start()
+    users = build(entity, count)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del users
+
+    return elapsed, memory
+
+
+def main(count: int) -> None:
+    print(f'{"entity":>8} {"total (ms)":>11} {"us/user":>8} {"MiB":>8}')
+
+    for name, entity in (('legacy', LegacyUser), ('slots', User)):
+        elapsed, memory = measure(entity, count)
+
+        print(
+            f'{name:>8} {elapsed * 1000:>11.2f} '
+            f'{elapsed / count * 1_000_000:>8.2f} {memory / 2**20:>8.2f}'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=100_000)
+    args = parser.parse_args()
+
+    main(args.users)
@@ -0,0 +1,216 @@
+"""
+Serialization cost of the users list at several page sizes.
+
+Renders a UserListOutputDTO page with:
+
+- stdlib: jsonable_encoder then starlette JSONResponse (json.dumps), as
+  FastAPI does for returned values with its default response class
+- fast: jsonable_encoder then FastJSONResponse, as FastAPI now does for
+  returned values with the app default response class
+- dto: DTOResponse, the model encoded straight to bytes, as the user
+  routes do
+
+GET /users?limit=<page size> is then timed end to end through the app
+against an in-memory SQLite database.
+
+Usage: python -m benchmarks.bench_serialization [--sizes 10 50 100]
+           [--requests 300] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.responses import JSONResponse, Response
+from uuid_extensions import uuid7str
+
+from src.application.dtos.security.token_generator_encode_dto import (
+    TokenGeneratorEncodeInputDTO,
+)
+from src.application.dtos.user.user_list_dto import UserListOutputDTO
+from src.application.dtos.user.user_output_dto import UserOutputDTO
+from src.domain.entities.company_entity import Company
+from src.domain.entities.user_entity import User
+from src.domain.entities.user_role import UserRole
+from src.infrastructure.db.session import Base, get_db
+from src.infrastructure.repositories.company_repository_sqlalchemy import (
+    CompanyRepositorySQLAlchemy,
+)
+from src.infrastructure.repositories.user_repository_sqlalchemy import (
+    UserRepositorySQLAlchemy,
+)
+from src.infrastructure.security.token_generator_pyjwt import (
+    TokenGeneratorPyJWT,
+)
+from src.main import app
+from src.presentation.api.v1.responses import DTOResponse, FastJSONResponse
+
+Render = Callable[[UserListOutputDTO], Response]
+
+RENDERS: Dict[str, Render] = {
+    'stdlib': lambda dto: JSONResponse(jsonable_encoder(dto)),
+    'fast': lambda dto: FastJSONResponse(jsonable_encoder(dto)),
+    'dto': DTOResponse,
+}
+
+
+def build_page(size: int) -> UserListOutputDTO:
+    now = datetime.now(timezone.utc)
+
+    return UserListOutputDTO(
+        data=[
+            UserOutputDTO(
+                id=uuid7str(),
+                name=f'user {i}',
+                email=f'user{i}@bench.com',
+                role=UserRole.USER,
+                avatar='',
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(size)
+        ],
+        next_cursor='cursor',
+    )
+
+
+def measure_render(
+    render: Render, dto: UserListOutputDTO, repeat: int
+) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        started_at = perf_counter()
+
+        for _ in range(200):
+            render(dto)
+
+        best = min(best, (perf_counter() - started_at) / 200)
+
+    return best
+
+
+async def seed(
+    AsyncSessionLocal: sessionmaker, users_count: int
+) -> Dict[str, str]:
+    async with AsyncSessionLocal() as session:
+        company = await CompanyRepositorySQLAlchemy(session).create(
+            Company('Bench Company')
+        )
+        users = [
+            User(
+                name=f'user {i}',
+                email=f'user{i}@bench.com',
+                password='hashed',
+                role=UserRole.ADMIN if i == 0 else UserRole.USER,
+                company_id=company.id,
+            )
+            for i in range(users_count)
+        ]
+        await UserRepositorySQLAlchemy(session).create_many(users)
+
+    token = await TokenGeneratorPyJWT().async_encode(
+        TokenGeneratorEncodeInputDTO(
+            user_id=str(users[0].id),
+            user_role=UserRole.ADMIN,
+            company_id=str(company.id),
+        )
+    )
+
+    return {'Authorization': f'Bearer {token.access_token}'}
+
+
+async def measure_route(
+    client: AsyncClient,
+    size: int,
+    headers: Dict[str, str],
+    requests: int,
+    repeat: int,
+) -> float:
+    url = f'/users/?limit={size}'
+    best = 0.0
+
+    for _ in range(repeat):
+        started_at = perf_counter()
+
+        for _ in range(requests):
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+
+        best = max(best, requests / (perf_counter() - started_at))
+
+    return best
+
+
+async def main(sizes: List[int], requests: int, repeat: int) -> None:
+    engine = create_async_engine(
+        'sqlite+aiosqlite:///:memory:', poolclass=StaticPool
+    )
+    AsyncSessionLocal = sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async def override_get_db():
+        async with AsyncSessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    headers = await seed(AsyncSessionLocal, max(sizes))
+    transport = ASGITransport(app=app)
+
+    print(
+        f'{"page size":>9} '
+        + ' '.join(f'{name + " (us)":>11}' for name in RENDERS)
+        + f' {"speedup":>8} {"route req/s":>12}'
+    )
+
+    async with AsyncClient(transport=transport, base_url='http://bench') as ac:
+        # Warm up caches (requester, decoded token, compiled statements)
+        await ac.get('/users/?limit=1', headers=headers)
+
+        for size in sizes:
+            dto = build_page(size)
+            timings = {
+                name: measure_render(render, dto, repeat)
+                for name, render in RENDERS.items()
+            }
+            throughput = await measure_route(
+                ac, size, headers, requests, repeat
+            )
+
+            print(
+                f'{size:>9} '
+                + ' '.join(
+                    f'{timing * 1_000_000:>11.1f}'
+                    for timing in timings.values()
+                )
+                + f' {timings["stdlib"] / timings["dto"]:>7.1f}x'
+                + f' {throughput:>12.1f}'
+            )
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 50, 100])
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.sizes, args.requests, args.repeat))
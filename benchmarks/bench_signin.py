@@ -0,0 +1,102 @@
+"""
+Signin latency per bcrypt cost factor.
+
+Usage: python -m benchmarks.bench_signin [--rounds 8 10 12] [--requests 50]
+"""
+
+import argparse
+import asyncio
+from statistics import quantiles
+from time import perf_counter
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.dtos.auth.auth_signin_dto import AuthSigninInputDTO
+from src.application.usecases.auth.auth_signin_usecase import AuthSigninUseCase
+from src.domain.entities.company_entity import Company
+from src.domain.entities.user_entity import User
+from src.domain.entities.user_role import UserRole
+from src.infrastructure.db.session import Base
+from src.infrastructure.repositories.company_repository_sqlalchemy import (
+    CompanyRepositorySQLAlchemy,
+)
+from src.infrastructure.repositories.user_repository_sqlalchemy import (
+    UserRepositorySQLAlchemy,
+    user_repository_factory,
+)
+from src.infrastructure.security.password_hasher_bcrypt import (
+    PasswordHasherBcrypt,
+)
+from src.infrastructure.security.token_generator_pyjwt import (
+    TokenGeneratorPyJWT,
+)
+
+EMAIL = 'bench@bench.com'
+PASSWORD = '123456789'
+
+
+async def bench_rounds(rounds: int, requests: int) -> List[float]:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    AsyncSessionLocal = sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    password_hasher = PasswordHasherBcrypt(rounds=rounds)
+    latencies: List[float] = []
+
+    async with AsyncSessionLocal() as session:
+        user_repository = UserRepositorySQLAlchemy(session)
+        company = await CompanyRepositorySQLAlchemy(session).create(
+            Company('Bench Company')
+        )
+        await user_repository.create(
+            User(
+                name='bench',
+                email=EMAIL,
+                password=await password_hasher.async_hash(PASSWORD),
+                role=UserRole.ADMIN,
+                company_id=company.id,
+            )
+        )
+
+        usecase = AuthSigninUseCase(
+            user_repository,
+            password_hasher,
+            TokenGeneratorPyJWT(),
+            user_repository_factory(AsyncSessionLocal),
+        )
+        data = AuthSigninInputDTO(email=EMAIL, password=PASSWORD)
+
+        for _ in range(requests):
+            started_at = perf_counter()
+            await usecase.execute(data)
+            latencies.append(perf_counter() - started_at)
+
+    await engine.dispose()
+
+    return latencies
+
+
+async def main(rounds_list: List[int], requests: int) -> None:
+    print(f'{"rounds":>6} {"p50 (ms)":>10} {"p99 (ms)":>10}')
+
+    for rounds in rounds_list:
+        latencies = await bench_rounds(rounds, requests)
+        percentiles = quantiles(latencies, n=100, method='inclusive')
+        p50, p99 = percentiles[49] * 1000, percentiles[98] * 1000
+
+        print(f'{rounds:>6} {p50:>10.2f} {p99:>10.2f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rounds', type=int, nargs='+', default=[8, 10, 12])
+    parser.add_argument('--requests', type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rounds, args.requests))
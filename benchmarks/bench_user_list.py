@@ -0,0 +1,199 @@
+"""
+Throughput of GET /users?limit=100 with DTOResponse against the previous
+path, where FastAPI validated the returned DTO again against
+`response_model` before serializing it.
+
+The response phase is also timed on its own, with the previous path
+emulated as FastAPI runs it: dump the DTO, validate it against the
+response model, serialize it in json mode and render it with json.dumps.
+
+Usage: python -m benchmarks.bench_user_list [--requests 500] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Callable, Dict
+
+from fastapi import APIRouter, Query
+from httpx import ASGITransport, AsyncClient
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.responses import JSONResponse, Response
+
+from src.application.dtos.security.token_generator_encode_dto import (
+    TokenGeneratorEncodeInputDTO,
+)
+from src.application.dtos.user.user_list_dto import UserListOutputDTO
+from src.application.dtos.user.user_output_dto import UserOutputDTO
+from src.application.usecases.user.user_list_usecase import UserListUseCase
+from src.core.container import GetRequesterFromTokenDep, UserListUseCaseDep
+from src.domain.entities.company_entity import Company
+from src.domain.entities.user_entity import User
+from src.domain.entities.user_role import UserRole
+from src.infrastructure.db.session import Base, get_db
+from src.infrastructure.repositories.company_repository_sqlalchemy import (
+    CompanyRepositorySQLAlchemy,
+)
+from src.infrastructure.repositories.user_repository_sqlalchemy import (
+    UserRepositorySQLAlchemy,
+)
+from src.infrastructure.security.token_generator_pyjwt import (
+    TokenGeneratorPyJWT,
+)
+from src.main import app
+from src.presentation.api.v1.responses import DTOResponse
+
+legacy_router = APIRouter(prefix='/legacy/users')
+
+
+@legacy_router.get('/', response_model=UserListOutputDTO)
+async def legacy_user_list(
+    limit: int = Query(10, ge=1, le=100),
+    requester: User = GetRequesterFromTokenDep,
+    use_case: UserListUseCase = UserListUseCaseDep,
+):
+    return await use_case.execute(requester, limit, 0)
+
+
+user_list_adapter = TypeAdapter(UserListOutputDTO)
+
+
+def legacy_render(dto: UserListOutputDTO) -> Response:
+    content = user_list_adapter.validate_python(dto.model_dump())
+
+    return JSONResponse(user_list_adapter.dump_python(content, mode='json'))
+
+
+def measure_render(
+    render: Callable[[UserListOutputDTO], Response], repeat: int
+) -> float:
+    now = datetime.now(timezone.utc)
+    dto = UserListOutputDTO(
+        data=[
+            UserOutputDTO(
+                id=f'user-id-{i}',
+                name=f'user {i}',
+                email=f'user{i}@bench.com',
+                role=UserRole.USER,
+                avatar='',
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(100)
+        ]
+    )
+    best = float('inf')
+
+    for _ in range(repeat):
+        started_at = perf_counter()
+
+        for _ in range(1000):
+            render(dto)
+
+        best = min(best, (perf_counter() - started_at) / 1000)
+
+    return best
+
+
+async def seed(AsyncSessionLocal: sessionmaker) -> Dict[str, str]:
+    async with AsyncSessionLocal() as session:
+        company = await CompanyRepositorySQLAlchemy(session).create(
+            Company('Bench Company')
+        )
+        users = [
+            User(
+                name=f'user {i}',
+                email=f'user{i}@bench.com',
+                password='hashed',
+                role=UserRole.ADMIN if i == 0 else UserRole.USER,
+                company_id=company.id,
+            )
+            for i in range(100)
+        ]
+        await UserRepositorySQLAlchemy(session).create_many(users)
+
+    token = await TokenGeneratorPyJWT().async_encode(
+        TokenGeneratorEncodeInputDTO(
+            user_id=str(users[0].id),
+            user_role=UserRole.ADMIN,
+            company_id=str(company.id),
+        )
+    )
+
+    return {'Authorization': f'Bearer {token.access_token}'}
+
+
+async def measure(
+    client: AsyncClient, url: str, headers: Dict[str, str], requests: int
+) -> float:
+    started_at = perf_counter()
+
+    for _ in range(requests):
+        response = await client.get(url, headers=headers)
+        response.raise_for_status()
+
+    return requests / (perf_counter() - started_at)
+
+
+async def main(requests: int, repeat: int) -> None:
+    engine = create_async_engine(
+        'sqlite+aiosqlite:///:memory:', poolclass=StaticPool
+    )
+    AsyncSessionLocal = sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async def override_get_db():
+        async with AsyncSessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.include_router(legacy_router)
+
+    headers = await seed(AsyncSessionLocal)
+    transport = ASGITransport(app=app)
+
+    urls = {
+        'legacy': '/legacy/users/?limit=100',
+        'dto': '/users/?limit=100',
+    }
+    throughputs = dict.fromkeys(urls, 0.0)
+
+    async with AsyncClient(transport=transport, base_url='http://bench') as ac:
+        # Warm up caches (requester, decoded token, compiled statements)
+        for url in urls.values():
+            await ac.get(url, headers=headers)
+
+        # Alternate both paths and keep the best run of each
+        for _ in range(repeat):
+            for name, url in urls.items():
+                throughput = await measure(ac, url, headers, requests)
+                throughputs[name] = max(throughputs[name], throughput)
+
+    print(f'{"path":>10} {"req/s":>10} {"render (us)":>12}')
+
+    for name, render in (('legacy', legacy_render), ('dto', DTOResponse)):
+        per_render = measure_render(render, repeat)
+        print(
+            f'{name:>10} {throughputs[name]:>10.1f} '
+            f'{per_render * 1_000_000:>12.1f}'
+        )
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.repeat))
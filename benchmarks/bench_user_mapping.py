@@ -0,0 +1,125 @@
+"""
+Per-row cost of loading company users as ORM instances versus plain
+column rows mapped by `map_user_row`.
+
+Usage: python -m benchmarks.bench_user_mapping [--users 10000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Awaitable, Callable, List
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.company_entity import Company
+from src.domain.entities.user_entity import User
+from src.infrastructure.db.models.user_model import UserModel
+from src.infrastructure.db.session import Base
+from src.infrastructure.repositories.company_repository_sqlalchemy import (
+    CompanyRepositorySQLAlchemy,
+)
+from src.infrastructure.repositories.user_repository_sqlalchemy import (
+    USER_COLUMNS,
+    UserRepositorySQLAlchemy,
+    map_user_row,
+)
+
+
+async def load_orm(session: AsyncSession, company_id: str) -> List[User]:
+    stmt = (
+        select(UserModel)
+        .filter(UserModel.company_id == UUID(company_id))
+        .order_by(UserModel.id)
+    )
+    query = await session.execute(stmt)
+
+    return [
+        User(
+            id=str(result.id),
+            name=result.name,
+            email=result.email,
+            password=result.password,
+            role=result.role,
+            avatar=result.avatar,
+            company_id=str(result.company_id),
+            created_at=result.created_at,
+            updated_at=result.updated_at,
+        )
+        for result in query.scalars()
+    ]
+
+
+async def load_columns(session: AsyncSession, company_id: str) -> List[User]:
+    stmt = (
+        select(*USER_COLUMNS)
+        .filter(UserModel.company_id == UUID(company_id))
+        .order_by(UserModel.id)
+    )
+    query = await session.execute(stmt)
+
+    return [map_user_row(row) for row in query]
+
+
+async def measure(
+    AsyncSessionLocal: sessionmaker,
+    load: Callable[[AsyncSession, str], Awaitable[List[User]]],
+    company_id: str,
+    repeat: int,
+) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        # Fresh session per run, so ORM loads start with an empty identity map
+        async with AsyncSessionLocal() as session:
+            started_at = perf_counter()
+            users = await load(session, company_id)
+            best = min(best, (perf_counter() - started_at) / len(users))
+
+    return best
+
+
+async def main(users_count: int, repeat: int) -> None:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    AsyncSessionLocal = sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as session:
+        company = await CompanyRepositorySQLAlchemy(session).create(
+            Company('Bench Company')
+        )
+        await UserRepositorySQLAlchemy(session).create_many(
+            [
+                User(
+                    name=f'user {i}',
+                    email=f'user{i}@bench.com',
+                    password='hashed',
+                    company_id=company.id,
+                )
+                for i in range(users_count)
+            ]
+        )
+
+    print(f'{"path":>8} {"us/row":>10}')
+
+    for name, load in (('orm', load_orm), ('columns', load_columns)):
+        per_row = await measure(AsyncSessionLocal, load, company.id, repeat)
+        print(f'{name:>8} {per_row * 1_000_000:>10.2f}')
+
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.repeat))
@@ -4,6 +4,7 @@ from typing import List
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from uuid_extensions import uuid7str
@@ -12,18 +13,29 @@ from src.application.dtos.security.token_generator_encode_dto import (
     TokenGeneratorEncodeInputDTO,
     TokenGeneratorEncodeOutputDTO,
 )
+from src.core.settings import settings
 from src.domain.entities.company_entity import Company
 from src.domain.entities.user_entity import User, UserRole
 from src.domain.repositories.company_repository import CompanyRepository
-from src.domain.repositories.user_repository import UserRepository
+from src.domain.repositories.user_repository import (
+    UserRepository,
+    UserRepositoryFactory,
+)
 from src.domain.security.password_hasher import PasswordHasher
 from src.domain.security.token_generator import TokenGenerator
-from src.infrastructure.db.session import Base, get_db
+from src.infrastructure.cache.requester_cache import requester_cache
+from src.infrastructure.cache.token_cache import decoded_token_cache
+from src.infrastructure.db.session import (
+    Base,
+    get_db,
+    get_session_factory,
+)
 from src.infrastructure.repositories.company_repository_sqlalchemy import (
     CompanyRepositorySQLAlchemy,
 )
 from src.infrastructure.repositories.user_repository_sqlalchemy import (
     UserRepositorySQLAlchemy,
+    user_repository_factory,
 )
 from src.infrastructure.security.password_hasher_bcrypt import (
     PasswordHasherBcrypt,
@@ -34,13 +46,21 @@ from src.infrastructure.security.token_generator_pyjwt import (
 from src.main import app
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    yield
+
+    requester_cache.clear()
+    decoded_token_cache.clear()
+
+
 @pytest.fixture
 def password_hasher() -> PasswordHasher:
     return PasswordHasherBcrypt()
 
 
 @pytest.fixture
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+async def session_factory() -> AsyncGenerator[sessionmaker, None]:
     engine = create_async_engine('sqlite+aiosqlite:///:memory:')
 
     AsyncSesssionLocal = sessionmaker(
@@ -51,8 +71,7 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async with AsyncSesssionLocal() as session:
-        yield session
+    yield AsyncSesssionLocal
 
     # Cleanup
     async with engine.begin() as conn:
@@ -61,6 +80,30 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     await engine.dispose()
 
 
+@pytest.fixture
+async def get_db_session(
+    session_factory: sessionmaker,
+) -> AsyncGenerator[AsyncSession, None]:
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def sql_statements(get_db_session: AsyncSession) -> List[str]:
+    """Collect the SQL statements emitted through the test session."""
+    statements: List[str] = []
+    sync_engine = get_db_session.bind.sync_engine
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+    yield statements
+
+    event.remove(sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+
 @pytest.fixture
 async def user_repository(
     get_db_session,
@@ -68,6 +111,11 @@ async def user_repository(
     return UserRepositorySQLAlchemy(get_db_session)
 
 
+@pytest.fixture
+def repository_factory(session_factory: sessionmaker) -> UserRepositoryFactory:
+    return user_repository_factory(session_factory)
+
+
 @pytest.fixture
 async def company_repository(
     get_db_session,
@@ -235,11 +283,14 @@ async def invalid_user_token(
 
 
 @pytest.fixture
-async def client(get_db_session) -> AsyncGenerator[AsyncClient, None]:
+async def client(
+    get_db_session, session_factory
+) -> AsyncGenerator[AsyncClient, None]:
     def override_get_db_session():
         yield get_db_session
 
     app.dependency_overrides[get_db] = override_get_db_session
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
 
     transport = ASGITransport(app=app)
 
@@ -251,6 +302,13 @@ async def client(get_db_session) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def internal_token_headers(monkeypatch) -> dict:
+    monkeypatch.setattr(settings, 'INTERNAL_API_TOKEN', 'internal-token')
+
+    return {'Authorization': 'Bearer internal-token'}
+
+
 @pytest.fixture
 def datetime_to_web_iso():
     def convert_date(date: datetime) -> str:
@@ -0,0 +1,28 @@
+"""add users table version column
+
+Revision ID: 5a8c2e9d4f17
+Revises: 7b1e4f2c9a63
+Create Date: 2026-10-17 16:42:08.731925
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a8c2e9d4f17'
+down_revision: Union[str, Sequence[str], None] = '7b1e4f2c9a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'version')
@@ -0,0 +1,34 @@
+"""add companies table users_count column
+
+Revision ID: 7b1e4f2c9a63
+Revises: 3c9d5e1a7b24
+Create Date: 2026-10-17 14:05:12.518304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b1e4f2c9a63'
+down_revision: Union[str, Sequence[str], None] = '3c9d5e1a7b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('companies', sa.Column('users_count', sa.Integer(), server_default='0', nullable=False))
+    # Backfill the counter with the users already registered
+    op.execute(
+        'UPDATE companies SET users_count = ('
+        'SELECT COUNT(*) FROM users WHERE users.company_id = companies.id'
+        ')'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('companies', 'users_count')
@@ -0,0 +1,31 @@
+from enum import StrEnum
+from typing import List, Optional
+
+from pydantic import Field
+
+from ..base_dto import BaseDTO, IdStr
+from .user_create_dto import UserCreateInputDTO
+
+
+class UserBulkCreateStatus(StrEnum):
+    CREATED = 'created'
+    CONFLICT = 'conflict'
+    UNAVAILABLE = 'unavailable'
+
+
+class UserBulkCreateInputDTO(BaseDTO):
+    users: List[UserCreateInputDTO] = Field(min_length=1, max_length=10_000)
+
+
+class UserBulkCreateResultDTO(BaseDTO):
+    index: int
+    email: str
+    status: UserBulkCreateStatus
+    id: Optional[IdStr] = None
+
+
+class UserBulkCreateOutputDTO(BaseDTO):
+    created: int
+    conflicts: int
+    unavailable: int = 0
+    results: List[UserBulkCreateResultDTO] = []
@@ -0,0 +1,5 @@
+from ..base_dto import BaseDTO
+
+
+class UserCountOutputDTO(BaseDTO):
+    count: int
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class UserExportFormat(StrEnum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
@@ -1,4 +1,6 @@
-from typing import List
+from typing import List, Optional
+
+from pydantic import Field
 
 from ..base_dto import BaseDTO
 from .user_output_dto import UserOutputDTO
@@ -6,3 +8,6 @@ from .user_output_dto import UserOutputDTO
 
 class UserListOutputDTO(BaseDTO):
     data: List[UserOutputDTO] = []
+    next_cursor: Optional[str] = None
+    # Users collection version, sent as the ETag header
+    version: str = Field(default='', exclude=True)
@@ -1,15 +1,18 @@
-from datetime import datetime
+from pydantic import AwareDatetime, Field
 
 from src.domain.entities.user_role import UserRole
 
-from ..base_dto import BaseDTO
+from ..base_dto import BaseDTO, IdStr
 
 
 class UserOutputDTO(BaseDTO):
-    id: str
+    id: IdStr
     name: str
     email: str
     role: UserRole
     avatar: str
-    created_at: datetime
-    updated_at: datetime
+    # Checked by pydantic-core, entities set naive datetimes to utc
+    created_at: AwareDatetime
+    updated_at: AwareDatetime
+    # Sent as the ETag header, not as part of the body
+    version: int = Field(default=1, exclude=True)
@@ -0,0 +1,33 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from uuid import UUID
+
+from src.domain.exceptions.exceptions import InvalidCursorException
+
+
+def encode_cursor(last_id: UUID | str) -> str:
+    """
+    Encode the id of the last returned item as an opaque cursor.
+
+    :param last_id: Id of the last item of the page.
+
+    :return: The url-safe cursor.
+    """
+    last_id = last_id if isinstance(last_id, UUID) else UUID(str(last_id))
+
+    return urlsafe_b64encode(last_id.bytes).rstrip(b'=').decode()
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Decode an opaque cursor back to the id it points after.
+
+    :param cursor: Cursor returned by a previous page.
+
+    :return: The id of the last item of the previous page.
+    """
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        return str(UUID(bytes=urlsafe_b64decode(cursor + padding)))
+    except (BinasciiError, ValueError):
+        raise InvalidCursorException()
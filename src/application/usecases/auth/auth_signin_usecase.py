@@ -1,3 +1,5 @@
+from typing import Any, Callable
+
 from src.application.dtos.auth.auth_signin_dto import (
     AuthSigninInputDTO,
     AuthSigninOutputDTO,
@@ -5,9 +7,16 @@ from src.application.dtos.auth.auth_signin_dto import (
 from src.application.dtos.security.token_generator_encode_dto import (
     TokenGeneratorEncodeInputDTO,
 )
+from src.domain.entities.user_entity import User
 from src.domain.exceptions.auth_exceptions import InvalidCredentialsException
-from src.domain.exceptions.exceptions import NotFoundException
-from src.domain.repositories.user_repository import UserRepository
+from src.domain.exceptions.exceptions import (
+    NotFoundException,
+    ServiceUnavailableException,
+)
+from src.domain.repositories.user_repository import (
+    UserRepository,
+    UserRepositoryFactory,
+)
 from src.domain.security.password_hasher import PasswordHasher
 from src.domain.security.token_generator import TokenGenerator
 
@@ -18,21 +27,33 @@ class AuthSigninUseCase:
         repository: UserRepository,
         password_hasher: PasswordHasher,
         token_generator: TokenGenerator,
+        repository_factory: UserRepositoryFactory,
     ):
         """
         :param repository: UserRepository instance to interact with user.
         :param password_hasher: PasswordHasher instance to hash user password.
         :param token_genrator: TokenGenerator instance to generate a token.
+        :param repository_factory:
+            UserRepositoryFactory to save the rehashed password on its own
+            session, the rehash may run after the request one is closed.
         """
         self.repository = repository
         self.password_hasher = password_hasher
         self.token_generator = token_generator
+        self.repository_factory = repository_factory
 
-    async def execute(self, data: AuthSigninInputDTO) -> AuthSigninOutputDTO:
+    async def execute(
+        self,
+        data: AuthSigninInputDTO,
+        schedule: Callable[..., Any] | None = None,
+    ) -> AuthSigninOutputDTO:
         """
         Perform signin getting user info.
 
         :param data: The user signin data.
+        :param schedule:
+            Optional callable (func, *args) used to run the password rehash
+            in background. The rehash is awaited inline when not provided.
 
         :return: Found user info.
         """
@@ -48,6 +69,12 @@ class AuthSigninUseCase:
         if not valid_password:
             raise InvalidCredentialsException()
 
+        if self.password_hasher.needs_rehash(user.password):
+            if schedule:
+                schedule(self.rehash_password, user, data.password)
+            else:
+                await self.rehash_password(user, data.password)
+
         token_payload = TokenGeneratorEncodeInputDTO(
             user_id=str(user.id),
             user_role=user.role,
@@ -61,3 +88,30 @@ class AuthSigninUseCase:
             access_token=generated_token.access_token,
             token_type=generated_token.token_type,
         )
+
+    async def rehash_password(self, user: User, password: str) -> None:
+        """
+        Hash the user password again with the current hasher parameters.
+
+        Only the password hash is written, and only if it still is the one
+        read at signin: a concurrent password change wins. The user version
+        is kept, so cached representations (ETags) stay valid.
+
+        :param user: User whose password was just checked.
+        :param password: The user plain text password.
+
+        :return: None.
+        """
+        try:
+            hashed_password = await self.password_hasher.async_hash(password)
+        except ServiceUnavailableException:
+            # Hasher is saturated: keep the old hash, retry on next signin
+            return
+
+        async with self.repository_factory() as repository:
+            await repository.update_password(
+                str(user.id),
+                str(user.company_id),
+                hashed_password,
+                user.password,
+            )
@@ -1,3 +1,5 @@
+import asyncio
+
 from src.application.dtos.auth.auth_signup_dto import AuthSignupInputDTO
 from src.domain.entities.company_entity import Company
 from src.domain.entities.user_entity import User
@@ -36,31 +38,35 @@ class AuthSignupUseCase:
 
         :return: No response.
         """
-        user = await self.user_repo.find_by_email(data.email)
+        # Hash while checking uniqueness: bcrypt runs outside the event loop
+        hash_task = asyncio.ensure_future(
+            self.password_hasher.async_hash(data.password)
+        )
 
-        if user:
-            raise UserAlreadyExistsException()
+        try:
+            if await self.user_repo.find_by_email(data.email):
+                raise UserAlreadyExistsException()
 
-        company = await self.company_repo.find_by_name(data.company_name)
+            if await self.company_repo.find_by_name(data.company_name):
+                raise CompanyAlreadyRegisteredException()
 
-        if company:
-            raise CompanyAlreadyRegisteredException()
+            hashed_password = await hash_task
+        finally:
+            hash_task.cancel()
 
         company = Company(data.company_name)
-        created_company: Company | None = await self.company_repo.create(
-            company
-        )
-
-        if not created_company:
-            raise CannotOperateException()
-
-        hashed_password = await self.password_hasher.async_hash(data.password)
         user = User(
             name=data.name,
             email=data.email,
             password=hashed_password,
             role=UserRole.ADMIN,
-            company_id=created_company.id,
+            company_id=company.id,
+        )
+
+        # Concurrent signups are caught by the unique constraints
+        created_company = await self.company_repo.create_with_admin(
+            company, user
         )
 
-        await self.user_repo.create(user)
+        if not created_company:
+            raise CannotOperateException()
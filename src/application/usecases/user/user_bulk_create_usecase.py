@@ -0,0 +1,173 @@
+import asyncio
+from typing import Awaitable, Callable, List, Set, Tuple
+
+from src.application.dtos.user.user_bulk_create_dto import (
+    UserBulkCreateInputDTO,
+    UserBulkCreateOutputDTO,
+    UserBulkCreateResultDTO,
+    UserBulkCreateStatus,
+)
+from src.application.dtos.user.user_create_dto import UserCreateInputDTO
+from src.domain.entities.user_entity import User
+from src.domain.entities.user_role import UserRole
+from src.domain.exceptions.auth_exceptions import UnauthorizedException
+from src.domain.exceptions.exceptions import ServiceUnavailableException
+from src.domain.repositories.user_repository import UserRepository
+from src.domain.security.password_hasher import PasswordHasher
+
+IndexedUser = Tuple[int, UserCreateInputDTO]
+
+
+class UserBulkCreateUseCase:
+    def __init__(
+        self,
+        repository: UserRepository,
+        password_hasher: PasswordHasher,
+        chunk_size: int = 500,
+        hash_concurrency: int = 4,
+    ):
+        """
+        :param repository: UserRepository instance to interact with user.
+        :param password_hasher: PasswordHasher instance to hash user password.
+        :param chunk_size: Number of users inserted per statement.
+        :param hash_concurrency: Number of passwords hashed at the same time.
+        """
+        self.repository = repository
+        self.password_hasher = password_hasher
+        self.chunk_size = chunk_size
+        self.hash_concurrency = hash_concurrency
+
+    async def execute(
+        self, requester: User, data: UserBulkCreateInputDTO
+    ) -> UserBulkCreateOutputDTO:
+        """
+        Create many users and store them in the repository.
+
+        :param requester: User trying to perform the action (must be an admin).
+        :param data: Users creation data.
+
+        :return:
+            Per-user report telling if it was created, conflicted or left
+            out because the password hasher was unavailable.
+        """
+        if requester.role != UserRole.ADMIN:
+            raise UnauthorizedException()
+
+        results: List[UserBulkCreateResultDTO] = []
+        pending: List[IndexedUser] = []
+        emails: Set[str] = set()
+
+        for index, item in enumerate(data.users):
+            # Repeated emails in the same payload conflict with the first one
+            if item.email in emails:
+                results.append(
+                    UserBulkCreateResultDTO(
+                        index=index,
+                        email=item.email,
+                        status=UserBulkCreateStatus.CONFLICT,
+                    )
+                )
+                continue
+
+            emails.add(item.email)
+            pending.append((index, item))
+
+        semaphore = asyncio.Semaphore(self.hash_concurrency)
+
+        async def hash_password(password: str) -> str:
+            async with semaphore:
+                return await self.password_hasher.async_hash(password)
+
+        for start in range(0, len(pending), self.chunk_size):
+            chunk = pending[start : start + self.chunk_size]
+
+            hashed_passwords = await self._hash_passwords(chunk, hash_password)
+
+            # The hasher is saturated: the chunks already committed are kept,
+            # this one and the following ones are reported
+            if hashed_passwords is None:
+                results.extend(self._unavailable_results(pending[start:]))
+                break
+
+            users = [
+                User(
+                    name=item.name,
+                    email=item.email,
+                    password=hashed_password,
+                    role=item.role,
+                    avatar=item.avatar,
+                    company_id=requester.company_id,
+                )
+                for (_, item), hashed_password in zip(chunk, hashed_passwords)
+            ]
+
+            created_users = await self.repository.create_many(users)
+
+            created_ids = {str(user.id) for user in created_users}
+
+            for (index, item), user in zip(chunk, users):
+                created = str(user.id) in created_ids
+                results.append(
+                    UserBulkCreateResultDTO(
+                        index=index,
+                        email=item.email,
+                        status=(
+                            UserBulkCreateStatus.CREATED
+                            if created
+                            else UserBulkCreateStatus.CONFLICT
+                        ),
+                        id=str(user.id) if created else None,
+                    )
+                )
+
+        results.sort(key=lambda result: result.index)
+        statuses = [result.status for result in results]
+
+        return UserBulkCreateOutputDTO(
+            created=statuses.count(UserBulkCreateStatus.CREATED),
+            conflicts=statuses.count(UserBulkCreateStatus.CONFLICT),
+            unavailable=statuses.count(UserBulkCreateStatus.UNAVAILABLE),
+            results=results,
+        )
+
+    @staticmethod
+    async def _hash_passwords(
+        chunk: List[IndexedUser],
+        hash_password: Callable[[str], Awaitable[str]],
+    ) -> List[str] | None:
+        """
+        Hash the passwords of a chunk, cancelling the rest once one fails.
+
+        :param chunk: Users to hash the passwords of.
+        :param hash_password: Coroutine function hashing one password.
+
+        :return: The hashed passwords, None if the hasher is unavailable.
+        """
+        unavailable = False
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(hash_password(item.password))
+                    for _, item in chunk
+                ]
+        except* ServiceUnavailableException:
+            unavailable = True
+
+        if unavailable:
+            return None
+
+        return [task.result() for task in tasks]
+
+    @staticmethod
+    def _unavailable_results(
+        items: List[IndexedUser],
+    ) -> List[UserBulkCreateResultDTO]:
+        return [
+            UserBulkCreateResultDTO(
+                index=index,
+                email=item.email,
+                status=UserBulkCreateStatus.UNAVAILABLE,
+            )
+            for index, item in items
+        ]
@@ -0,0 +1,28 @@
+from src.application.dtos.user.user_count_dto import UserCountOutputDTO
+from src.domain.entities.user_entity import User
+from src.domain.entities.user_role import UserRole
+from src.domain.exceptions.auth_exceptions import UnauthorizedException
+from src.domain.repositories.user_repository import UserRepository
+
+
+class UserCountUseCase:
+    def __init__(self, repository: UserRepository):
+        """
+        :param repository: UserRepository instance to interact with user.
+        """
+        self.repository = repository
+
+    async def execute(self, requester: User) -> UserCountOutputDTO:
+        """
+        Count the requester company users.
+
+        :param requester: User trying to perform the action (must be an admin).
+
+        :return: The number of company users.
+        """
+        if requester.role != UserRole.ADMIN:
+            raise UnauthorizedException()
+
+        count = await self.repository.count(requester.company_id)
+
+        return UserCountOutputDTO(count=count)
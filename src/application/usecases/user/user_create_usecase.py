@@ -1,3 +1,5 @@
+import asyncio
+
 from src.application.dtos.user.user_create_dto import (
     UserCreateInputDTO,
     UserCreateOutputDTO,
@@ -12,14 +14,21 @@ from src.domain.security.password_hasher import PasswordHasher
 
 class UserCreateUseCase:
     def __init__(
-        self, repository: UserRepository, password_hasher: PasswordHasher
+        self,
+        repository: UserRepository,
+        password_hasher: PasswordHasher,
+        optimistic_insert: bool = True,
     ):
         """
         :param repository: UserRepository instance to interact with user.
         :param password_hasher: PasswordHasher instance to hash user password.
+        :param optimistic_insert:
+            Skip the email lookup and let the repository unique constraint
+            reject existing emails.
         """
         self.repository = repository
         self.password_hasher = password_hasher
+        self.optimistic_insert = optimistic_insert
 
     async def execute(
         self, requester: User, data: UserCreateInputDTO
@@ -35,12 +44,19 @@ class UserCreateUseCase:
         if requester.role != UserRole.ADMIN:
             raise UnauthorizedException()
 
-        user = await self.repository.find_by_email(data.email)
+        # Start hashing right away so it does not wait on the database
+        hash_task = asyncio.ensure_future(
+            self.password_hasher.async_hash(data.password)
+        )
 
-        if user:
-            raise UserAlreadyExistsException()
+        try:
+            if not self.optimistic_insert:
+                if await self.repository.find_by_email(data.email):
+                    raise UserAlreadyExistsException()
 
-        hashed_password = await self.password_hasher.async_hash(data.password)
+            hashed_password = await hash_task
+        finally:
+            hash_task.cancel()
 
         user = User(
             name=data.name,
@@ -24,14 +24,20 @@ class UserDeleteUseCase:
         if requester.role != UserRole.ADMIN:
             raise UnauthorizedException()
 
-        user = await self.repository.find_by_id(user_id, requester.company_id)
-
-        if not user:
-            raise NotFoundException()
-
-        if str(user.id) == str(requester.id):
+        # The own account guard is part of the delete itself, the reason
+        # it failed is only looked up when no user was deleted
+        deleted = await self.repository.delete_by_id(
+            user_id, requester.company_id, excluded_id=requester.id
+        )
+
+        if deleted:
+            return
+
+        if str(user_id) == str(requester.id) and await self.repository.exists(
+            user_id, requester.company_id
+        ):
             raise UnauthorizedException(
                 'You are not allowed to delete your own account'
             )
 
-        await self.repository.delete_by_id(user_id, requester.company_id)
+        raise NotFoundException()
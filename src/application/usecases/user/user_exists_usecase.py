@@ -0,0 +1,23 @@
+from src.domain.entities.user_entity import User
+from src.domain.exceptions.exceptions import NotFoundException
+from src.domain.repositories.user_repository import UserRepository
+
+
+class UserExistsUseCase:
+    def __init__(self, repository: UserRepository):
+        """
+        :param repository: UserRepository instance to interact with user.
+        """
+        self.repository = repository
+
+    async def execute(self, requester: User, user_id: str) -> None:
+        """
+        Check if a user exists based on its id, without loading it.
+
+        :param requester: Must be a user from the same company.
+        :param user_id: Id of user to be checked.
+
+        :return: None.
+        """
+        if not await self.repository.exists(user_id, requester.company_id):
+            raise NotFoundException()
@@ -0,0 +1,71 @@
+import csv
+from io import StringIO
+from typing import AsyncIterator
+
+from src.application.dtos.user.user_export_dto import UserExportFormat
+from src.application.dtos.user.user_output_dto import UserOutputDTO
+from src.domain.entities.user_entity import User
+from src.domain.entities.user_role import UserRole
+from src.domain.exceptions.auth_exceptions import UnauthorizedException
+from src.domain.repositories.user_repository import UserRepository
+
+
+class UserExportUseCase:
+    def __init__(self, repository: UserRepository):
+        """
+        :param repository: UserRepository instance to interact with user.
+        """
+        self.repository = repository
+
+    async def execute(
+        self, requester: User, export_format: UserExportFormat
+    ) -> AsyncIterator[str]:
+        """
+        Export all company users, serializing each one as it is fetched.
+
+        :param requester: User trying to perform the action (must be an admin).
+        :param export_format: Output format (NDJSON or CSV).
+
+        :return: An async iterator over the serialized lines.
+        """
+        if requester.role != UserRole.ADMIN:
+            raise UnauthorizedException()
+
+        users = self.repository.stream_all(str(requester.company_id))
+
+        if export_format == UserExportFormat.CSV:
+            return self._to_csv(users)
+
+        return self._to_ndjson(users)
+
+    @staticmethod
+    async def _to_ndjson(users: AsyncIterator[User]) -> AsyncIterator[str]:
+        async for user in users:
+            yield UserOutputDTO.model_validate(user).model_dump_json() + '\n'
+
+    @staticmethod
+    async def _to_csv(users: AsyncIterator[User]) -> AsyncIterator[str]:
+        buffer = StringIO()
+        writer = csv.DictWriter(
+            buffer,
+            fieldnames=[
+                name
+                for name, field in UserOutputDTO.model_fields.items()
+                if not field.exclude
+            ],
+        )
+
+        def flush() -> str:
+            line = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return line
+
+        writer.writeheader()
+        yield flush()
+
+        async for user in users:
+            writer.writerow(
+                UserOutputDTO.model_validate(user).model_dump(mode='json')
+            )
+            yield flush()
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from src.application.dtos.user.user_get_dto import UserGetOutputDTO
 from src.domain.entities.user_entity import User
 from src.domain.exceptions.exceptions import NotFoundException
@@ -11,18 +13,29 @@ class UserGetUseCase:
         """
         self.repository = repository
 
-    async def execute(self, requester: User, user_id: str) -> UserGetOutputDTO:
+    async def execute(
+        self,
+        requester: User,
+        user_id: str,
+        cached_version: Optional[int] = None,
+    ) -> UserGetOutputDTO | None:
         """
         Get a user based on its id.
 
         :param requester: Must be a user from the same content.
         :param user_id: Id of user to be found.
+        :param cached_version:
+            Version of the user already known by the requester
+            (from If-None-Match).
 
-        :return: Found user info.
+        :return: Found user info, or None if it has the cached version.
         """
         user = await self.repository.find_by_id(user_id, requester.company_id)
 
         if not user:
             raise NotFoundException()
 
+        if user.version == cached_version:
+            return None
+
         return UserGetOutputDTO.model_validate(user)
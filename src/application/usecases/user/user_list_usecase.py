@@ -1,5 +1,8 @@
+from typing import Optional
+
 from src.application.dtos.user.user_list_dto import UserListOutputDTO
 from src.application.dtos.user.user_output_dto import UserOutputDTO
+from src.application.pagination.cursor import decode_cursor, encode_cursor
 from src.domain.entities.user_entity import User
 from src.domain.entities.user_role import UserRole
 from src.domain.exceptions.auth_exceptions import UnauthorizedException
@@ -14,26 +17,59 @@ class UserListUseCase:
         self.repository = repository
 
     async def execute(
-        self, requester: User, limit: int, offset: int
-    ) -> UserListOutputDTO:
+        self,
+        requester: User,
+        limit: int,
+        offset: int,
+        cursor: str | None = None,
+        cached_version: Optional[str] = None,
+    ) -> UserListOutputDTO | None:
         """
         Get the list of users.
 
         :param requester: User trying to perform the action (must be an admin).
         :param limit: Maximum number of users returned.
         :param offset: Number of users ignored in the search.
+        :param cursor:
+            Cursor returned by a previous page. When given, offset is ignored
+            and the page starts right after the cursor.
+        :param cached_version:
+            Version of the users collection already known by the requester
+            (from If-None-Match).
 
-        :return: List of users.
+        :return:
+            List of users and the cursor of the next page, if any.
+            None if the users collection still has the cached version.
         """
         if requester.role != UserRole.ADMIN:
             raise UnauthorizedException()
 
-        users = await self.repository.find_all(
-            requester.company_id, limit, offset
+        # Read before listing, a concurrent change can only make the
+        # returned version older than the page, never newer
+        version = await self.repository.collection_version(
+            requester.company_id
         )
 
+        if version == cached_version:
+            return None
+
+        # Fetch one extra user to know whether there is a next page
+        if cursor:
+            users = await self.repository.find_all_after(
+                requester.company_id, limit + 1, decode_cursor(cursor)
+            )
+        else:
+            users = await self.repository.find_all(
+                requester.company_id, limit + 1, offset
+            )
+
+        has_next = len(users) > limit
+        users = users[:limit]
+
         users_output_dto = UserListOutputDTO(
-            data=list(map(lambda u: UserOutputDTO.model_validate(u), users))
+            data=[UserOutputDTO.model_validate(u) for u in users],
+            next_cursor=encode_cursor(users[-1].id) if has_next else None,
+            version=version,
         )
 
         return users_output_dto
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import Optional
 
 from src.application.dtos.user.user_update_partial_dto import (
     UserUpdatePartialInputDTO,
@@ -7,7 +8,10 @@ from src.application.dtos.user.user_update_partial_dto import (
 from src.domain.entities.user_entity import User
 from src.domain.entities.user_role import UserRole
 from src.domain.exceptions.auth_exceptions import UnauthorizedException
-from src.domain.exceptions.exceptions import NotFoundException
+from src.domain.exceptions.exceptions import (
+    NotFoundException,
+    PreconditionFailedException,
+)
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.security.password_hasher import PasswordHasher
 
@@ -24,7 +28,11 @@ class UserUpdatePartialUseCase:
         self.password_hasher = password_hasher
 
     async def execute(
-        self, requester: User, user_id: str, data: UserUpdatePartialInputDTO
+        self,
+        requester: User,
+        user_id: str,
+        data: UserUpdatePartialInputDTO,
+        version: Optional[int] = None,
     ) -> UserUpdatePartialOutputDTO:
         """
         Update an user info partially based on its id.
@@ -34,9 +42,73 @@ class UserUpdatePartialUseCase:
             (must be an admin or the own user).
         :param user_id: Id of user to update
         :param data: User new data.
+        :param version:
+            Version the user is expected to have (from If-Match), the
+            update is rejected if it was modified in the meantime.
 
         :return: The updated User entity.
         """
+        update_data = data.model_dump(exclude_unset=True)
+
+        if not update_data:
+            return await self._get_user(requester, user_id, version)
+
+        values = {'updated_at': datetime.now(timezone.utc)}
+
+        if data.name:
+            values['name'] = data.name
+
+        if data.password:
+            await self._check_target(requester, user_id, version)
+            values['password'] = await self.password_hasher.async_hash(
+                data.password
+            )
+
+        if data.role:
+            values['role'] = data.role
+
+        if data.avatar is not None:
+            values['avatar'] = data.avatar
+
+        # Permissions are checked again by the update itself, the reason
+        # it failed is only looked up when no user was updated
+        updated_user = await self.repository.update_by_id(
+            user_id,
+            requester.company_id,
+            values,
+            requester_id=(
+                None if requester.role == UserRole.ADMIN else requester.id
+            ),
+            version=version,
+        )
+
+        if not updated_user:
+            if not await self.repository.exists(user_id, requester.company_id):
+                raise NotFoundException()
+
+            if requester.role != UserRole.ADMIN and str(user_id) != str(
+                requester.id
+            ):
+                raise UnauthorizedException(
+                    "You don't have enough permission to perform this action"
+                )
+
+            raise PreconditionFailedException()
+
+        return UserUpdatePartialOutputDTO.model_validate(updated_user)
+
+    async def _get_user(
+        self, requester: User, user_id: str, version: Optional[int]
+    ) -> UserUpdatePartialOutputDTO:
+        """
+        Get the user info when there is nothing to update.
+
+        :param requester: User trying to perform the action.
+        :param user_id: Id of user to get.
+        :param version: Version the user is expected to have.
+
+        :return: The user info.
+        """
         user = await self.repository.find_by_id(user_id, requester.company_id)
 
         if not user:
@@ -49,27 +121,43 @@ class UserUpdatePartialUseCase:
                 "You don't have enough permission to perform this action"
             )
 
-        update_data = data.model_dump(exclude_unset=True)
+        if version is not None and user.version != version:
+            raise PreconditionFailedException()
 
-        if not update_data:
-            return UserUpdatePartialOutputDTO.model_validate(user)
+        return UserUpdatePartialOutputDTO.model_validate(user)
 
-        if data.name:
-            user.name = data.name
+    async def _check_target(
+        self, requester: User, user_id: str, version: Optional[int]
+    ) -> None:
+        """
+        Reject the update before the password is hashed.
 
-        if data.password:
-            hashed_password = await self.password_hasher.async_hash(
-                data.password
+        A non-admin can only update itself. Another user, or any user
+        when a version is expected, is checked with a SELECT 1 so a
+        missing or modified user does not cost a hash.
+
+        :param requester: User trying to perform the action.
+        :param user_id: Id of user to update.
+        :param version: Version the user is expected to have.
+        """
+        is_own_user = str(user_id) == str(requester.id)
+
+        if not is_own_user and requester.role != UserRole.ADMIN:
+            raise UnauthorizedException(
+                "You don't have enough permission to perform this action"
             )
-            user.password = hashed_password
 
-        if data.role:
-            user.role = data.role
+        if is_own_user and version is None:
+            return
 
-        if data.avatar is not None:
-            user.avatar = data.avatar
+        company_id = requester.company_id
 
-        user.updated_at = datetime.now(timezone.utc)
+        if await self.repository.exists(user_id, company_id, version):
+            return
 
-        updated_user: User = await self.repository.update(user)
-        return UserUpdatePartialOutputDTO.model_validate(updated_user)
+        if version is not None and await self.repository.exists(
+            user_id, company_id
+        ):
+            raise PreconditionFailedException()
+
+        raise NotFoundException()
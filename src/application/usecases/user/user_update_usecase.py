@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import Optional
 
 from src.application.dtos.user.user_update_dto import (
     UserUpdateInputDTO,
@@ -7,7 +8,10 @@ from src.application.dtos.user.user_update_dto import (
 from src.domain.entities.user_entity import User
 from src.domain.entities.user_role import UserRole
 from src.domain.exceptions.auth_exceptions import UnauthorizedException
-from src.domain.exceptions.exceptions import NotFoundException
+from src.domain.exceptions.exceptions import (
+    NotFoundException,
+    PreconditionFailedException,
+)
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.security.password_hasher import PasswordHasher
 
@@ -24,7 +28,11 @@ class UserUpdateUseCase:
         self.password_hasher = password_hasher
 
     async def execute(
-        self, requester: User, user_id: str, data: UserUpdateInputDTO
+        self,
+        requester: User,
+        user_id: str,
+        data: UserUpdateInputDTO,
+        version: Optional[int] = None,
     ) -> UserUpdateOutputDTO:
         """
         Update an user info based on its id.
@@ -34,28 +42,81 @@ class UserUpdateUseCase:
             (must be an admin or the own user).
         :param user_id: Id of user to update
         :param data: User new data.
+        :param version:
+            Version the user is expected to have (from If-Match), the
+            update is rejected if it was modified in the meantime.
 
         :return: The updated User entity.
         """
-        user = await self.repository.find_by_id(user_id, requester.company_id)
+        await self._check_target(requester, user_id, version)
 
-        if not user:
-            raise NotFoundException()
+        hashed_password = await self.password_hasher.async_hash(data.password)
 
-        if requester.role != UserRole.ADMIN and str(user.id) != str(
-            requester.id
-        ):
+        # Permissions are checked again by the update itself, the reason
+        # it failed is only looked up when no user was updated
+        updated_user = await self.repository.update_by_id(
+            user_id,
+            requester.company_id,
+            {
+                'name': data.name,
+                'password': hashed_password,
+                'role': data.role,
+                'avatar': data.avatar,
+                'updated_at': datetime.now(timezone.utc),
+            },
+            requester_id=(
+                None if requester.role == UserRole.ADMIN else requester.id
+            ),
+            version=version,
+        )
+
+        if not updated_user:
+            if not await self.repository.exists(user_id, requester.company_id):
+                raise NotFoundException()
+
+            if requester.role != UserRole.ADMIN and str(user_id) != str(
+                requester.id
+            ):
+                raise UnauthorizedException(
+                    "You don't have enough permission to perform this action"
+                )
+
+            raise PreconditionFailedException()
+
+        return UserUpdateOutputDTO.model_validate(updated_user)
+
+    async def _check_target(
+        self, requester: User, user_id: str, version: Optional[int]
+    ) -> None:
+        """
+        Reject the update before the password is hashed.
+
+        A non-admin can only update itself. Another user, or any user
+        when a version is expected, is checked with a SELECT 1 so a
+        missing or modified user does not cost a hash.
+
+        :param requester: User trying to perform the action.
+        :param user_id: Id of user to update.
+        :param version: Version the user is expected to have.
+        """
+        is_own_user = str(user_id) == str(requester.id)
+
+        if not is_own_user and requester.role != UserRole.ADMIN:
             raise UnauthorizedException(
                 "You don't have enough permission to perform this action"
             )
 
-        hashed_password = await self.password_hasher.async_hash(data.password)
+        if is_own_user and version is None:
+            return
 
-        user.name = data.name
-        user.password = hashed_password
-        user.role = data.role
-        user.avatar = data.avatar
-        user.updated_at = datetime.now(timezone.utc)
+        company_id = requester.company_id
 
-        updated_user: User = await self.repository.update(user)
-        return UserUpdateOutputDTO.model_validate(updated_user)
+        if await self.repository.exists(user_id, company_id, version):
+            return
+
+        if version is not None and await self.repository.exists(
+            user_id, company_id
+        ):
+            raise PreconditionFailedException()
+
+        raise NotFoundException()
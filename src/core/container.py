@@ -1,29 +1,50 @@
 from collections.abc import AsyncGenerator
 
-from fastapi import Depends
+from fastapi import Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 
 from src.application.usecases.auth.auth_signin_usecase import AuthSigninUseCase
 from src.application.usecases.auth.auth_signup_usecase import AuthSignupUseCase
+from src.application.usecases.user.user_bulk_create_usecase import (
+    UserBulkCreateUseCase,
+)
+from src.application.usecases.user.user_count_usecase import UserCountUseCase
 from src.application.usecases.user.user_create_usecase import UserCreateUseCase
 from src.application.usecases.user.user_delete_usecase import UserDeleteUseCase
+from src.application.usecases.user.user_exists_usecase import (
+    UserExistsUseCase,
+)
+from src.application.usecases.user.user_export_usecase import (
+    UserExportUseCase,
+)
 from src.application.usecases.user.user_get_usecase import UserGetUseCase
 from src.application.usecases.user.user_list_usecase import UserListUseCase
 from src.application.usecases.user.user_update_partial_usecase import (
     UserUpdatePartialUseCase,
 )
 from src.application.usecases.user.user_update_usecase import UserUpdateUseCase
+from src.core.settings import settings
 from src.domain.entities.user_entity import User
 from src.domain.repositories.company_repository import CompanyRepository
-from src.domain.repositories.user_repository import UserRepository
+from src.domain.repositories.user_repository import (
+    UserRepository,
+    UserRepositoryFactory,
+)
 from src.domain.security.password_hasher import PasswordHasher
 from src.domain.security.token_generator import TokenGenerator
-from src.infrastructure.db.session import get_db
+from src.infrastructure.cache.requester_cache import (
+    RequesterCacheKey,
+    requester_cache,
+)
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.db.session import get_db, get_session_factory
 from src.infrastructure.repositories.company_repository_sqlalchemy import (
     CompanyRepositorySQLAlchemy,
 )
 from src.infrastructure.repositories.user_repository_sqlalchemy import (
     UserRepositorySQLAlchemy,
+    user_repository_factory,
 )
 from src.infrastructure.security.password_hasher_bcrypt import (
     PasswordHasherBcrypt,
@@ -31,6 +52,9 @@ from src.infrastructure.security.password_hasher_bcrypt import (
 from src.infrastructure.security.token_generator_pyjwt import (
     TokenGeneratorPyJWT,
 )
+from src.presentation.api.v1.security.internal_token_handler import (
+    verify_internal_token,
+)
 from src.presentation.api.v1.security.token_handler import (
     get_requester_from_token,
     oauth2_scheme,
@@ -50,6 +74,20 @@ def get_user_repository(
     return UserRepositorySQLAlchemy(session=db)
 
 
+def get_user_repository_factory(
+    session_factory: sessionmaker = Depends(get_session_factory),
+) -> UserRepositoryFactory:
+    """
+    Dependency to get a factory of UserRepository instances, each on its
+    own session.
+
+    :param session_factory: Session factory dependency.
+
+    :return: A UserRepositoryFactory.
+    """
+    return user_repository_factory(session_factory)
+
+
 def get_company_repository(
     db: AsyncGenerator[AsyncSession, None] = Depends(get_db),
 ) -> CompanyRepository:
@@ -81,6 +119,15 @@ def get_token_generator() -> TokenGenerator:
     return TokenGeneratorPyJWT()
 
 
+def get_requester_cache() -> TTLCache[RequesterCacheKey, User]:
+    """
+    Dependency to get the verified requesters cache.
+
+    :return: The shared requesters cache instance.
+    """
+    return requester_cache
+
+
 def get_auth_signup_use_case(
     user_repository: UserRepository = Depends(get_user_repository),
     company_repository: CompanyRepository = Depends(get_company_repository),
@@ -104,6 +151,9 @@ def get_auth_signin_use_case(
     repository: UserRepository = Depends(get_user_repository),
     password_hasher: PasswordHasher = Depends(get_password_hasher),
     token_generator: TokenGenerator = Depends(get_token_generator),
+    repository_factory: UserRepositoryFactory = Depends(
+        get_user_repository_factory
+    ),
 ) -> AuthSigninUseCase:
     """
     Dependency to get an AuthSigninUseCase instance.
@@ -111,10 +161,13 @@ def get_auth_signin_use_case(
     :param repository: UserRepository dependency.
     :param password_hasher: PasswordHasher dependency.
     :param token_generator: TokenGenerator dependency.
+    :param repository_factory: UserRepositoryFactory dependency.
 
     :return: An instance of AuthSigninUseCase.
     """
-    return AuthSigninUseCase(repository, password_hasher, token_generator)
+    return AuthSigninUseCase(
+        repository, password_hasher, token_generator, repository_factory
+    )
 
 
 def get_user_create_use_case(
@@ -129,7 +182,31 @@ def get_user_create_use_case(
 
     :return: An instance of UserCreateUseCase.
     """
-    return UserCreateUseCase(repository, password_hasher)
+    return UserCreateUseCase(
+        repository,
+        password_hasher,
+        optimistic_insert=settings.USER_CREATE_OPTIMISTIC_INSERT,
+    )
+
+
+def get_user_bulk_create_use_case(
+    repository: UserRepository = Depends(get_user_repository),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
+) -> UserBulkCreateUseCase:
+    """
+    Dependency to get a UserBulkCreateUseCase instance.
+
+    :param repository: UserRepository dependency.
+    :param password_hasher: PasswordHasher dependency.
+
+    :return: An instance of UserBulkCreateUseCase.
+    """
+    return UserBulkCreateUseCase(
+        repository,
+        password_hasher,
+        chunk_size=settings.USER_BULK_CREATE_CHUNK_SIZE,
+        hash_concurrency=settings.PASSWORD_HASHER_MAX_WORKERS,
+    )
 
 
 def get_user_get_use_case(
@@ -145,6 +222,32 @@ def get_user_get_use_case(
     return UserGetUseCase(repository)
 
 
+def get_user_exists_use_case(
+    repository: UserRepository = Depends(get_user_repository),
+) -> UserExistsUseCase:
+    """
+    Dependency to get a UserExistsUseCase instance.
+
+    :param repository: UserRepository dependency.
+
+    :return: An instance of UserExistsUseCase.
+    """
+    return UserExistsUseCase(repository)
+
+
+def get_user_count_use_case(
+    repository: UserRepository = Depends(get_user_repository),
+) -> UserCountUseCase:
+    """
+    Dependency to get a UserCountUseCase instance.
+
+    :param repository: UserRepository dependency.
+
+    :return: An instance of UserCountUseCase.
+    """
+    return UserCountUseCase(repository)
+
+
 def get_user_list_use_case(
     repository: UserRepository = Depends(get_user_repository),
 ) -> UserListUseCase:
@@ -158,6 +261,19 @@ def get_user_list_use_case(
     return UserListUseCase(repository)
 
 
+def get_user_export_use_case(
+    repository: UserRepository = Depends(get_user_repository),
+) -> UserExportUseCase:
+    """
+    Dependency to get a UserExportUseCase instance.
+
+    :param repository: UserRepository dependency.
+
+    :return: An instance of UserExportUseCase.
+    """
+    return UserExportUseCase(repository)
+
+
 def get_user_delete_use_case(
     repository: UserRepository = Depends(get_user_repository),
 ) -> UserDeleteUseCase:
@@ -205,6 +321,7 @@ async def get_requester_from_token_handler(
     token: str = Depends(oauth2_scheme),
     token_generator: TokenGenerator = Depends(get_token_generator),
     user_repository: UserRepository = Depends(get_user_repository),
+    cache: TTLCache[RequesterCacheKey, User] = Depends(get_requester_cache),
 ) -> User | None:
     """
     Dependency to get requester (logged user) based on the token helper.
@@ -212,20 +329,39 @@ async def get_requester_from_token_handler(
     :param token: JWT token extracted from the request header.
     :param token_generator: TokenGenerator dependency.
     :param user_repository: UserRepository dependency.
+    :param cache: Verified requesters cache dependency.
 
     :return: The requester (logged user).
     """
     return await get_requester_from_token(
-        token, token_generator, user_repository
+        token, token_generator, user_repository, cache
     )
 
 
+def verify_internal_token_handler(
+    authorization: str | None = Header(None),
+) -> None:
+    """
+    Dependency to restrict an operational endpoint to the internal token.
+
+    :param authorization: Authorization header of the request.
+
+    :return: None.
+    """
+    verify_internal_token(authorization, settings.INTERNAL_API_TOKEN)
+
+
 AuthSignupUseCaseDep = Depends(get_auth_signup_use_case)
 AuthSigninUseCaseDep = Depends(get_auth_signin_use_case)
 UserCreateUseCaseDep = Depends(get_user_create_use_case)
+UserBulkCreateUseCaseDep = Depends(get_user_bulk_create_use_case)
 UserGetUseCaseDep = Depends(get_user_get_use_case)
+UserExistsUseCaseDep = Depends(get_user_exists_use_case)
+UserCountUseCaseDep = Depends(get_user_count_use_case)
 UserListUseCaseDep = Depends(get_user_list_use_case)
+UserExportUseCaseDep = Depends(get_user_export_use_case)
 UserDeleteUseCaseDep = Depends(get_user_delete_use_case)
 UserUpdateUseCaseDep = Depends(get_user_update_use_case)
 UserUpdatePartialUseCaseDep = Depends(get_user_update_partial_use_case)
 GetRequesterFromTokenDep = Depends(get_requester_from_token_handler)
+InternalTokenDep = Depends(verify_internal_token_handler)
@@ -1,3 +1,5 @@
+import os
+
 from dotenv import load_dotenv
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -11,6 +13,20 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str = Field(..., env='DATABASE_URL')
+    DATABASE_POOL_SIZE: int = Field(default=5, env='DATABASE_POOL_SIZE')
+    DATABASE_MAX_OVERFLOW: int = Field(default=10, env='DATABASE_MAX_OVERFLOW')
+    DATABASE_POOL_TIMEOUT: float = Field(
+        default=30, env='DATABASE_POOL_TIMEOUT'
+    )
+    DATABASE_POOL_RECYCLE: int = Field(
+        default=1800, env='DATABASE_POOL_RECYCLE'
+    )
+    DATABASE_POOL_PRE_PING: bool = Field(
+        default=True, env='DATABASE_POOL_PRE_PING'
+    )
+    DATABASE_STATEMENT_CACHE_SIZE: int = Field(
+        default=100, env='DATABASE_STATEMENT_CACHE_SIZE'
+    )
     DEBUG: bool = Field(default=False, env='DEBUG')
     APP_NAME: str = Field(default='SuperTodo', env='APP_NAME')
     ACCESS_TOKEN_TYPE: str = Field(default='Bearer', env='ACCESS_TOKEN_TYPE')
@@ -21,6 +37,37 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(
         default=30, env='ACCESS_TOKEN_EXPIRE_MINUTES'
     )
+    DECODED_TOKEN_CACHE_MAX_SIZE: int = Field(
+        default=4096, env='DECODED_TOKEN_CACHE_MAX_SIZE'
+    )
+    PASSWORD_HASHER_ROUNDS: int = Field(
+        default=10, env='PASSWORD_HASHER_ROUNDS'
+    )
+    PASSWORD_HASHER_MAX_WORKERS: int = Field(
+        default=os.cpu_count() or 1, env='PASSWORD_HASHER_MAX_WORKERS'
+    )
+    PASSWORD_HASHER_MAX_QUEUE_SIZE: int = Field(
+        default=64, env='PASSWORD_HASHER_MAX_QUEUE_SIZE'
+    )
+    USER_CREATE_OPTIMISTIC_INSERT: bool = Field(
+        default=True, env='USER_CREATE_OPTIMISTIC_INSERT'
+    )
+    USER_BULK_CREATE_CHUNK_SIZE: int = Field(
+        default=500, env='USER_BULK_CREATE_CHUNK_SIZE'
+    )
+    # Invalidation is per process: a deleted or demoted user keeps its
+    # cached access on the other workers for up to this many seconds
+    REQUESTER_CACHE_TTL_SECONDS: float = Field(
+        default=5, env='REQUESTER_CACHE_TTL_SECONDS'
+    )
+    REQUESTER_CACHE_MAX_SIZE: int = Field(
+        default=1024, env='REQUESTER_CACHE_MAX_SIZE'
+    )
+    # Bearer token required by the operational endpoints (metrics and
+    # health), they answer 404 while it is unset
+    INTERNAL_API_TOKEN: str | None = Field(
+        default=None, env='INTERNAL_API_TOKEN'
+    )
 
     @field_validator('DATABASE_URL')
     @classmethod
@@ -31,5 +78,12 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator('PASSWORD_HASHER_ROUNDS')
+    @classmethod
+    def validate_password_hasher_rounds(cls, v: int) -> int:
+        if not 4 <= v <= 31:  # noqa: PLR2004
+            raise ValueError('PASSWORD_HASHER_ROUNDS must be between 4 and 31')
+        return v
+
 
 settings = Settings()
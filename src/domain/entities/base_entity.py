@@ -1,12 +1,25 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import ClassVar, Tuple, get_type_hints
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseEntity:
+    # Names of the datetime fields, resolved once per entity class
+    _datetime_fields: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls):
+        # No zero-argument super() here: slots=True recreates the class
+        cls._datetime_fields = tuple(
+            attr
+            for attr, hint in get_type_hints(cls).items()
+            if hint is datetime
+        )
+
     def __post_init__(self):
-        for attr, value in vars(self).items():
-            # Set all datetime properties timezone to utc
-            if isinstance(value, datetime):
-                if value.tzinfo is None:
-                    setattr(self, attr, value.replace(tzinfo=timezone.utc))
+        # Set all datetime properties timezone to utc
+        for attr in self._datetime_fields:
+            value = getattr(self, attr)
+
+            if isinstance(value, datetime) and value.tzinfo is None:
+                setattr(self, attr, value.replace(tzinfo=timezone.utc))
@@ -9,11 +9,12 @@ from .base_entity import BaseEntity
 from .company_type import CompanyType
 
 
-@dataclass
+@dataclass(slots=True)
 class Company(BaseEntity):
     name: str
     type: Optional[CompanyType] = CompanyType.BASIC
     max_users: Optional[int] = 3
+    users_count: int = 0
     id: Optional[UUID | str | int | bytes] = field(default_factory=uuid7)
     created_at: datetime = field(
         default_factory=lambda: datetime.now(timezone.utc)
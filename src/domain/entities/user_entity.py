@@ -9,7 +9,7 @@ from .base_entity import BaseEntity
 from .user_role import UserRole
 
 
-@dataclass
+@dataclass(slots=True)
 class User(BaseEntity):
     name: str
     email: str
@@ -24,3 +24,4 @@ class User(BaseEntity):
     updated_at: datetime = field(
         default_factory=lambda: datetime.now(timezone.utc)
     )
+    version: int = 1
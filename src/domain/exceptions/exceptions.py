@@ -18,3 +18,30 @@ class CannotOperateException(DomainException):
 
     def __init__(self):
         super().__init__(self.message)
+
+
+class ServiceUnavailableException(DomainException):
+    """Raised when a resource is saturated and cannot take more work."""
+
+    message = 'Service unavailable: Try again later'
+
+    def __init__(self):
+        super().__init__(self.message)
+
+
+class PreconditionFailedException(DomainException):
+    """Raised when a resource no longer matches the version expected."""
+
+    message = 'Precondition failed: The resource was modified'
+
+    def __init__(self):
+        super().__init__(self.message)
+
+
+class InvalidCursorException(DomainException):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    message = 'Invalid cursor'
+
+    def __init__(self):
+        super().__init__(self.message)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from src.domain.entities.company_entity import Company
+from src.domain.entities.user_entity import User
 
 
 class CompanyRepository(ABC):
@@ -15,6 +16,20 @@ class CompanyRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_with_admin(
+        self, company: Company, admin: User
+    ) -> Company | None:
+        """
+        Create a new company and its admin user in a single transaction.
+
+        :param company: Company entity to create.
+        :param admin: Admin User entity to create along with the company.
+
+        :return: The created Company entity or None otherwise.
+        """
+        pass
+
     @abstractmethod
     async def find_by_name(self, name: str) -> Company | None:
         """
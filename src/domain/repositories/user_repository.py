@@ -1,5 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
 
 from src.domain.entities.user_entity import User
 
@@ -16,6 +24,17 @@ class UserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_many(self, users: List[User]) -> List[User]:
+        """
+        Create many users at once, skipping the ones whose email exists.
+
+        :param users: User entities to create.
+
+        :return: The created User entities (existing emails are left out).
+        """
+        pass
+
     @abstractmethod
     async def find_by_email(self, email: str) -> User | None:
         """
@@ -39,6 +58,46 @@ class UserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def exists(
+        self, user_id: str, company_id: str, version: Optional[int] = None
+    ) -> bool:
+        """
+        Check if a user exists without loading it.
+
+        :param user_id: Serch id.
+        :param company_id: Id of the company the user belongs to.
+        :param version: Version the user must have, if given.
+
+        :return: True if the user exists and False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def count(self, company_id: str) -> int:
+        """
+        Count company users without loading them.
+
+        :param company_id: The company id to filter users.
+
+        :return: The number of company users.
+        """
+        pass
+
+    @abstractmethod
+    async def collection_version(self, company_id: str) -> str:
+        """
+        Get the version of the company users collection.
+
+        The version changes whenever a company user is created, updated
+        or deleted.
+
+        :param company_id: The company id.
+
+        :return: The current version, an opaque string.
+        """
+        pass
+
     @abstractmethod
     async def find_all(
         self, company_id: str, limit: int, offset: int
@@ -55,24 +114,101 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    async def delete_by_id(self, user_id: str, company_id: str) -> None:
+    async def find_all_after(
+        self, company_id: str, limit: int, after: str | None
+    ) -> List[User]:
+        """
+        Find company users ordered by id, starting after a given id.
+
+        :param company_id: The company id to filter users.
+        :param limit: Maximum number of users returned.
+        :param after: Id of the last user of the previous page, if any.
+
+        :return: The list of found users.
+        """
+        pass
+
+    @abstractmethod
+    def stream_all(self, company_id: str) -> AsyncIterator[User]:
+        """
+        Stream all company users ordered by id, without loading them at once.
+
+        :param company_id: The company id to filter users.
+
+        :return: An async iterator over the company users.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_by_id(
+        self,
+        user_id: str,
+        company_id: str,
+        excluded_id: Optional[str] = None,
+    ) -> bool:
         """
         Delete a user baed on its id.
 
         :param user_id: Serch id.
         :param company_id: Id of the company the user belongs to.
+        :param excluded_id:
+            When given, the user is only deleted if it is not this one
+            (admins can not delete their own account).
 
-        :return: None.
+        :return: True if a user was deleted, False otherwise.
         """
         pass
 
     @abstractmethod
-    async def update(self, user: User) -> User:
+    async def update_password(
+        self,
+        user_id: str,
+        company_id: str,
+        password: str,
+        current_password: str,
+    ) -> bool:
         """
-        Update a user baed on its id.
+        Replace a user password hash, only if it is still the current one.
 
-        :param user: User entity to update.
+        Nothing else is written: the user version is kept.
 
-        :return: The updated User entity.
+        :param user_id: Id of the user to update.
+        :param company_id: Id of the company the user belongs to.
+        :param password: New password hash.
+        :param current_password: Password hash the user must still have.
+
+        :return: True if the password was replaced and False otherwise.
         """
         pass
+
+    @abstractmethod
+    async def update_by_id(
+        self,
+        user_id: str,
+        company_id: str,
+        values: Dict[str, Any],
+        requester_id: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> User | None:
+        """
+        Update a user based on its id, checking the permissions in the
+        same statement.
+
+        :param user_id: Id of the user to update.
+        :param company_id: Id of the company the user belongs to.
+        :param values: New values by user field name.
+        :param requester_id:
+            When given, the user is only updated if it is the requester
+            (users that are not admins can only update themselves).
+        :param version:
+            When given, the user is only updated if it still has this
+            version. The version is bumped by every update.
+
+        :return: The updated User entity, or None if no user matched.
+        """
+        pass
+
+
+# Opens a UserRepository on its own session, for work running after the
+# request session is closed (e.g. background tasks)
+UserRepositoryFactory = Callable[[], AsyncContextManager[UserRepository]]
@@ -24,3 +24,14 @@ class PasswordHasher(ABC):
         :return: True if passowrd are equal and False otherwise.
         """
         pass
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Check if hashed_password was generated with outdated parameters.
+
+        :param hashed_password: The hashed password.
+
+        :return: True if the password should be hashed again.
+        """
+        pass
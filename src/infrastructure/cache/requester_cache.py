@@ -0,0 +1,30 @@
+from typing import Tuple
+
+from src.core.settings import settings
+from src.domain.entities.user_entity import User
+
+from .ttl_cache import TTLCache
+
+RequesterCacheKey = Tuple[str, str]
+
+# Verified requesters keyed by (user_id, company_id) from the decoded token.
+# The cache lives in each worker process: writes invalidate the entry only
+# in the worker that ran them, the others serve it (role included) until
+# the TTL expires, so the TTL is the window a deleted or demoted user keeps
+# its access there.
+requester_cache: TTLCache[RequesterCacheKey, User] = TTLCache(
+    maxsize=settings.REQUESTER_CACHE_MAX_SIZE,
+    ttl=settings.REQUESTER_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_requester(user_id: str, company_id: str) -> None:
+    """
+    Remove a requester from the cache of the current process.
+
+    :param user_id: Id of the cached user.
+    :param company_id: Id of the company the user belongs to.
+
+    :return: None.
+    """
+    requester_cache.delete((str(user_id), str(company_id)))
@@ -0,0 +1,16 @@
+from typing import Tuple
+
+from src.application.dtos.security.token_generator_decode_dto import (
+    TokenGeneratorDecodeOutputDTO,
+)
+from src.core.settings import settings
+
+from .ttl_cache import TTLCache
+
+# Decoded access tokens keyed by the token digest, stored with their `exp`
+decoded_token_cache: TTLCache[
+    bytes, Tuple[float, TokenGeneratorDecodeOutputDTO]
+] = TTLCache(
+    maxsize=settings.DECODED_TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
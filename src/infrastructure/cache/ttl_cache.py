@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class TTLCache(Generic[K, V]):
+    """
+    In-process cache with per-entry expiration and LRU eviction.
+
+    Entries expire after `ttl` seconds (or the ttl given on `set`) and the
+    least recently used entry is evicted once `maxsize` is reached.
+    A `maxsize` or `ttl` lower than or equal to 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        :param maxsize: Maximum number of entries kept in the cache.
+        :param ttl: Default number of seconds an entry stays valid.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get a cached value.
+
+        :param key: Cache key.
+
+        :return: The cached value if found and not expired, None otherwise.
+        """
+        entry = self._data.get(key)
+
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store a value in the cache.
+
+        :param key: Cache key.
+        :param value: Value to be cached.
+        :param ttl: Seconds the entry stays valid (defaults to cache ttl).
+
+        :return: None.
+        """
+        ttl = self.ttl if ttl is None else ttl
+
+        if not self.enabled or ttl <= 0:
+            return
+
+        self._data[key] = (monotonic() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """
+        Remove an entry from the cache, if present.
+
+        :param key: Cache key.
+
+        :return: None.
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+
+        :return: None.
+        """
+        self._data.clear()
@@ -17,6 +17,11 @@ class CompanyModel(Base):
         Enum(CompanyType), nullable=False
     )
     max_users: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Kept in sync with the users table in the same transaction as each
+    # user insert/delete, so the users count does not need a COUNT
+    users_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default='0'
+    )
     created_at: Mapped[DateTime] = mapped_column(
         DateTime(timezone=True),
         default=datetime.now(timezone.utc),
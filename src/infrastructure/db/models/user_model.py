@@ -1,6 +1,14 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Uuid
+from sqlalchemy import (
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Uuid,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.domain.entities.user_role import UserRole
@@ -10,6 +18,10 @@ from ..session import Base
 
 class UserModel(Base):
     __tablename__ = 'users'
+    __table_args__ = (
+        # Tenant-scoped lookups and listings ordered by id
+        Index('ix_users_company_id_id', 'company_id', 'id'),
+    )
 
     id: Mapped[str] = mapped_column(Uuid, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
@@ -32,3 +44,7 @@ class UserModel(Base):
         default=datetime.now(timezone.utc),
         nullable=False,
     )
+    # Bumped on every update, used for optimistic concurrency control
+    version: Mapped[int] = mapped_column(
+        Integer, default=1, server_default='1', nullable=False
+    )
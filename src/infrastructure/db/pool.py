@@ -0,0 +1,73 @@
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+@dataclass
+class PoolWaitStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record(self, wait: float) -> None:
+        """
+        Record the time spent waiting for a connection.
+
+        :param wait: Seconds spent in the checkout.
+
+        :return: None.
+        """
+        self.checkouts += 1
+        self.wait_seconds_total += wait
+        self.wait_seconds_max = max(self.wait_seconds_max, wait)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording how long checkouts wait."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        started_at = perf_counter()
+
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+
+        self.wait_stats.record(perf_counter() - started_at)
+
+        return connection
+
+
+def get_pool_status(engine: AsyncEngine) -> Dict[str, Any]:
+    """
+    Get a snapshot of the engine connection pool usage.
+
+    :param engine: The engine owning the pool.
+
+    :return: Pool class, connections usage and checkout wait stats.
+    """
+    pool = engine.pool
+    status: Dict[str, Any] = {'pool': type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        status.update(asdict(pool.wait_stats))
+
+    return status
@@ -1,12 +1,89 @@
 from collections.abc import AsyncGenerator
+from time import perf_counter
+from typing import Any, Dict
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from src.core.settings import settings
+from src.infrastructure.metrics.request_metrics import record_sql
+
+from .pool import InstrumentedAsyncQueuePool
+
+
+def get_engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Get the engine options for a database url.
+
+    Pool options are only applied to PostgreSQL, SQLite keeps the
+    SQLAlchemy defaults (in-memory databases cannot use a queue pool).
+
+    :param database_url: The database connection url.
+
+    :return: Keyword arguments for create_async_engine.
+    """
+    options: Dict[str, Any] = {'echo': settings.DEBUG}
+
+    if not database_url.startswith('postgresql'):
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    )
+
+    if database_url.startswith('postgresql+asyncpg'):
+        options['connect_args'] = {
+            'statement_cache_size': settings.DATABASE_STATEMENT_CACHE_SIZE,
+            'prepared_statement_cache_size': (
+                settings.DATABASE_STATEMENT_CACHE_SIZE
+            ),
+        }
+
+    return options
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Record the count and duration of the SQL statements run by an engine
+    into the timings of the current request.
+
+    :param engine: The engine to instrument.
+
+    :return: None.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, *args):
+        conn.info.setdefault('query_started_at', []).append(perf_counter())
+
+    @event.listens_for(sync_engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, *args):
+        record_sql(perf_counter() - conn.info['query_started_at'].pop())
+
+    @event.listens_for(sync_engine, 'handle_error')
+    def handle_error(context):
+        started_at = context.connection.info.get('query_started_at')
+
+        if started_at:
+            record_sql(perf_counter() - started_at.pop())
+
 
 # Async engine
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+engine = create_async_engine(
+    settings.DATABASE_URL, **get_engine_options(settings.DATABASE_URL)
+)
+instrument_engine(engine)
 
 # Async session factory
 AsyncSessionLocal = sessionmaker(
@@ -21,6 +98,16 @@ class Base(DeclarativeBase):
     pass
 
 
+def get_session_factory() -> sessionmaker:
+    """
+    Get the session factory, for work running after the request session
+    is closed (e.g. background tasks).
+
+    :return: The session factory.
+    """
+    return AsyncSessionLocal
+
+
 # Dependency to yield a session per request
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
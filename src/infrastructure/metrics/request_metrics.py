@@ -0,0 +1,208 @@
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Upper bounds, in seconds, of the request duration histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@dataclass
+class RequestTimings:
+    """Work done on behalf of the current request."""
+
+    sql_statements: int = 0
+    db_seconds: float = 0.0
+    hash_seconds: float = 0.0
+
+    def server_timing(self, total_seconds: float) -> str:
+        """
+        Format the timings as a Server-Timing header value.
+
+        :param total_seconds: Seconds spent handling the request so far.
+
+        :return: The header value, with durations in milliseconds.
+        """
+        return (
+            f'app;dur={total_seconds * 1000:.2f}, '
+            f'db;dur={self.db_seconds * 1000:.2f};'
+            f'desc="{self.sql_statements} queries", '
+            f'hash;dur={self.hash_seconds * 1000:.2f}'
+        )
+
+
+# Timings of the request being handled, set by the metrics middleware
+current_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    'current_request_timings', default=None
+)
+
+
+def record_sql(duration: float) -> None:
+    """
+    Add an executed SQL statement to the current request timings.
+
+    :param duration: Seconds the statement took.
+
+    :return: None.
+    """
+    timings = current_request_timings.get()
+
+    if timings is not None:
+        timings.sql_statements += 1
+        timings.db_seconds += duration
+
+
+def record_hash(duration: float) -> None:
+    """
+    Add a password hash or check to the current request timings.
+
+    :param duration: Seconds the hasher took, including queue wait.
+
+    :return: None.
+    """
+    timings = current_request_timings.get()
+
+    if timings is not None:
+        timings.hash_seconds += duration
+
+
+@dataclass
+class HandlerMetrics:
+    requests: int = 0
+    request_seconds_total: float = 0.0
+    sql_statements_total: int = 0
+    db_seconds_total: float = 0.0
+    hash_seconds_total: float = 0.0
+    buckets: List[int] = field(
+        default_factory=lambda: [0] * len(LATENCY_BUCKETS)
+    )
+
+
+MetricsKey = Tuple[str, str, int]
+
+# Per-request counters exposed by name, with the HandlerMetrics attribute
+COUNTERS = (
+    ('http_request_sql_statements_total', 'sql_statements_total'),
+    ('http_request_db_seconds_total', 'db_seconds_total'),
+    ('http_request_password_hasher_seconds_total', 'hash_seconds_total'),
+)
+
+
+class RequestMetrics:
+    """In-process request metrics, aggregated per method/handler/status."""
+
+    def __init__(self):
+        self._handlers: Dict[MetricsKey, HandlerMetrics] = {}
+
+    def observe(
+        self,
+        method: str,
+        handler: str,
+        status_code: int,
+        duration: float,
+        timings: RequestTimings,
+    ) -> None:
+        """
+        Record a handled request.
+
+        :param method: HTTP method.
+        :param handler: Name of the endpoint that handled the request.
+        :param status_code: Response status code.
+        :param duration: Seconds spent handling the request.
+        :param timings: Work done on behalf of the request.
+
+        :return: None.
+        """
+        key = (method, handler, status_code)
+        metrics = self._handlers.get(key)
+
+        if metrics is None:
+            metrics = self._handlers[key] = HandlerMetrics()
+
+        metrics.requests += 1
+        metrics.request_seconds_total += duration
+        metrics.sql_statements_total += timings.sql_statements
+        metrics.db_seconds_total += timings.db_seconds
+        metrics.hash_seconds_total += timings.hash_seconds
+
+        bucket = bisect_left(LATENCY_BUCKETS, duration)
+
+        if bucket < len(LATENCY_BUCKETS):
+            metrics.buckets[bucket] += 1
+
+    def clear(self) -> None:
+        """
+        Reset all recorded metrics.
+
+        :return: None.
+        """
+        self._handlers.clear()
+
+    def render(self) -> List[str]:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        :return: The exposition lines.
+        """
+        name = 'http_request_duration_seconds'
+        lines = [f'# TYPE {name} histogram']
+
+        for key, metrics in self._handlers.items():
+            labels = self._labels(key)
+            cumulative = 0
+
+            for upper_bound, count in zip(LATENCY_BUCKETS, metrics.buckets):
+                cumulative += count
+                lines.append(
+                    f'{name}_bucket{{{labels},le="{upper_bound}"}} '
+                    f'{cumulative}'
+                )
+
+            lines.append(
+                f'{name}_bucket{{{labels},le="+Inf"}} {metrics.requests}'
+            )
+            lines.append(
+                f'{name}_sum{{{labels}}} {metrics.request_seconds_total}'
+            )
+            lines.append(f'{name}_count{{{labels}}} {metrics.requests}')
+
+        for name, attr in COUNTERS:
+            lines.append(f'# TYPE {name} counter')
+
+            for key, metrics in self._handlers.items():
+                labels = self._labels(key)
+                lines.append(f'{name}{{{labels}}} {getattr(metrics, attr)}')
+
+        return lines
+
+    @staticmethod
+    def _labels(key: MetricsKey) -> str:
+        method, handler, status = key
+
+        return f'method="{method}",handler="{handler}",status="{status}"'
+
+
+def render_gauges(prefix: str, values: Dict[str, Any]) -> List[str]:
+    """
+    Render numeric values as Prometheus gauges.
+
+    :param prefix: Prefix prepended to every metric name.
+    :param values: Metric values by name, non-numeric values are skipped.
+
+    :return: The exposition lines.
+    """
+    lines: List[str] = []
+
+    for name, value in values.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+
+        lines.append(f'# TYPE {prefix}_{name} gauge')
+        lines.append(f'{prefix}_{name} {value}')
+
+    return lines
+
+
+request_metrics = RequestMetrics()
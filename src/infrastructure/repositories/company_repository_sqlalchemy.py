@@ -1,13 +1,20 @@
 from collections.abc import AsyncGenerator
+from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.company_entity import Company
+from src.domain.entities.user_entity import User
+from src.domain.exceptions.company_exceptions import (
+    CompanyAlreadyRegisteredException,
+)
 from src.domain.exceptions.exceptions import CannotOperateException
+from src.domain.exceptions.user_exceptions import UserAlreadyExistsException
 from src.domain.repositories.company_repository import CompanyRepository
 from src.infrastructure.db.models.company_model import CompanyModel
+from src.infrastructure.db.models.user_model import UserModel
 
 
 class CompanyRepositorySQLAlchemy(CompanyRepository):
@@ -33,7 +40,6 @@ class CompanyRepositorySQLAlchemy(CompanyRepository):
             )
             self.session.add(company_model)
             await self.session.commit()
-            await self.session.refresh(company_model)
 
             company.id = str(company.id)
 
@@ -41,6 +47,74 @@ class CompanyRepositorySQLAlchemy(CompanyRepository):
         except SQLAlchemyError:
             raise CannotOperateException()
 
+    async def create_with_admin(
+        self, company: Company, admin: User
+    ) -> Company | None:
+        """
+        Create a new company and its admin user in a single transaction.
+
+        Uniqueness is enforced by the companies name and users email
+        constraints, each insert is flushed on its own to tell them apart.
+
+        :param company: Company entity to create.
+        :param admin: Admin User entity to create along with the company.
+
+        :return: The created Company entity or None otherwise.
+        """
+        company_model = CompanyModel(
+            id=company.id,
+            name=company.name,
+            type=company.type,
+            max_users=company.max_users,
+            users_count=1,
+            created_at=company.created_at,
+            updated_at=company.updated_at,
+        )
+        user_model = UserModel(
+            id=admin.id,
+            name=admin.name,
+            email=admin.email,
+            password=admin.password,
+            role=admin.role,
+            avatar=admin.avatar,
+            company_id=UUID(str(company.id)),
+            created_at=admin.created_at,
+            updated_at=admin.updated_at,
+        )
+
+        try:
+            self.session.add(company_model)
+            await self._flush_or_raise(CompanyAlreadyRegisteredException)
+
+            self.session.add(user_model)
+            await self._flush_or_raise(UserAlreadyExistsException)
+
+            await self.session.commit()
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise CannotOperateException()
+
+        company.id = str(company.id)
+        company.users_count = 1
+        admin.id = str(admin.id)
+        admin.company_id = company.id
+
+        return company
+
+    async def _flush_or_raise(self, exception: type[Exception]) -> None:
+        """
+        Flush pending inserts, rolling back on unique constraint violation.
+
+        :param exception: Domain exception raised on IntegrityError.
+
+        :return: None.
+        """
+        try:
+            await self.session.flush()
+        except IntegrityError:
+            await self.session.rollback()
+            raise exception()
+
     async def find_by_name(self, name: str) -> Company | None:
         """
         Find a company based on its name.
@@ -59,6 +133,7 @@ class CompanyRepositorySQLAlchemy(CompanyRepository):
                 name=result.name,
                 type=result.type,
                 max_users=result.max_users,
+                users_count=result.users_count,
                 created_at=result.created_at,
                 updated_at=result.updated_at,
             )
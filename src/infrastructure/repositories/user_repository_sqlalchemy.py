@@ -1,16 +1,86 @@
+from collections import Counter
 from collections.abc import AsyncGenerator
-from typing import List
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import (
+    Row,
+    Select,
+    delete,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 
 from src.domain.entities.user_entity import User
 from src.domain.exceptions.user_exceptions import UserAlreadyExistsException
-from src.domain.repositories.user_repository import UserRepository
+from src.domain.repositories.user_repository import (
+    UserRepository,
+    UserRepositoryFactory,
+)
+from src.infrastructure.cache.requester_cache import invalidate_requester
+from src.infrastructure.db.models.company_model import CompanyModel
 from src.infrastructure.db.models.user_model import UserModel
 
+# Columns loaded by read-only queries, in User constructor order. Selecting
+# plain columns skips ORM instance creation and identity map bookkeeping.
+USER_COLUMNS = (
+    UserModel.name,
+    UserModel.email,
+    UserModel.password,
+    UserModel.company_id,
+    UserModel.role,
+    UserModel.id,
+    UserModel.avatar,
+    UserModel.created_at,
+    UserModel.updated_at,
+    UserModel.version,
+)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def map_user_row(row: Row) -> User:
+    """
+    Map a row selected with USER_COLUMNS to a User entity.
+
+    :param row: The result row.
+
+    :return: The User entity.
+    """
+    (
+        name,
+        email,
+        password,
+        company_id,
+        role,
+        user_id,
+        avatar,
+        created_at,
+        updated_at,
+        version,
+    ) = row
+
+    return User(
+        name,
+        email,
+        password,
+        str(company_id),
+        role,
+        str(user_id),
+        avatar,
+        created_at,
+        updated_at,
+        version,
+    )
+
 
 class UserRepositorySQLAlchemy(UserRepository):
     def __init__(self, session: AsyncGenerator[AsyncSession, None]):
@@ -20,6 +90,8 @@ class UserRepositorySQLAlchemy(UserRepository):
         """
         Create a new user in the database.
 
+        The company users counter is incremented in the same transaction.
+
         :param user: User entity to create.
 
         :return: The created User entity.
@@ -37,15 +109,79 @@ class UserRepositorySQLAlchemy(UserRepository):
                 updated_at=user.updated_at,
             )
             self.session.add(user_model)
+            await self.session.flush()
+            await self._add_users_count(user.company_id, 1)
             await self.session.commit()
-            await self.session.refresh(user_model)
 
             user.id = str(user.id)
 
             return user
         except IntegrityError:
+            await self.session.rollback()
             raise UserAlreadyExistsException()
 
+    async def create_many(self, users: List[User]) -> List[User]:
+        """
+        Create many users with a single multi-row INSERT.
+
+        Rows whose email already exists are skipped by
+        ON CONFLICT DO NOTHING and left out of the result. The companies
+        users counters are incremented in the same transaction.
+
+        :param users: User entities to create.
+
+        :return: The created User entities.
+        """
+        if not users:
+            return []
+
+        dialect = self.session.bind.dialect.name
+        insert = (
+            postgresql.insert if dialect == 'postgresql' else sqlite.insert
+        )
+
+        stmt = (
+            insert(UserModel)
+            .values(
+                [
+                    {
+                        'id': UUID(str(user.id)),
+                        'name': user.name,
+                        'email': user.email,
+                        'password': user.password,
+                        'role': user.role,
+                        'avatar': user.avatar,
+                        'company_id': UUID(str(user.company_id)),
+                        'created_at': user.created_at,
+                        'updated_at': user.updated_at,
+                    }
+                    for user in users
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[UserModel.email])
+            .returning(UserModel.id)
+        )
+        query = await self.session.execute(stmt)
+        created_ids = {str(user_id) for user_id in query.scalars()}
+
+        created_users: List[User] = []
+
+        for user in users:
+            if str(user.id) in created_ids:
+                created_users.append(user)
+
+        companies_count = Counter(str(u.company_id) for u in created_users)
+
+        for company_id, count in companies_count.items():
+            await self._add_users_count(company_id, count)
+
+        await self.session.commit()
+
+        for user in users:
+            user.id = str(user.id)
+
+        return created_users
+
     async def find_by_email(self, email: str) -> User | None:
         """
         Find a user baed on its email.
@@ -54,22 +190,12 @@ class UserRepositorySQLAlchemy(UserRepository):
 
         :return: The user if found and None otherwise.
         """
-        stmt = select(UserModel).filter(UserModel.email == email)
+        stmt = select(*USER_COLUMNS).filter(UserModel.email == email)
         query = await self.session.execute(stmt)
-        result = query.scalar_one_or_none()
-
-        if result:
-            return User(
-                id=str(result.id),
-                name=result.name,
-                email=result.email,
-                password=result.password,
-                role=result.role,
-                avatar=result.avatar,
-                company_id=str(result.company_id),
-                created_at=result.created_at,
-                updated_at=result.updated_at,
-            )
+        row = query.one_or_none()
+
+        if row:
+            return map_user_row(row)
 
     async def find_by_id(self, user_id: str, company_id: str) -> User | None:
         """
@@ -80,25 +206,87 @@ class UserRepositorySQLAlchemy(UserRepository):
 
         :return: The user if found and None otherwise.
         """
-        stmt = select(UserModel).filter(
+        stmt = select(*USER_COLUMNS).filter(
             UserModel.id == UUID(user_id),
             UserModel.company_id == UUID(company_id),
         )
         query = await self.session.execute(stmt)
-        result = query.scalar_one_or_none()
-
-        if result:
-            return User(
-                id=str(result.id),
-                name=result.name,
-                email=result.email,
-                password=result.password,
-                role=result.role,
-                avatar=result.avatar,
-                company_id=str(result.company_id),
-                created_at=result.created_at,
-                updated_at=result.updated_at,
+        row = query.one_or_none()
+
+        if row:
+            return map_user_row(row)
+
+    async def exists(
+        self, user_id: str, company_id: str, version: Optional[int] = None
+    ) -> bool:
+        """
+        Check if a user exists with a SELECT 1 ... LIMIT 1.
+
+        :param user_id: Serch id.
+        :param company_id: Id of the company the user belongs to.
+        :param version: Version the user must have, if given.
+
+        :return: True if the user exists and False otherwise.
+        """
+        stmt = (
+            select(literal(1))
+            .select_from(UserModel)
+            .filter(
+                UserModel.id == UUID(user_id),
+                UserModel.company_id == UUID(company_id),
             )
+            .limit(1)
+        )
+
+        if version is not None:
+            stmt = stmt.filter(UserModel.version == version)
+
+        query = await self.session.execute(stmt)
+
+        return query.scalar() is not None
+
+    async def count(self, company_id: str) -> int:
+        """
+        Count company users, read by primary key from the company users
+        counter, kept in the same transaction as each user insert/delete.
+
+        :param company_id: The company id to filter users.
+
+        :return: The number of company users, 0 if the company does not exist.
+        """
+        stmt = select(CompanyModel.users_count).filter(
+            CompanyModel.id == UUID(str(company_id))
+        )
+        query = await self.session.execute(stmt)
+
+        return query.scalar() or 0
+
+    async def collection_version(self, company_id: str) -> str:
+        """
+        Get the version of the company users collection, derived from
+        the users count and their latest updated_at in a single SELECT.
+
+        Creates and deletes change the count and updates move updated_at
+        forward, so writes never touch the company row for it.
+
+        :param company_id: The company id.
+
+        :return: The current version, as "<count>-<updated_at in us>".
+        """
+        stmt = select(
+            func.count(UserModel.id), func.max(UserModel.updated_at)
+        ).filter(UserModel.company_id == UUID(str(company_id)))
+        query = await self.session.execute(stmt)
+        count, updated_at = query.one()
+
+        if updated_at is None:
+            return f'{count}-0'
+
+        # SQLite gives back naive datetimes, they are stored in UTC
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+
+        return f'{count}-{(updated_at - EPOCH) // timedelta(microseconds=1)}'
 
     async def find_all(
         self, company_id: str, limit: int, offset: int
@@ -113,73 +301,246 @@ class UserRepositorySQLAlchemy(UserRepository):
         :return: The list of found users.
         """
         stmt = (
-            select(UserModel)
+            select(*USER_COLUMNS)
             .filter(
                 UserModel.company_id == UUID(company_id),
             )
+            .order_by(UserModel.id)
             .limit(limit)
             .offset(offset)
         )
+
+        return await self._find_many(stmt)
+
+    async def find_all_after(
+        self, company_id: str, limit: int, after: str | None
+    ) -> List[User]:
+        """
+        Find company users ordered by id, starting after a given id.
+
+        :param company_id: The company id to filter users.
+        :param limit: Maximum number of users returned.
+        :param after: Id of the last user of the previous page, if any.
+
+        :return: The list of found users.
+        """
+        stmt = select(*USER_COLUMNS).filter(
+            UserModel.company_id == UUID(company_id),
+        )
+
+        if after:
+            stmt = stmt.filter(UserModel.id > UUID(after))
+
+        stmt = stmt.order_by(UserModel.id).limit(limit)
+
+        return await self._find_many(stmt)
+
+    async def stream_all(
+        self, company_id: str, batch_size: int = 500
+    ) -> AsyncIterator[User]:
+        """
+        Stream all company users ordered by id from a server-side cursor.
+
+        The stream usually outlives the request handler, so the session
+        connection is released once the stream is exhausted or closed.
+
+        :param company_id: The company id to filter users.
+        :param batch_size: Number of rows fetched per round trip.
+
+        :return: An async iterator over the company users.
+        """
+        stmt = (
+            select(*USER_COLUMNS)
+            .filter(UserModel.company_id == UUID(company_id))
+            .order_by(UserModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        try:
+            result = await self.session.stream(stmt)
+
+            async for row in result:
+                yield map_user_row(row)
+        finally:
+            await self.session.close()
+
+    async def _find_many(self, stmt: Select) -> List[User]:
+        """
+        Run a users select statement and map its rows to entities.
+
+        :param stmt: The select statement over USER_COLUMNS.
+
+        :return: The list of found users.
+        """
         query = await self.session.execute(stmt)
-        results = query.scalars()
-
-        users: List[User] = []
-
-        for result in results:
-            users.append(
-                User(
-                    id=str(result.id),
-                    name=result.name,
-                    email=result.email,
-                    password=result.password,
-                    role=result.role,
-                    avatar=result.avatar,
-                    company_id=str(result.company_id),
-                    created_at=result.created_at,
-                    updated_at=result.updated_at,
-                )
-            )
 
-        return users
+        return [map_user_row(row) for row in query]
 
-    async def delete_by_id(self, user_id: str, company_id: str) -> None:
+    async def delete_by_id(
+        self,
+        user_id: str,
+        company_id: str,
+        excluded_id: Optional[str] = None,
+    ) -> bool:
         """
         Delete a user baed on its id.
 
+        The company users counter is decremented in the same transaction.
+
         :param user_id: Serch id.
         :param company_id: Id of the company the user belongs to.
+        :param excluded_id:
+            When given, the user is only deleted if it is not this one
+            (admins can not delete their own account).
 
-        :return: None.
+        :return: True if a user was deleted, False otherwise.
         """
         stmt = delete(UserModel).filter(
             UserModel.id == UUID(user_id),
             UserModel.company_id == UUID(company_id),
         )
-        await self.session.execute(stmt)
+
+        if excluded_id is not None:
+            stmt = stmt.filter(UserModel.id != UUID(str(excluded_id)))
+
+        result = await self.session.execute(
+            stmt.execution_options(synchronize_session=False)
+        )
+
+        if result.rowcount:
+            await self._add_users_count(company_id, -result.rowcount)
+
         await self.session.commit()
 
-    async def update(self, user: User) -> User:
+        invalidate_requester(user_id, company_id)
+
+        return bool(result.rowcount)
+
+    async def update_password(
+        self,
+        user_id: str,
+        company_id: str,
+        password: str,
+        current_password: str,
+    ) -> bool:
         """
-        Update a user baed on its id.
+        Replace a user password hash with a single UPDATE ... WHERE
+        password = current_password, leaving the version untouched.
 
-        :param user: User entity to update.
+        :param user_id: Id of the user to update.
+        :param company_id: Id of the company the user belongs to.
+        :param password: New password hash.
+        :param current_password: Password hash the user must still have.
 
-        :return: The updated User entity.
+        :return: True if the password was replaced and False otherwise.
         """
         stmt = (
             update(UserModel)
-            .where(UserModel.id == UUID(str(user.id)))
-            .values(
-                name=user.name,
-                password=user.password,
-                role=user.role,
-                avatar=user.avatar,
-                updated_at=user.updated_at,
+            .where(
+                UserModel.id == UUID(str(user_id)),
+                UserModel.company_id == UUID(str(company_id)),
+                UserModel.password == current_password,
             )
+            .values(password=password)
+            .execution_options(synchronize_session=False)
         )
-        await self.session.execute(stmt)
+        result = await self.session.execute(stmt)
         await self.session.commit()
 
-        user.id = str(user.id)
+        if result.rowcount:
+            invalidate_requester(user_id, company_id)
+
+        return bool(result.rowcount)
+
+    async def update_by_id(
+        self,
+        user_id: str,
+        company_id: str,
+        values: Dict[str, Any],
+        requester_id: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> User | None:
+        """
+        Update a user with a single UPDATE ... WHERE ... RETURNING.
+
+        :param user_id: Id of the user to update.
+        :param company_id: Id of the company the user belongs to.
+        :param values:
+            New values by user field name, updated_at defaults to now.
+        :param requester_id:
+            When given, the user is only updated if it is the requester
+            (users that are not admins can only update themselves).
+        :param version:
+            When given, the user is only updated if it still has this
+            version. The version is bumped by every update.
+
+        :return: The updated User entity, or None if no user matched.
+        """
+        stmt = update(UserModel).where(
+            UserModel.id == UUID(user_id),
+            UserModel.company_id == UUID(company_id),
+        )
+
+        if requester_id is not None:
+            stmt = stmt.where(UserModel.id == UUID(str(requester_id)))
+
+        if version is not None:
+            stmt = stmt.where(UserModel.version == version)
+
+        stmt = (
+            stmt.values(
+                **{'updated_at': datetime.now(timezone.utc), **values},
+                version=UserModel.version + 1,
+            )
+            .returning(*USER_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        query = await self.session.execute(stmt)
+        row = query.one_or_none()
+        await self.session.commit()
+
+        if row is None:
+            return None
+
+        invalidate_requester(user_id, company_id)
+
+        return map_user_row(row)
+
+    async def _add_users_count(self, company_id: str, count: int) -> None:
+        """
+        Add to a company users counter, in the current transaction.
+
+        The counter is only kept to answer the company users count, the
+        max_users value is not enforced.
+
+        :param company_id: Id of the company.
+        :param count: Number of users added (negative when removed).
+
+        :return: None.
+        """
+        stmt = (
+            update(CompanyModel)
+            .where(CompanyModel.id == UUID(str(company_id)))
+            .values(users_count=CompanyModel.users_count + count)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+
+
+def user_repository_factory(
+    session_factory: sessionmaker,
+) -> UserRepositoryFactory:
+    """
+    Get a factory opening a UserRepositorySQLAlchemy on a new session.
+
+    :param session_factory: Factory of the sessions to open.
+
+    :return: The repository factory.
+    """
+
+    @asynccontextmanager
+    async def open_repository() -> AsyncIterator[UserRepository]:
+        async with session_factory() as session:
+            yield UserRepositorySQLAlchemy(session)
 
-        return user
+    return open_repository
@@ -0,0 +1,135 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Callable, TypeVar
+
+from src.core.settings import settings
+from src.domain.exceptions.exceptions import ServiceUnavailableException
+from src.infrastructure.metrics.request_metrics import record_hash
+
+R = TypeVar('R')
+
+
+@dataclass
+class HashingPoolStats:
+    completed: int = 0
+    rejected: int = 0
+    queue_wait_seconds_total: float = 0.0
+    queue_wait_seconds_max: float = 0.0
+    hash_seconds_total: float = 0.0
+    hash_seconds_max: float = 0.0
+
+    def record(self, queue_wait: float, hash_time: float) -> None:
+        """
+        Record the timings of a completed job.
+
+        :param queue_wait: Seconds the job waited for a free worker.
+        :param hash_time: Seconds the job took to run.
+
+        :return: None.
+        """
+        self.completed += 1
+        self.queue_wait_seconds_total += queue_wait
+        self.queue_wait_seconds_max = max(
+            self.queue_wait_seconds_max, queue_wait
+        )
+        self.hash_seconds_total += hash_time
+        self.hash_seconds_max = max(self.hash_seconds_max, hash_time)
+
+
+class HashingPool:
+    """
+    Dedicated, bounded thread pool for CPU-bound password hashing.
+
+    Jobs beyond `max_workers + max_queue_size` fail fast with
+    ServiceUnavailableException instead of piling up behind the pool.
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int):
+        """
+        :param max_workers: Number of threads running hash jobs.
+        :param max_queue_size: Number of jobs allowed to wait for a thread.
+        """
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.stats = HashingPoolStats()
+        self._pending = 0
+        self._pending_lock = Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or running, cancelled awaits included."""
+        return self._pending
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='password-hasher',
+            )
+        return self._executor
+
+    async def run(self, fn: Callable[..., R], *args) -> R:
+        """
+        Run a blocking function in the pool.
+
+        :param fn: Blocking function to run.
+        :param args: Positional arguments passed to fn.
+
+        :return: The fn result.
+        """
+        with self._pending_lock:
+            if self._pending >= self.max_workers + self.max_queue_size:
+                self.stats.rejected += 1
+                raise ServiceUnavailableException()
+
+            self._pending += 1
+
+        def job():
+            started_at = perf_counter()
+            result = fn(*args)
+            return result, started_at, perf_counter()
+
+        submitted_at = perf_counter()
+        future = self.executor.submit(job)
+        # Released when the job is over, not when the await is: a cancelled
+        # caller leaves the job running (or queued) in the pool
+        future.add_done_callback(self._release)
+
+        result, started_at, finished_at = await asyncio.wrap_future(future)
+
+        self.stats.record(started_at - submitted_at, finished_at - started_at)
+        record_hash(finished_at - submitted_at)
+
+        return result
+
+    def _release(self, future: Future) -> None:
+        """
+        Count a job as over, called from the thread that ends it.
+
+        :param future: The job future.
+
+        :return: None.
+        """
+        with self._pending_lock:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """
+        Stop the pool threads, waiting for running jobs.
+
+        :return: None.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hashing_pool = HashingPool(
+    max_workers=settings.PASSWORD_HASHER_MAX_WORKERS,
+    max_queue_size=settings.PASSWORD_HASHER_MAX_QUEUE_SIZE,
+)
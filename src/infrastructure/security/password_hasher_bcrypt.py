@@ -1,10 +1,22 @@
-import aiobcrypt
-from aiobcrypt import checkpw, hashpw
+from bcrypt import checkpw, gensalt, hashpw
 
+from src.core.settings import settings
 from src.domain.security.password_hasher import PasswordHasher
 
+from .hashing_pool import HashingPool, password_hashing_pool
+
 
 class PasswordHasherBcrypt(PasswordHasher):
+    def __init__(
+        self, rounds: int | None = None, pool: HashingPool | None = None
+    ):
+        """
+        :param rounds: bcrypt cost factor (defaults to settings).
+        :param pool: HashingPool running bcrypt (defaults to the shared one).
+        """
+        self.rounds = rounds or settings.PASSWORD_HASHER_ROUNDS
+        self.pool = pool or password_hashing_pool
+
     async def async_hash(self, password: str) -> str:
         """
         Hash a password using bcrypt.
@@ -13,8 +25,10 @@ class PasswordHasherBcrypt(PasswordHasher):
 
         :return: The hashed password.
         """
-        salt: bytes = await aiobcrypt.gensalt(10)
-        hashed_password: bytes = await hashpw(password.encode(), salt)
+        salt: bytes = gensalt(self.rounds)
+        hashed_password: bytes = await self.pool.run(
+            hashpw, password.encode(), salt
+        )
 
         return hashed_password.decode()
 
@@ -27,4 +41,21 @@ class PasswordHasherBcrypt(PasswordHasher):
 
         :return: True if passowrd are equal and False otherwise.
         """
-        return await checkpw(password.encode(), hashed_password.encode())
+        return await self.pool.run(
+            checkpw, password.encode(), hashed_password.encode()
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Check if hashed_password cost factor differs from the configured one.
+
+        :param hashed_password: The hashed password ($2b$<cost>$<salt+hash>).
+
+        :return: True if the password should be hashed again.
+        """
+        try:
+            rounds = int(hashed_password.split('$')[2])
+        except (IndexError, ValueError):
+            return False
+
+        return rounds != self.rounds
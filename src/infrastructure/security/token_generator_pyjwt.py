@@ -1,4 +1,6 @@
 from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from time import time
 
 from jwt import decode, encode
 from jwt.exceptions import (
@@ -17,6 +19,7 @@ from src.application.dtos.security.token_generator_encode_dto import (
 from src.core.settings import settings
 from src.domain.entities.user_role import UserRole
 from src.domain.security.token_generator import TokenGenerator
+from src.infrastructure.cache.token_cache import decoded_token_cache
 
 
 class TokenGeneratorPyJWT(TokenGenerator):
@@ -25,6 +28,7 @@ class TokenGeneratorPyJWT(TokenGenerator):
         self.algorithm = settings.ACCESS_TOKEN_ALGORITHM
         self.expire_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
         self.token_type = settings.ACCESS_TOKEN_TYPE
+        self.decoded_cache = decoded_token_cache
 
     async def async_encode(
         self, payload: TokenGeneratorEncodeInputDTO
@@ -65,15 +69,35 @@ class TokenGeneratorPyJWT(TokenGenerator):
 
         :return: The token payload if valid or None otherwise.
         """
+        cache_key = sha256(access_token.encode()).digest()
+        cached = self.decoded_cache.get(cache_key)
+
+        if cached:
+            exp, payload = cached
+
+            # Keep the exact expiry semantics of the `exp` claim
+            if time() < exp:
+                return payload
+
+            self.decoded_cache.delete(cache_key)
+            return None
+
         try:
             decoded = decode(
                 access_token, self.secret_key, algorithms=[self.algorithm]
             )
 
-            return TokenGeneratorDecodeOutputDTO(
+            payload = TokenGeneratorDecodeOutputDTO(
                 user_id=decoded['sub'],
                 user_role=UserRole(decoded['role']),
                 company_id=decoded['company'],
             )
         except (ExpiredSignatureError, DecodeError, InvalidTokenError):
             return None
+
+        exp = decoded.get('exp')
+
+        if isinstance(exp, (int, float)):
+            self.decoded_cache.set(cache_key, (exp, payload), ttl=exp - time())
+
+        return payload
@@ -1,18 +1,37 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, status
 from starlette.responses import RedirectResponse
 
 from src.core.settings import settings
+from src.infrastructure.security.hashing_pool import password_hashing_pool
+from src.presentation.api.middlewares.request_metrics_middleware import (
+    RequestMetricsMiddleware,
+)
 from src.presentation.api.router import api_router
+from src.presentation.api.v1.responses import FastJSONResponse
 from src.presentation.api.v1.security.exceptions_handler import (
     http_exception_handler,
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+
+    # Let the running password hashes finish before the process exits
+    password_hashing_pool.shutdown()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     version='1.0.0',
     root_path='/api/v1',
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
 )
 http_exception_handler(app)
+app.add_middleware(RequestMetricsMiddleware)
 
 
 @app.get('/')
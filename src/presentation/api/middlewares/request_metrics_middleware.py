@@ -0,0 +1,68 @@
+from time import perf_counter
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics.request_metrics import (
+    RequestMetrics,
+    RequestTimings,
+    current_request_timings,
+    request_metrics,
+)
+
+
+class RequestMetricsMiddleware:
+    """
+    Measure each HTTP request: wall time, SQL statements, database time
+    and password hasher time.
+
+    The timings are sent back in a Server-Timing header (as of the
+    response start) and aggregated per handler in the request metrics.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: Optional[RequestMetrics] = None):
+        """
+        :param app: The wrapped ASGI application.
+        :param metrics: Where requests are recorded (defaults to the
+            application request metrics).
+        """
+        self.app = app
+        self.metrics = metrics or request_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = current_request_timings.set(timings)
+        started_at = perf_counter()
+        status_code = 500
+
+        async def send_with_server_timing(message: Message):
+            nonlocal status_code
+
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    'Server-Timing',
+                    timings.server_timing(perf_counter() - started_at),
+                )
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            current_request_timings.reset(token)
+
+            endpoint = scope.get('endpoint')
+            self.metrics.observe(
+                scope['method'],
+                getattr(endpoint, '__name__', 'unmatched'),
+                status_code,
+                perf_counter() - started_at,
+                timings,
+            )
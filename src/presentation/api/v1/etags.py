@@ -0,0 +1,91 @@
+from typing import Optional
+
+from src.domain.exceptions.exceptions import PreconditionFailedException
+
+
+def user_etag(version: int) -> str:
+    """
+    Build the (strong) ETag of a user representation.
+
+    :param version: User version.
+
+    :return: The quoted ETag.
+    """
+    return f'"{version}"'
+
+
+def users_etag(version: str) -> str:
+    """
+    Build the (weak) ETag of a users listing.
+
+    Any page of the listing shares the users collection version, the
+    request URL tells the pages apart.
+
+    :param version: Users collection version.
+
+    :return: The quoted ETag.
+    """
+    return f'W/"{version}"'
+
+
+def parse_if_none_match(if_none_match: Optional[str]) -> Optional[str]:
+    """
+    Get the version already known by an If-None-Match header.
+
+    ETags are compared weakly, only a single ETag is supported and
+    anything else is ignored (the full response is sent).
+
+    :param if_none_match: If-None-Match header value.
+
+    :return: The known (opaque) version, or None if there is none.
+    """
+    if if_none_match is None:
+        return None
+
+    tag = if_none_match.strip().removeprefix('W/')
+
+    if (
+        tag.startswith('"')
+        and tag.endswith('"')
+        and tag[1:-1]
+        and '"' not in tag[1:-1]
+    ):
+        return tag[1:-1]
+
+    return None
+
+
+def user_version(version: Optional[str]) -> Optional[int]:
+    """
+    Get the user version a known version stands for.
+
+    :param version: Version parsed from an If-None-Match header.
+
+    :return: The user version, or None if it is not one.
+    """
+    if version is not None and version.isdigit():
+        return int(version)
+
+    return None
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """
+    Get the user version expected by an If-Match header.
+
+    Only a single strong ETag is supported, anything else can never
+    match a user representation.
+
+    :param if_match: If-Match header value.
+
+    :return: The expected version, or None if any version is accepted.
+    """
+    if if_match is None or if_match.strip() == '*':
+        return None
+
+    tag = if_match.strip()
+
+    if tag.startswith('"') and tag.endswith('"') and tag[1:-1].isdigit():
+        return int(tag[1:-1])
+
+    raise PreconditionFailedException()
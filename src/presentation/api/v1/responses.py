@@ -0,0 +1,29 @@
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core.
+
+    Pydantic models, dataclasses, UUIDs, enums and aware datetimes are
+    encoded straight to UTF-8 bytes in a single pass, instead of being
+    converted to builtins first and encoded by the stdlib json module.
+    Used as the application default response class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class DTOResponse(FastJSONResponse):
+    """
+    JSON response for DTOs already validated by the use cases.
+
+    FastAPI does not validate nor serialize a returned Response against
+    the route `response_model`, so the DTO is only dumped once, straight
+    to JSON bytes by pydantic-core. Routes keep declaring `response_model`
+    for the OpenAPI schema.
+    """
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from src.application.dtos.auth.auth_signin_dto import (
@@ -32,6 +32,7 @@ async def signup(
     status_code=status.HTTP_200_OK,
 )
 async def signin(
+    background_tasks: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends(),
     use_case: AuthSigninUseCase = AuthSigninUseCaseDep,
 ) -> AuthSigninOutputDTO:
@@ -46,4 +47,4 @@ async def signin(
         email=form_data.username,
         password=form_data.password,
     )
-    return await use_case.execute(input_dto)
+    return await use_case.execute(input_dto, background_tasks.add_task)
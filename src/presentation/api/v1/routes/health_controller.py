@@ -0,0 +1,21 @@
+from fastapi import APIRouter, status
+
+from src.core.container import InternalTokenDep
+from src.infrastructure.db.pool import get_pool_status
+from src.infrastructure.db.session import engine
+
+router = APIRouter(prefix='/health', tags=['health'])
+
+
+@router.get(
+    '/db-pool',
+    status_code=status.HTTP_200_OK,
+    dependencies=[InternalTokenDep],
+)
+async def db_pool():
+    """
+    Returns the database connection pool usage: checked-out connections,
+    overflow and time spent waiting for a connection.\n
+    Requires the **INTERNAL_API_TOKEN** as a Bearer token.
+    """
+    return get_pool_status(engine)
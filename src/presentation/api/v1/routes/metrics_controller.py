@@ -0,0 +1,42 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from src.core.container import InternalTokenDep
+from src.infrastructure.db.pool import get_pool_status
+from src.infrastructure.db.session import engine
+from src.infrastructure.metrics.request_metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    render_gauges,
+    request_metrics,
+)
+from src.infrastructure.security.hashing_pool import password_hashing_pool
+
+router = APIRouter(tags=['metrics'])
+
+
+@router.get(
+    '/metrics',
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False,
+    dependencies=[InternalTokenDep],
+)
+async def metrics():
+    """
+    Returns request, database pool and password hashing pool metrics in
+    the Prometheus text format.\n
+    Requires the **INTERNAL_API_TOKEN** as a Bearer token.
+    """
+    lines = [
+        *request_metrics.render(),
+        *render_gauges('db_pool', get_pool_status(engine)),
+        *render_gauges(
+            'password_hashing_pool', asdict(password_hashing_pool.stats)
+        ),
+    ]
+
+    return PlainTextResponse(
+        '\n'.join(lines) + '\n', media_type=PROMETHEUS_CONTENT_TYPE
+    )
@@ -1,9 +1,16 @@
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
 
+from src.application.dtos.user.user_bulk_create_dto import (
+    UserBulkCreateInputDTO,
+    UserBulkCreateOutputDTO,
+)
+from src.application.dtos.user.user_count_dto import UserCountOutputDTO
 from src.application.dtos.user.user_create_dto import (
     UserCreateInputDTO,
     UserCreateOutputDTO,
 )
+from src.application.dtos.user.user_export_dto import UserExportFormat
 from src.application.dtos.user.user_get_dto import UserGetOutputDTO
 from src.application.dtos.user.user_list_dto import UserListOutputDTO
 from src.application.dtos.user.user_update_dto import (
@@ -14,8 +21,18 @@ from src.application.dtos.user.user_update_partial_dto import (
     UserUpdatePartialInputDTO,
     UserUpdatePartialOutputDTO,
 )
+from src.application.usecases.user.user_bulk_create_usecase import (
+    UserBulkCreateUseCase,
+)
+from src.application.usecases.user.user_count_usecase import UserCountUseCase
 from src.application.usecases.user.user_create_usecase import UserCreateUseCase
 from src.application.usecases.user.user_delete_usecase import UserDeleteUseCase
+from src.application.usecases.user.user_exists_usecase import (
+    UserExistsUseCase,
+)
+from src.application.usecases.user.user_export_usecase import (
+    UserExportUseCase,
+)
 from src.application.usecases.user.user_get_usecase import UserGetUseCase
 from src.application.usecases.user.user_list_usecase import UserListUseCase
 from src.application.usecases.user.user_update_partial_usecase import (
@@ -24,17 +41,34 @@ from src.application.usecases.user.user_update_partial_usecase import (
 from src.application.usecases.user.user_update_usecase import UserUpdateUseCase
 from src.core.container import (
     GetRequesterFromTokenDep,
+    UserBulkCreateUseCaseDep,
+    UserCountUseCaseDep,
     UserCreateUseCaseDep,
     UserDeleteUseCaseDep,
+    UserExistsUseCaseDep,
+    UserExportUseCaseDep,
     UserGetUseCaseDep,
     UserListUseCaseDep,
     UserUpdatePartialUseCaseDep,
     UserUpdateUseCaseDep,
 )
 from src.domain.entities.user_entity import User
+from src.presentation.api.v1.etags import (
+    parse_if_match,
+    parse_if_none_match,
+    user_etag,
+    user_version,
+    users_etag,
+)
+from src.presentation.api.v1.responses import DTOResponse
 
 router = APIRouter(prefix='/users', tags=['users'])
 
+EXPORT_MEDIA_TYPES = {
+    UserExportFormat.NDJSON: 'application/x-ndjson',
+    UserExportFormat.CSV: 'text/csv',
+}
+
 
 @router.post(
     '/',
@@ -50,7 +84,96 @@ async def user_create(
     To create a user, the requester must be admin.\n
     Returns the created user.
     """
-    return await use_case.execute(requester, user)
+    created_user = await use_case.execute(requester, user)
+
+    return DTOResponse(
+        created_user,
+        status_code=status.HTTP_201_CREATED,
+        headers={'ETag': user_etag(created_user.version)},
+    )
+
+
+@router.post(
+    '/bulk',
+    response_model=UserBulkCreateOutputDTO,
+    status_code=status.HTTP_200_OK,
+)
+async def user_bulk_create(
+    data: UserBulkCreateInputDTO,
+    requester: User = GetRequesterFromTokenDep,
+    use_case: UserBulkCreateUseCase = UserBulkCreateUseCaseDep,
+):
+    """
+    To create users in bulk, the requester must be admin.\n
+    Returns a per-user report telling if it was created, if its email
+    was already registered (conflict) or if it was left out because the
+    server was too busy hashing passwords (unavailable, retry them later).
+    """
+    return DTOResponse(await use_case.execute(requester, data))
+
+
+@router.get(
+    '/export',
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def user_export(
+    export_format: UserExportFormat = Query(
+        UserExportFormat.NDJSON, alias='format'
+    ),
+    requester: User = GetRequesterFromTokenDep,
+    use_case: UserExportUseCase = UserExportUseCaseDep,
+):
+    """
+    To export users, the requester must be admin.\n
+    Streams all company users as NDJSON (default) or CSV.
+    """
+    lines = await use_case.execute(requester, export_format)
+
+    return StreamingResponse(
+        lines,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename="users.{export_format}"'
+            )
+        },
+    )
+
+
+@router.get(
+    '/count',
+    response_model=UserCountOutputDTO,
+    status_code=status.HTTP_200_OK,
+)
+async def user_count(
+    requester: User = GetRequesterFromTokenDep,
+    use_case: UserCountUseCase = UserCountUseCaseDep,
+):
+    """
+    To count users, the requester must be admin.\n
+    Returns the number of company users.
+    """
+    return DTOResponse(await use_case.execute(requester))
+
+
+@router.head(
+    '/{user_id}',
+    response_model=None,
+    status_code=status.HTTP_200_OK,
+)
+async def user_exists(
+    user_id: str,
+    requester: User = GetRequesterFromTokenDep,
+    use_case: UserExistsUseCase = UserExistsUseCaseDep,
+):
+    """
+    To check if a user exists, the requester must be from the same company.\n
+    Returns no body: 200 if the user exists and 404 otherwise.
+    """
+    await use_case.execute(requester, user_id)
+
+    return Response(status_code=status.HTTP_200_OK)
 
 
 @router.get(
@@ -60,14 +183,26 @@ async def user_create(
 )
 async def user_get(
     user_id: str,
+    if_none_match: str | None = Header(None),
     requester: User = GetRequesterFromTokenDep,
     use_case: UserGetUseCase = UserGetUseCaseDep,
 ):
     """
     To get a user, the requester must be from the same company.\n
-    Return user info.
+    Send the user **ETag** as **If-None-Match** to get an empty 304 response
+    if it was not modified.\n
+    Return user info, its version is sent as the **ETag** header.
     """
-    return await use_case.execute(requester, user_id)
+    cached_version = user_version(parse_if_none_match(if_none_match))
+    user = await use_case.execute(requester, user_id, cached_version)
+
+    if user is None:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={'ETag': user_etag(cached_version)},
+        )
+
+    return DTOResponse(user, headers={'ETag': user_etag(user.version)})
 
 
 @router.get(
@@ -78,14 +213,31 @@ async def user_get(
 async def user_list(
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0),
+    cursor: str | None = Query(None),
+    if_none_match: str | None = Header(None),
     requester: User = GetRequesterFromTokenDep,
     use_case: UserListUseCase = UserListUseCaseDep,
 ):
     """
     To list users, the requester must be admin.\n
+    Pass the returned **next_cursor** as **cursor** to get the next page
+    (offset is ignored when a cursor is given).\n
+    Send the returned **ETag** as **If-None-Match** to get an empty 304
+    response if no company user changed since.\n
     Returns the list of found users.
     """
-    return await use_case.execute(requester, limit, offset)
+    cached_version = parse_if_none_match(if_none_match)
+    users = await use_case.execute(
+        requester, limit, offset, cursor, cached_version
+    )
+
+    if users is None:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={'ETag': users_etag(cached_version)},
+        )
+
+    return DTOResponse(users, headers={'ETag': users_etag(users.version)})
 
 
 @router.delete(
@@ -113,14 +265,23 @@ async def user_delete(
 async def user_update(
     user_id: str,
     data: UserUpdateInputDTO,
+    if_match: str | None = Header(None),
     requester: User = GetRequesterFromTokenDep,
     use_case: UserUpdateUseCase = UserUpdateUseCaseDep,
 ):
     """
     To update a user, the requester must be admin or the own user.\n
+    Send the user **ETag** as **If-Match** to only update it if it was not
+    modified in the meantime (412 otherwise).\n
     Returns the updated user info.
     """
-    return await use_case.execute(requester, user_id, data)
+    updated_user = await use_case.execute(
+        requester, user_id, data, parse_if_match(if_match)
+    )
+
+    return DTOResponse(
+        updated_user, headers={'ETag': user_etag(updated_user.version)}
+    )
 
 
 @router.patch(
@@ -131,11 +292,20 @@ async def user_update(
 async def user_update_partial(
     user_id: str,
     data: UserUpdatePartialInputDTO,
+    if_match: str | None = Header(None),
     requester: User = GetRequesterFromTokenDep,
     use_case: UserUpdatePartialUseCase = UserUpdatePartialUseCaseDep,
 ):
     """
     To update a user partially, the requester must be admin or the own user.\n
+    Send the user **ETag** as **If-Match** to only update it if it was not
+    modified in the meantime (412 otherwise).\n
     Returns the updated user info.
     """
-    return await use_case.execute(requester, user_id, data)
+    updated_user = await use_case.execute(
+        requester, user_id, data, parse_if_match(if_match)
+    )
+
+    return DTOResponse(
+        updated_user, headers={'ETag': user_etag(updated_user.version)}
+    )
@@ -9,7 +9,12 @@ from src.domain.exceptions.auth_exceptions import (
 from src.domain.exceptions.company_exceptions import (
     CompanyAlreadyRegisteredException,
 )
-from src.domain.exceptions.exceptions import NotFoundException
+from src.domain.exceptions.exceptions import (
+    InvalidCursorException,
+    NotFoundException,
+    PreconditionFailedException,
+    ServiceUnavailableException,
+)
 from src.domain.exceptions.user_exceptions import UserAlreadyExistsException
 
 
@@ -67,3 +72,31 @@ def http_exception_handler(app: FastAPI):
             status_code=status.HTTP_409_CONFLICT,
             content={'detail': str(exc)},
         )
+
+    @app.exception_handler(ServiceUnavailableException)
+    async def service_unavailable_exception_handler(
+        request: Request, exc: ServiceUnavailableException
+    ):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={'detail': str(exc)},
+            headers={'Retry-After': '1'},
+        )
+
+    @app.exception_handler(InvalidCursorException)
+    async def invalid_cursor_exception_handler(
+        request: Request, exc: InvalidCursorException
+    ):
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={'detail': str(exc)},
+        )
+
+    @app.exception_handler(PreconditionFailedException)
+    async def precondition_failed_exception_handler(
+        request: Request, exc: PreconditionFailedException
+    ):
+        return JSONResponse(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            content={'detail': str(exc)},
+        )
@@ -0,0 +1,28 @@
+from secrets import compare_digest
+
+from src.domain.exceptions.auth_exceptions import UnauthorizedException
+from src.domain.exceptions.exceptions import NotFoundException
+
+
+def verify_internal_token(
+    authorization: str | None, internal_token: str | None
+) -> None:
+    """
+    Restrict an operational endpoint to the holders of the internal token.
+
+    :param authorization: Authorization header, as "Bearer <token>".
+    :param internal_token:
+        Configured internal token. When unset the endpoint is disabled
+        and answers as if it did not exist.
+
+    :return: None.
+    """
+    if not internal_token:
+        raise NotFoundException()
+
+    scheme, _, token = (authorization or '').partition(' ')
+
+    if scheme.lower() != 'bearer' or not compare_digest(
+        token.encode(), internal_token.encode()
+    ):
+        raise UnauthorizedException()
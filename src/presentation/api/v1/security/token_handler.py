@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 from fastapi.security import OAuth2PasswordBearer
 
 from src.domain.entities.user_entity import User
@@ -7,6 +9,8 @@ from src.domain.exceptions.auth_exceptions import (
 )
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.security.token_generator import TokenGenerator
+from src.infrastructure.cache.requester_cache import RequesterCacheKey
+from src.infrastructure.cache.ttl_cache import TTLCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='auth/signin')
 
@@ -15,6 +19,7 @@ async def get_requester_from_token(
     token: str,
     token_generator: TokenGenerator,
     user_repository: UserRepository,
+    requester_cache: TTLCache[RequesterCacheKey, User] | None = None,
 ) -> User | None:
     """
     Get requester (logged user) based on the token helper.
@@ -22,6 +27,8 @@ async def get_requester_from_token(
     :param token: JWT token from the request header.
     :param token_generator: TokenGenerator instance (injected dependency).
     :param user_repository: UserRepository instance (injected dependency).
+    :param requester_cache:
+        Cache of already verified requesters (injected dependency).
 
     :return: The requester user.
     """
@@ -39,9 +46,21 @@ async def get_requester_from_token(
     if not all([user_id, company_id]):
         raise InvalidTokenException()
 
+    cache_key = (user_id, company_id)
+
+    if requester_cache is not None:
+        cached_user = requester_cache.get(cache_key)
+
+        if cached_user:
+            # Hand out a copy so callers cannot mutate the cached entry
+            return replace(cached_user)
+
     user = await user_repository.find_by_id(user_id, company_id)
 
     if not user:
         raise UnauthorizedException()
 
+    if requester_cache is not None:
+        requester_cache.set(cache_key, replace(user))
+
     return user
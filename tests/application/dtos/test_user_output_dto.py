@@ -0,0 +1,71 @@
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+from uuid_extensions import uuid7
+
+from src.application.dtos.user.user_output_dto import UserOutputDTO
+from src.domain.entities.user_entity import User
+
+
+class TestUserOutputDTO:
+    def test_should_convert_uuid_ids_to_strings(self):
+        user = User(
+            name='User 1',
+            email='user1@test.com',
+            password='123456789',
+            company_id=uuid7(),
+        )
+        user_id = user.id
+
+        dto = UserOutputDTO.model_validate(user)
+
+        assert dto.id == str(user_id)
+        assert dto.created_at == user.created_at
+
+    def test_should_not_mutate_the_source_entity(self):
+        user = User(
+            name='User 1',
+            email='user1@test.com',
+            password='123456789',
+            company_id=uuid7(),
+        )
+        user_copy = replace(user)
+
+        UserOutputDTO.model_validate(user)
+
+        assert user == user_copy
+        assert user.id is user_copy.id
+
+    def test_entity_naive_datetimes_should_be_exposed_as_utc(self):
+        naive_datetime = datetime(2024, 1, 1, 12, 0, 0)
+        user = User(
+            name='User 1',
+            email='user1@test.com',
+            password='123456789',
+            company_id=uuid7(),
+            created_at=naive_datetime,
+            updated_at=naive_datetime,
+        )
+
+        dto = UserOutputDTO.model_validate(user)
+
+        assert dto.created_at == naive_datetime.replace(tzinfo=timezone.utc)
+        assert dto.updated_at.tzinfo == timezone.utc
+
+    def test_naive_datetimes_should_be_rejected(self):
+        naive_datetime = datetime(2024, 1, 1, 12, 0, 0)
+
+        with pytest.raises(ValidationError):
+            UserOutputDTO.model_validate(
+                {
+                    'id': 'user-id',
+                    'name': 'User 1',
+                    'email': 'user1@test.com',
+                    'role': 'user',
+                    'avatar': '',
+                    'created_at': naive_datetime,
+                    'updated_at': naive_datetime,
+                }
+            )
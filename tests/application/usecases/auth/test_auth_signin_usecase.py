@@ -1,4 +1,5 @@
 from typing import Dict, List, Tuple
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -6,14 +7,26 @@ from src.application.dtos.auth.auth_signin_dto import (
     AuthSigninInputDTO,
     AuthSigninOutputDTO,
 )
+from src.application.dtos.user.user_update_partial_dto import (
+    UserUpdatePartialInputDTO,
+)
 from src.application.usecases.auth.auth_signin_usecase import AuthSigninUseCase
+from src.application.usecases.user.user_update_partial_usecase import (
+    UserUpdatePartialUseCase,
+)
 from src.core.settings import settings
 from src.domain.entities.user_entity import User
 from src.domain.exceptions.auth_exceptions import InvalidCredentialsException
 from src.domain.exceptions.exceptions import NotFoundException
-from src.domain.repositories.user_repository import UserRepository
+from src.domain.repositories.user_repository import (
+    UserRepository,
+    UserRepositoryFactory,
+)
 from src.domain.security.password_hasher import PasswordHasher
 from src.domain.security.token_generator import TokenGenerator
+from src.infrastructure.security.password_hasher_bcrypt import (
+    PasswordHasherBcrypt,
+)
 
 SetupType = Tuple[Dict, AuthSigninUseCase]
 
@@ -27,11 +40,15 @@ class TestAuthSigninUsecase:
         user_repository: UserRepository,
         password_hasher: PasswordHasher,
         token_generator: TokenGenerator,
+        repository_factory: UserRepositoryFactory,
         admin_user_info: dict,
     ) -> SetupType:
         requester = admin_user_info
         usecase = AuthSigninUseCase(
-            user_repository, password_hasher, token_generator
+            user_repository,
+            password_hasher,
+            token_generator,
+            repository_factory,
         )
         return requester, usecase
 
@@ -86,3 +103,114 @@ class TestAuthSigninUsecase:
             await usecase.execute(signin_dto)
 
         assert str(exc.value) == 'Not found'
+
+    async def test_outdated_password_hash_should_be_rehashed(
+        self,
+        setup: SetupType,
+        user_repository: UserRepository,
+        admin_user: User,
+        admin_user_info: dict,
+    ):
+        _, usecase = setup
+
+        outdated_user = await user_repository.update_by_id(
+            str(admin_user.id),
+            str(admin_user.company_id),
+            {
+                'password': await PasswordHasherBcrypt(rounds=4).async_hash(
+                    admin_user_info['password']
+                )
+            },
+        )
+
+        signin_dto = AuthSigninInputDTO(
+            email=admin_user_info['email'],
+            password=admin_user_info['password'],
+        )
+
+        response = await usecase.execute(signin_dto)
+
+        assert isinstance(response, AuthSigninOutputDTO)
+
+        user = await user_repository.find_by_email(admin_user_info['email'])
+
+        assert user is not None
+        assert user.password.startswith('$2b$10$')
+        assert user.version == outdated_user.version
+
+    async def test_outdated_password_hash_rehash_should_be_scheduled(
+        self,
+        setup: SetupType,
+        user_repository: UserRepository,
+        admin_user: User,
+        admin_user_info: dict,
+    ):
+        _, usecase = setup
+        schedule = MagicMock()
+
+        await user_repository.update_by_id(
+            str(admin_user.id),
+            str(admin_user.company_id),
+            {
+                'password': await PasswordHasherBcrypt(rounds=4).async_hash(
+                    admin_user_info['password']
+                )
+            },
+        )
+
+        signin_dto = AuthSigninInputDTO(
+            email=admin_user_info['email'],
+            password=admin_user_info['password'],
+        )
+
+        await usecase.execute(signin_dto, schedule)
+
+        schedule.assert_called_once()
+        func, user, password = schedule.call_args.args
+
+        assert func == usecase.rehash_password
+        assert user.id == admin_user.id
+        assert password == admin_user_info['password']
+
+    async def test_scheduled_rehash_should_not_undo_a_password_change(
+        self,
+        setup: SetupType,
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+        admin_user: User,
+        admin_user_info: dict,
+    ):
+        _, usecase = setup
+        schedule = MagicMock()
+        await user_repository.update_by_id(
+            str(admin_user.id),
+            str(admin_user.company_id),
+            {
+                'password': await PasswordHasherBcrypt(rounds=4).async_hash(
+                    admin_user_info['password']
+                )
+            },
+        )
+
+        signin_dto = AuthSigninInputDTO(
+            email=admin_user_info['email'],
+            password=admin_user_info['password'],
+        )
+
+        await usecase.execute(signin_dto, schedule)
+
+        # A password change lands before the scheduled rehash runs
+        changed_user = await UserUpdatePartialUseCase(
+            user_repository, password_hasher
+        ).execute(
+            admin_user,
+            str(admin_user.id),
+            UserUpdatePartialInputDTO(password='new_password'),
+        )
+        func, *args = schedule.call_args.args
+        await func(*args)
+
+        user = await user_repository.find_by_email(admin_user_info['email'])
+
+        assert await password_hasher.async_check('new_password', user.password)
+        assert user.version == changed_user.version
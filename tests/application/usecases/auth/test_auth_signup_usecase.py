@@ -114,7 +114,9 @@ class TestAuthSignupUsecase:
         usecase = setup
 
         with patch.object(
-            CompanyRepositorySQLAlchemy, 'create', return_value=None
+            CompanyRepositorySQLAlchemy,
+            'create_with_admin',
+            return_value=None,
         ):
             signup_dto = AuthSignupInputDTO(
                 company_name=admin_user_info['company_name'],
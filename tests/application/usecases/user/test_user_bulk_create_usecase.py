@@ -0,0 +1,158 @@
+from typing import List, Tuple
+
+import pytest
+
+from src.application.dtos.user.user_bulk_create_dto import (
+    UserBulkCreateInputDTO,
+    UserBulkCreateOutputDTO,
+    UserBulkCreateStatus,
+)
+from src.application.dtos.user.user_create_dto import UserCreateInputDTO
+from src.application.usecases.user.user_bulk_create_usecase import (
+    UserBulkCreateUseCase,
+)
+from src.domain.entities.user_entity import User
+from src.domain.entities.user_role import UserRole
+from src.domain.exceptions.auth_exceptions import UnauthorizedException
+from src.domain.exceptions.exceptions import ServiceUnavailableException
+from src.domain.repositories.user_repository import UserRepository
+from src.domain.security.password_hasher import PasswordHasher
+
+SetupType = Tuple[List[User], UserBulkCreateUseCase]
+
+
+@pytest.mark.asyncio
+class TestUserBulkCreateUsecase:
+    @pytest.fixture
+    def setup(
+        self,
+        admin_company_users: List[User],
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+    ) -> SetupType:
+        usecase = UserBulkCreateUseCase(
+            user_repository, password_hasher, chunk_size=2
+        )
+        return admin_company_users, usecase
+
+    async def test_should_create_users_and_report_conflicts(
+        self,
+        setup: SetupType,
+        user_repository: UserRepository,
+        admin_user_info: dict,
+    ):
+        users, usecase = setup
+        requester = users[0]
+        emails = [
+            'new1@admincompany.com',
+            admin_user_info['email'],
+            'new2@admincompany.com',
+            'new1@admincompany.com',
+            'new3@admincompany.com',
+        ]
+
+        bulk_create_dto = UserBulkCreateInputDTO(
+            users=[
+                UserCreateInputDTO(
+                    name='new', email=email, password='123456789'
+                )
+                for email in emails
+            ]
+        )
+
+        response = await usecase.execute(requester, bulk_create_dto)
+
+        assert isinstance(response, UserBulkCreateOutputDTO)
+        assert response.created == 3
+        assert response.conflicts == 2
+        assert [r.index for r in response.results] == [0, 1, 2, 3, 4]
+        assert [r.email for r in response.results] == emails
+        assert [r.status for r in response.results] == [
+            UserBulkCreateStatus.CREATED,
+            UserBulkCreateStatus.CONFLICT,
+            UserBulkCreateStatus.CREATED,
+            UserBulkCreateStatus.CONFLICT,
+            UserBulkCreateStatus.CREATED,
+        ]
+
+        for result in response.results:
+            if result.status == UserBulkCreateStatus.CONFLICT:
+                assert result.id is None
+                continue
+
+            user = await user_repository.find_by_email(result.email)
+
+            assert user is not None
+            assert user.id == result.id
+            assert user.role == UserRole.ADMIN
+            assert user.company_id == str(requester.company_id)
+
+    async def test_unavailable_hasher_should_report_the_rest(
+        self,
+        setup: SetupType,
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+    ):
+        users, usecase = setup
+        requester = users[0]
+        emails = [f'new{i}@admincompany.com' for i in range(5)]
+        hashed_passwords = 0
+        async_hash = password_hasher.async_hash
+
+        async def saturated_async_hash(password: str) -> str:
+            nonlocal hashed_passwords
+
+            # Saturated once the first chunk is hashed
+            if hashed_passwords == 2:
+                raise ServiceUnavailableException()
+
+            hashed_passwords += 1
+
+            return await async_hash(password)
+
+        usecase.password_hasher.async_hash = saturated_async_hash
+
+        bulk_create_dto = UserBulkCreateInputDTO(
+            users=[
+                UserCreateInputDTO(
+                    name='new', email=email, password='123456789'
+                )
+                for email in emails
+            ]
+        )
+
+        response = await usecase.execute(requester, bulk_create_dto)
+
+        assert response.created == 2
+        assert response.unavailable == 3
+        assert [r.index for r in response.results] == [0, 1, 2, 3, 4]
+        assert [r.status for r in response.results] == [
+            UserBulkCreateStatus.CREATED,
+            UserBulkCreateStatus.CREATED,
+            UserBulkCreateStatus.UNAVAILABLE,
+            UserBulkCreateStatus.UNAVAILABLE,
+            UserBulkCreateStatus.UNAVAILABLE,
+        ]
+        assert await user_repository.find_by_email(emails[1]) is not None
+        assert await user_repository.find_by_email(emails[2]) is None
+
+    async def test_non_admin_requester_should_raise_exception(
+        self, setup: SetupType, basic_user_info: dict
+    ):
+        users, usecase = setup
+        requester = users[1]
+
+        bulk_create_dto = UserBulkCreateInputDTO(
+            users=[
+                UserCreateInputDTO(
+                    name=basic_user_info['name'],
+                    email=basic_user_info['email'],
+                    password=basic_user_info['password'],
+                )
+            ]
+        )
+
+        with pytest.raises(UnauthorizedException) as exc:
+            await usecase.execute(requester, bulk_create_dto)
+
+        assert str(exc.value) == 'Unauthorized'
@@ -0,0 +1,40 @@
+from typing import List, Tuple
+
+import pytest
+
+from src.application.usecases.user.user_count_usecase import UserCountUseCase
+from src.domain.entities.user_entity import User
+from src.domain.exceptions.auth_exceptions import UnauthorizedException
+from src.domain.repositories.user_repository import UserRepository
+
+SetupType = Tuple[List[User], UserCountUseCase]
+
+
+@pytest.mark.asyncio
+class TestUserCountUsecase:
+    @pytest.fixture
+    def setup(
+        self,
+        admin_company_users: List[User],
+        user_repository: UserRepository,
+    ) -> SetupType:
+        return admin_company_users, UserCountUseCase(user_repository)
+
+    async def test_should_return_company_users_count(self, setup: SetupType):
+        users, usecase = setup
+        requester = users[0]
+
+        output = await usecase.execute(requester)
+
+        assert output.count == len(users)
+
+    async def test_non_admin_requester_should_raise_exception(
+        self, setup: SetupType
+    ):
+        users, usecase = setup
+        requester = users[1]
+
+        with pytest.raises(UnauthorizedException) as exc:
+            await usecase.execute(requester)
+
+        assert str(exc.value) == 'Unauthorized'
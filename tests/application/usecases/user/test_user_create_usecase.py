@@ -91,6 +91,50 @@ class TestUserCreateUsecase:
 
         assert str(exc.value) == 'Email already registered'
 
+    async def test_optimistic_insert_should_not_look_up_email(
+        self,
+        setup: SetupType,
+        basic_user_info: dict,
+        sql_statements: List[str],
+    ):
+        users, usecase = setup
+        requester = users[0]
+
+        user_create_dto = UserCreateInputDTO(
+            name=basic_user_info['name'],
+            email=basic_user_info['email'],
+            password=basic_user_info['password'],
+        )
+
+        await usecase.execute(requester, user_create_dto)
+
+        assert len(sql_statements) == 2
+        assert sql_statements[0].startswith('INSERT INTO users')
+        assert sql_statements[1].startswith('UPDATE companies')
+
+    async def test_existing_user_with_email_pre_check_should_raise_exception(
+        self,
+        admin_company_users: List[User],
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+        admin_user_info: dict,
+    ):
+        requester = admin_company_users[0]
+        usecase = UserCreateUseCase(
+            user_repository, password_hasher, optimistic_insert=False
+        )
+
+        user_create_dto = UserCreateInputDTO(
+            name=admin_user_info['name'],
+            email=admin_user_info['email'],
+            password=admin_user_info['password'],
+        )
+
+        with pytest.raises(UserAlreadyExistsException) as exc:
+            await usecase.execute(requester, user_create_dto)
+
+        assert str(exc.value) == 'Email already registered'
+
     async def test_non_admin_requester_should_raise_exception(
         self, setup: SetupType, basic_user_info: dict
     ):
@@ -31,6 +31,19 @@ class TestUserDeleteUsecase:
 
         assert user_deleted is None
 
+    async def test_delete_should_not_load_the_user(
+        self, setup: SetupType, sql_statements: List[str]
+    ):
+        users, usecase = setup
+        requester = users[0]
+        user_id = str(users[1].id)
+
+        await usecase.execute(requester, user_id)
+
+        assert len(sql_statements) == 2
+        assert sql_statements[0].startswith('DELETE FROM users')
+        assert sql_statements[1].startswith('UPDATE companies')
+
     async def test_not_found_user_should_raise_exception(
         self, setup: SetupType
     ):
@@ -0,0 +1,39 @@
+from typing import List, Tuple
+
+import pytest
+from uuid_extensions import uuid7str
+
+from src.application.usecases.user.user_exists_usecase import (
+    UserExistsUseCase,
+)
+from src.domain.entities.user_entity import User
+from src.domain.exceptions.exceptions import NotFoundException
+from src.domain.repositories.user_repository import UserRepository
+
+SetupType = Tuple[List[User], UserExistsUseCase]
+
+
+@pytest.mark.asyncio
+class TestUserExistsUsecase:
+    @pytest.fixture
+    def setup(
+        self,
+        admin_company_users: List[User],
+        user_repository: UserRepository,
+    ) -> SetupType:
+        return admin_company_users, UserExistsUseCase(user_repository)
+
+    async def test_valid_id_should_return_none(self, setup: SetupType):
+        users, usecase = setup
+        requester = users[0]
+
+        assert await usecase.execute(requester, str(users[1].id)) is None
+
+    async def test_invalid_id_should_raise_exception(self, setup: SetupType):
+        users, usecase = setup
+        requester = users[0]
+
+        with pytest.raises(NotFoundException) as exc:
+            await usecase.execute(requester, uuid7str())
+
+        assert str(exc.value) == 'Not found'
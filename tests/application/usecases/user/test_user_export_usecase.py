@@ -0,0 +1,61 @@
+import csv
+import json
+from io import StringIO
+from typing import List, Tuple
+
+import pytest
+
+from src.application.dtos.user.user_export_dto import UserExportFormat
+from src.application.usecases.user.user_export_usecase import (
+    UserExportUseCase,
+)
+from src.domain.entities.user_entity import User
+from src.domain.exceptions.auth_exceptions import UnauthorizedException
+from src.domain.repositories.user_repository import UserRepository
+
+SetupType = Tuple[List[User], UserExportUseCase]
+
+
+@pytest.mark.asyncio
+class TestUserExportUsecase:
+    @pytest.fixture
+    def setup(
+        self,
+        admin_company_users: List[User],
+        user_repository: UserRepository,
+    ) -> SetupType:
+        return admin_company_users, UserExportUseCase(user_repository)
+
+    async def test_should_export_users_as_ndjson(self, setup: SetupType):
+        users, usecase = setup
+        requester = users[0]
+
+        lines = await usecase.execute(requester, UserExportFormat.NDJSON)
+        exported_users = [json.loads(line) async for line in lines]
+
+        assert [u['id'] for u in exported_users] == [str(u.id) for u in users]
+        assert [u['email'] for u in exported_users] == [u.email for u in users]
+        assert all('password' not in u for u in exported_users)
+
+    async def test_should_export_users_as_csv(self, setup: SetupType):
+        users, usecase = setup
+        requester = users[0]
+
+        lines = await usecase.execute(requester, UserExportFormat.CSV)
+        content = ''.join([line async for line in lines])
+        exported_users = list(csv.DictReader(StringIO(content)))
+
+        assert [u['id'] for u in exported_users] == [str(u.id) for u in users]
+        assert [u['role'] for u in exported_users] == [u.role for u in users]
+        assert 'password' not in exported_users[0]
+
+    async def test_non_admin_requester_should_raise_exception(
+        self, setup: SetupType
+    ):
+        users, usecase = setup
+        requester = users[1]
+
+        with pytest.raises(UnauthorizedException) as exc:
+            await usecase.execute(requester, UserExportFormat.NDJSON)
+
+        assert str(exc.value) == 'Unauthorized'
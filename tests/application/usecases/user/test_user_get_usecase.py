@@ -48,3 +48,11 @@ class TestUserGetUsecase:
             await usecase.execute(requester, uuid7str())
 
         assert str(exc.value) == 'Not found'
+
+    async def test_cached_version_should_return_none(self, setup: SetupType):
+        users, usecase = setup
+        requester = users[0]
+        user_id = str(users[1].id)
+
+        assert await usecase.execute(requester, user_id, 1) is None
+        assert await usecase.execute(requester, user_id, 2) is not None
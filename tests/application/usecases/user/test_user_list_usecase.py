@@ -9,6 +9,7 @@ from src.application.usecases.user.user_list_usecase import UserListUseCase
 from src.domain.entities.user_entity import User
 from src.domain.entities.user_role import UserRole
 from src.domain.exceptions.auth_exceptions import UnauthorizedException
+from src.domain.exceptions.exceptions import InvalidCursorException
 from src.domain.repositories.user_repository import UserRepository
 
 SetupType = Tuple[List[User], UserListUseCase]
@@ -72,6 +73,55 @@ class TestUserListUsecase:
             assert isinstance(user.created_at, datetime)
             assert isinstance(user.updated_at, datetime)
 
+    async def test_should_return_next_cursor_and_page_through_users(
+        self, setup: SetupType
+    ):
+        users, usecase = setup
+        requester = users[0]
+
+        first_page = await usecase.execute(requester, 4, 0)
+
+        assert len(first_page.data) == 4
+        assert first_page.next_cursor is not None
+
+        second_page = await usecase.execute(
+            requester, 4, 0, first_page.next_cursor
+        )
+
+        assert [u.id for u in first_page.data + second_page.data] == [
+            str(u.id) for u in users
+        ]
+        assert second_page.next_cursor is None
+
+    async def test_cached_version_should_return_none_without_listing(
+        self, setup: SetupType, sql_statements: List[str]
+    ):
+        users, usecase = setup
+        requester = users[0]
+
+        response = await usecase.execute(requester, 10, 0)
+        sql_statements.clear()
+
+        assert (
+            await usecase.execute(
+                requester, 10, 0, cached_version=response.version
+            )
+            is None
+        )
+        assert len(sql_statements) == 1
+        assert sql_statements[0].startswith('SELECT count(users.id)')
+
+    async def test_invalid_cursor_should_raise_exception(
+        self, setup: SetupType
+    ):
+        users, usecase = setup
+        requester = users[0]
+
+        with pytest.raises(InvalidCursorException) as exc:
+            await usecase.execute(requester, 10, 0, 'invalid')
+
+        assert str(exc.value) == 'Invalid cursor'
+
     async def test_non_admin_requester_should_raise_exception(
         self, setup: SetupType, basic_user_info: dict
     ):
@@ -15,7 +15,10 @@ from src.application.usecases.user.user_update_partial_usecase import (
 from src.domain.entities.user_entity import User
 from src.domain.entities.user_role import UserRole
 from src.domain.exceptions.auth_exceptions import UnauthorizedException
-from src.domain.exceptions.exceptions import NotFoundException
+from src.domain.exceptions.exceptions import (
+    NotFoundException,
+    PreconditionFailedException,
+)
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.security.password_hasher import PasswordHasher
 
@@ -199,6 +202,24 @@ class TestUserUpdatePartialUsecase:
         assert isinstance(user_updated.updated_at, datetime)
         assert user_updated.updated_at == mock_update_datetime
 
+    @pytest.mark.parametrize(
+        'data', [{}, {'name': 'Updated Name'}], ids=['empty', 'name']
+    )
+    async def test_stale_version_should_raise_exception(
+        self, setup: SetupType, data: dict
+    ):
+        users, usecase = setup
+        requester = users[0]
+        user_id = str(users[1].id)
+
+        with pytest.raises(PreconditionFailedException):
+            await usecase.execute(
+                requester,
+                user_id,
+                UserUpdatePartialInputDTO(**data),
+                version=2,
+            )
+
     async def test_non_admin_user_cannot_update_another_user(
         self, setup: SetupType
     ):
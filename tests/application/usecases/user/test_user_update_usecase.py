@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from typing import List, Tuple
+from unittest.mock import patch
 
 import pytest
 from freezegun import freeze_time
@@ -13,7 +14,10 @@ from src.application.usecases.user.user_update_usecase import UserUpdateUseCase
 from src.domain.entities.user_entity import User
 from src.domain.entities.user_role import UserRole
 from src.domain.exceptions.auth_exceptions import UnauthorizedException
-from src.domain.exceptions.exceptions import NotFoundException
+from src.domain.exceptions.exceptions import (
+    NotFoundException,
+    PreconditionFailedException,
+)
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.security.password_hasher import PasswordHasher
 
@@ -72,6 +76,82 @@ class TestUserUpdateUsecase:
         assert isinstance(user_updated.created_at, datetime)
         assert user_updated.updated_at == mock_update_datetime
 
+    async def test_update_should_not_load_the_user(
+        self, setup: SetupType, sql_statements: List[str]
+    ):
+        users, usecase = setup
+        requester = users[1]
+
+        user_update_dto = UserUpdateInputDTO(
+            name='Updated Name',
+            password='updated_pass',
+            role=UserRole.USER,
+            avatar='updated_avatar',
+        )
+
+        await usecase.execute(requester, str(requester.id), user_update_dto)
+
+        assert len(sql_statements) == 1
+        assert sql_statements[0].startswith('UPDATE users')
+
+    async def test_stale_version_should_raise_exception(
+        self, setup: SetupType
+    ):
+        users, usecase = setup
+        requester = users[0]
+        user_id = str(users[1].id)
+
+        user_update_dto = UserUpdateInputDTO(
+            name='Updated Name',
+            password='updated_pass',
+            role=UserRole.USER,
+            avatar='updated_avatar',
+        )
+
+        user_updated = await usecase.execute(
+            requester, user_id, user_update_dto, version=1
+        )
+
+        assert user_updated.version == 2
+
+        with pytest.raises(PreconditionFailedException):
+            await usecase.execute(
+                requester, user_id, user_update_dto, version=1
+            )
+
+    async def test_rejected_update_should_not_hash_the_password(
+        self,
+        setup: SetupType,
+        password_hasher: PasswordHasher,
+        sql_statements: List[str],
+    ):
+        users, usecase = setup
+        admin, user = users[0], users[1]
+
+        user_update_dto = UserUpdateInputDTO(
+            name='Updated Name',
+            password='updated_pass',
+            role=UserRole.USER,
+            avatar='updated_avatar',
+        )
+
+        with patch.object(password_hasher, 'async_hash') as async_hash:
+            with pytest.raises(UnauthorizedException):
+                await usecase.execute(user, str(admin.id), user_update_dto)
+
+            with pytest.raises(NotFoundException):
+                await usecase.execute(admin, uuid7str(), user_update_dto)
+
+            with pytest.raises(PreconditionFailedException):
+                await usecase.execute(
+                    admin, str(user.id), user_update_dto, version=2
+                )
+
+        async_hash.assert_not_called()
+        assert not any(
+            statement.startswith('UPDATE') for statement in sql_statements
+        )
+
     async def test_non_admin_user_cannot_update_another_user(
         self, setup: SetupType
     ):
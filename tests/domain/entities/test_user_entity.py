@@ -64,3 +64,31 @@ class TestUserEntity:
         assert user.company_id == company_id
         assert user.created_at == user_created_at
         assert isinstance(user.created_at, datetime)
+
+    def test_user_entity_should_set_naive_datetimes_timezone_to_utc(self):
+        user = User(
+            name='Test User',
+            email='test@example.com',
+            password='123456789',
+            company_id=UUID('123e4567-e89b-12d3-a456-426614174000'),
+            created_at=datetime(2023, 1, 1, 12, 0, 0),
+            updated_at=datetime(2023, 1, 2, 12, 0, 0),
+        )
+
+        assert user.created_at == datetime(
+            2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc
+        )
+        assert user.updated_at == datetime(
+            2023, 1, 2, 12, 0, 0, tzinfo=timezone.utc
+        )
+
+    def test_user_entity_should_not_have_instance_dict(self):
+        user = User(
+            name='Test User',
+            email='test@example.com',
+            password='123456789',
+            company_id=UUID('123e4567-e89b-12d3-a456-426614174000'),
+        )
+
+        assert not hasattr(user, '__dict__')
+        assert User._datetime_fields == ('created_at', 'updated_at')
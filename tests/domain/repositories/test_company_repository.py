@@ -0,0 +1,131 @@
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+from freezegun import freeze_time
+
+from src.domain.entities.company_entity import Company
+from src.domain.entities.company_type import CompanyType
+from src.domain.entities.user_entity import User, UserRole
+from src.domain.exceptions.company_exceptions import (
+    CompanyAlreadyRegisteredException,
+)
+from src.domain.exceptions.user_exceptions import UserAlreadyExistsException
+from src.domain.repositories.company_repository import CompanyRepository
+from src.domain.repositories.user_repository import UserRepository
+
+mock_datetime = datetime(
+    2025,
+    1,
+    1,
+    0,
+    0,
+    0,
+    0,
+    timezone.utc,
+)
+
+
+@pytest.mark.asyncio
+class TestCompanyRepository:
+    @freeze_time(mock_datetime)
+    async def test_should_create_a_company(
+        self, company_repository: CompanyRepository
+    ):
+        company = Company('Company 1')
+
+        created_company = await company_repository.create(company)
+
+        assert created_company is not None
+        assert isinstance(created_company.id, str)
+        assert created_company.name == company.name
+        assert created_company.type == CompanyType.BASIC
+        assert created_company.created_at == mock_datetime
+
+        found_company = await company_repository.find_by_name(company.name)
+
+        assert found_company is not None
+        assert found_company.id == created_company.id
+        assert found_company.created_at == created_company.created_at
+
+    async def test_create_should_emit_a_single_insert(
+        self,
+        company_repository: CompanyRepository,
+        sql_statements: List[str],
+    ):
+        await company_repository.create(Company('Company 1'))
+
+        assert len(sql_statements) == 1
+        assert sql_statements[0].startswith('INSERT INTO companies')
+
+
+@pytest.mark.asyncio
+class TestCompanyRepositoryCreateWithAdmin:
+    @staticmethod
+    def build_admin(company: Company, email: str) -> User:
+        return User(
+            name='Admin',
+            email=email,
+            password='123456789',
+            role=UserRole.ADMIN,
+            company_id=company.id,
+        )
+
+    async def test_should_create_company_and_admin_in_one_transaction(
+        self,
+        company_repository: CompanyRepository,
+        user_repository: UserRepository,
+        sql_statements: List[str],
+    ):
+        company = Company('Company 1')
+        admin = self.build_admin(company, 'admin@company1.com')
+
+        created_company = await company_repository.create_with_admin(
+            company, admin
+        )
+
+        assert created_company is not None
+        assert created_company.users_count == 1
+        assert [s.split(' (')[0] for s in sql_statements] == [
+            'INSERT INTO companies',
+            'INSERT INTO users',
+        ]
+
+        found_admin = await user_repository.find_by_email(admin.email)
+
+        assert found_admin is not None
+        assert found_admin.company_id == created_company.id
+
+    async def test_existing_company_name_should_raise_exception(
+        self, company_repository: CompanyRepository
+    ):
+        company = Company('Company 1')
+        await company_repository.create_with_admin(
+            company, self.build_admin(company, 'admin@company1.com')
+        )
+
+        duplicated_company = Company('Company 1')
+
+        with pytest.raises(CompanyAlreadyRegisteredException):
+            await company_repository.create_with_admin(
+                duplicated_company,
+                self.build_admin(duplicated_company, 'other@company1.com'),
+            )
+
+    async def test_existing_email_should_raise_exception_without_company(
+        self, company_repository: CompanyRepository
+    ):
+        company = Company('Company 1')
+        await company_repository.create_with_admin(
+            company, self.build_admin(company, 'admin@company1.com')
+        )
+
+        other_company = Company('Company 2')
+
+        with pytest.raises(UserAlreadyExistsException):
+            await company_repository.create_with_admin(
+                other_company,
+                self.build_admin(other_company, 'admin@company1.com'),
+            )
+
+        assert await company_repository.find_by_name('Company 2') is None
@@ -1,11 +1,15 @@
 from dataclasses import replace
 from datetime import datetime, timezone
+from typing import List
+from uuid import UUID
 
 import pytest
 from freezegun import freeze_time
 from uuid_extensions import uuid7str
 
+from src.domain.entities.company_entity import Company
 from src.domain.entities.user_entity import User, UserRole
+from src.domain.repositories.company_repository import CompanyRepository
 from src.domain.repositories.user_repository import UserRepository
 
 mock_datetime = datetime(
@@ -24,6 +28,12 @@ mock_datetime = datetime(
 class TestUserRepository:
     company_id = uuid7str()
 
+    @pytest.fixture(autouse=True)
+    async def company(self, company_repository: CompanyRepository):
+        return await company_repository.create(
+            Company('Test Company', id=UUID(self.company_id))
+        )
+
     @freeze_time(mock_datetime)
     async def test_should_create_a_user(self, user_repository: UserRepository):
         user = User(
@@ -62,6 +72,58 @@ class TestUserRepository:
         assert created_user.avatar == found_user.avatar
         assert created_user.created_at == found_user.created_at
 
+    async def test_create_should_emit_insert_and_counter_update(
+        self, user_repository: UserRepository, sql_statements: List[str]
+    ):
+        user = User(
+            name='User 1',
+            email='user1@test.com',
+            password='123456789',
+            role=UserRole.ADMIN,
+            company_id=self.company_id,
+        )
+
+        await user_repository.create(user)
+
+        assert len(sql_statements) == 2
+        assert sql_statements[0].startswith('INSERT INTO users')
+        assert sql_statements[1].startswith('UPDATE companies')
+
+    async def test_should_create_many_users_skipping_existing_emails(
+        self, user_repository: UserRepository, sql_statements: List[str]
+    ):
+        existing_user = await user_repository.create(
+            User(
+                name='User 1',
+                email='user1@test.com',
+                password='123456789',
+                company_id=self.company_id,
+            )
+        )
+        users = [
+            User(
+                name=f'User {i}',
+                email=f'user{i}@test.com',
+                password='123456789',
+                company_id=self.company_id,
+            )
+            for i in range(1, 4)
+        ]
+
+        created_users = await user_repository.create_many(users)
+
+        assert [u.email for u in created_users] == [
+            'user2@test.com',
+            'user3@test.com',
+        ]
+        # Insert and users counter update of each call
+        assert len(sql_statements) == 4
+
+        found_user = await user_repository.find_by_email('user1@test.com')
+
+        assert found_user is not None
+        assert found_user.id == existing_user.id
+
     @freeze_time(mock_datetime)
     async def test_should_find_user_by_email(
         self, user_repository: UserRepository
@@ -136,6 +198,176 @@ class TestUserRepository:
         assert found_user_2.company_id == created_user_2.company_id
         assert found_user_2.created_at == created_user_2.created_at
 
+    @freeze_time(mock_datetime)
+    async def test_should_list_users_after_a_given_id(
+        self, user_repository: UserRepository
+    ):
+        created_users = []
+
+        for i in range(3):
+            user = User(
+                name=f'User {i}',
+                email=f'user{i}@test.com',
+                password='123456789',
+                role=UserRole.USER,
+                company_id=self.company_id,
+            )
+            created_users.append(await user_repository.create(user))
+
+        first_page = await user_repository.find_all_after(
+            self.company_id, 2, None
+        )
+        second_page = await user_repository.find_all_after(
+            self.company_id, 2, first_page[-1].id
+        )
+
+        assert [u.id for u in first_page] == [u.id for u in created_users[:2]]
+        assert [u.id for u in second_page] == [created_users[2].id]
+
+    async def test_should_keep_company_users_count(
+        self,
+        user_repository: UserRepository,
+        company_repository: CompanyRepository,
+    ):
+        user = await user_repository.create(
+            User(
+                name='User 1',
+                email='user1@test.com',
+                password='123456789',
+                company_id=self.company_id,
+            )
+        )
+        await user_repository.create_many(
+            [
+                User(
+                    name=f'User {i}',
+                    email=f'user{i}@test.com',
+                    password='123456789',
+                    company_id=self.company_id,
+                )
+                for i in range(1, 4)
+            ]
+        )
+        await user_repository.delete_by_id(user.id, self.company_id)
+
+        company = await company_repository.find_by_name('Test Company')
+
+        assert company.users_count == 2
+
+    async def test_create_beyond_max_users_should_not_be_rejected(
+        self,
+        user_repository: UserRepository,
+        company_repository: CompanyRepository,
+        company: Company,
+    ):
+        await user_repository.create_many(
+            [
+                User(
+                    name=f'User {i}',
+                    email=f'user{i}@test.com',
+                    password='123456789',
+                    company_id=self.company_id,
+                )
+                for i in range(company.max_users)
+            ]
+        )
+        await user_repository.create(
+            User(
+                name='User',
+                email='user@test.com',
+                password='123456789',
+                company_id=self.company_id,
+            )
+        )
+
+        company = await company_repository.find_by_name('Test Company')
+
+        assert company.users_count == company.max_users + 1
+
+    async def test_writes_should_bump_collection_version(
+        self, user_repository: UserRepository
+    ):
+        initial_version = await user_repository.collection_version(
+            self.company_id
+        )
+        user = await user_repository.create(
+            User(
+                name='User 1',
+                email='user1@test.com',
+                password='123456789',
+                company_id=self.company_id,
+            )
+        )
+        created_version = await user_repository.collection_version(
+            self.company_id
+        )
+        await user_repository.update_by_id(
+            user.id, self.company_id, {'name': 'User updated'}
+        )
+        updated_version = await user_repository.collection_version(
+            self.company_id
+        )
+        await user_repository.find_by_id(user.id, self.company_id)
+        read_version = await user_repository.collection_version(
+            self.company_id
+        )
+        await user_repository.delete_by_id(user.id, self.company_id)
+        deleted_version = await user_repository.collection_version(
+            self.company_id
+        )
+
+        assert initial_version != created_version
+        assert created_version != updated_version
+        assert read_version == updated_version
+        assert updated_version != deleted_version
+        assert await user_repository.collection_version(uuid7str()) == '0-0'
+
+    async def test_should_check_existence_and_count_without_loading_rows(
+        self, user_repository: UserRepository, sql_statements: List[str]
+    ):
+        user = await user_repository.create(
+            User(
+                name='User 1',
+                email='user1@test.com',
+                password='123456789',
+                company_id=self.company_id,
+            )
+        )
+        sql_statements.clear()
+
+        assert await user_repository.exists(user.id, self.company_id)
+        assert not await user_repository.exists(uuid7str(), self.company_id)
+        assert not await user_repository.exists(user.id, uuid7str())
+        assert await user_repository.count(self.company_id) == 1
+        assert await user_repository.count(uuid7str()) == 0
+
+        assert all('password' not in s for s in sql_statements)
+        assert 'LIMIT' in sql_statements[0]
+        assert sql_statements[-1].startswith('SELECT companies.users_count')
+        assert 'FROM users' not in sql_statements[-1]
+
+    async def test_read_queries_should_not_load_orm_instances(
+        self, user_repository: UserRepository
+    ):
+        user = await user_repository.create(
+            User(
+                name='User 1',
+                email='user1@test.com',
+                password='123456789',
+                company_id=self.company_id,
+            )
+        )
+        session = user_repository.session
+        session.expunge_all()
+
+        found_user = await user_repository.find_by_id(user.id, self.company_id)
+        found_users = await user_repository.find_all(self.company_id, 10, 0)
+
+        assert found_user == user
+        assert found_users == [user]
+        assert found_users[0].created_at.tzinfo == timezone.utc
+        assert len(session.identity_map) == 0
+
     @freeze_time(mock_datetime)
     async def test_should_update_user(self, user_repository: UserRepository):
         user_create = User(
@@ -151,21 +383,117 @@ class TestUserRepository:
         user_update = replace(
             user_create,
             name='User updated',
-            email='user@updated.com',
             password='updated_password',
             role=UserRole.USER,
+            avatar='updated_avatar',
+            version=2,
+        )
+
+        updated_user = await user_repository.update_by_id(
+            user_create.id,
+            self.company_id,
+            {
+                'name': user_update.name,
+                'password': user_update.password,
+                'role': user_update.role,
+                'avatar': user_update.avatar,
+            },
+            version=user_create.version,
+        )
+
+        assert updated_user == user_update
+        assert (
+            await user_repository.update_by_id(
+                user_create.id,
+                self.company_id,
+                {'name': 'Stale update'},
+                version=user_create.version,
+            )
+            is None
         )
 
-        updated_user = await user_repository.update(user_update)
+    async def test_should_update_user_by_id_without_loading_it(
+        self, user_repository: UserRepository, sql_statements: List[str]
+    ):
+        user = await user_repository.create(
+            User(
+                name='User 1',
+                email='user1@test.com',
+                password='123456789',
+                company_id=self.company_id,
+            )
+        )
+        sql_statements.clear()
+
+        updated_user = await user_repository.update_by_id(
+            user.id,
+            self.company_id,
+            {'name': 'User updated', 'updated_at': mock_datetime},
+            requester_id=user.id,
+        )
 
-        assert user_update.id == updated_user.id
-        assert user_update.name == updated_user.name
-        assert user_update.email == updated_user.email
-        assert user_update.password == updated_user.password
-        assert user_update.role == updated_user.role
-        assert user_update.avatar == updated_user.avatar
-        assert user_update.company_id == updated_user.company_id
-        assert user_update.created_at == updated_user.created_at
+        assert updated_user == replace(
+            user, name='User updated', updated_at=mock_datetime, version=2
+        )
+        assert len(sql_statements) == 1
+        assert sql_statements[0].startswith('UPDATE users')
+        assert 'RETURNING' in sql_statements[0]
+
+    async def test_update_by_id_should_not_update_other_users(
+        self, user_repository: UserRepository
+    ):
+        user = await user_repository.create(
+            User(
+                name='User 1',
+                email='user1@test.com',
+                password='123456789',
+                company_id=self.company_id,
+            )
+        )
+
+        assert (
+            await user_repository.update_by_id(
+                user.id,
+                self.company_id,
+                {'name': 'User updated'},
+                requester_id=uuid7str(),
+            )
+            is None
+        )
+        assert (
+            await user_repository.update_by_id(
+                user.id, uuid7str(), {'name': 'User updated'}
+            )
+            is None
+        )
+        assert (
+            await user_repository.find_by_id(user.id, self.company_id)
+        ).name == 'User 1'
+
+    async def test_update_password_should_only_replace_the_current_one(
+        self, user_repository: UserRepository
+    ):
+        user = await user_repository.create(
+            User(
+                name='User 1',
+                email='user1@test.com',
+                password='old_hash',
+                company_id=self.company_id,
+            )
+        )
+
+        assert not await user_repository.update_password(
+            user.id, self.company_id, 'new_hash', 'other_hash'
+        )
+        assert await user_repository.update_password(
+            user.id, self.company_id, 'new_hash', 'old_hash'
+        )
+
+        found_user = await user_repository.find_by_id(user.id, self.company_id)
+
+        assert found_user.password == 'new_hash'
+        assert found_user.version == user.version
+        assert found_user.updated_at == user.updated_at
 
     @freeze_time(mock_datetime)
     async def test_should_delete_a_user(self, user_repository: UserRepository):
@@ -174,7 +502,7 @@ class TestUserRepository:
             email='user1@test.com',
             password='123456789',
             role=UserRole.ADMIN,
-            company_id=uuid7str(),
+            company_id=self.company_id,
         )
 
         created_user = await user_repository.create(user)
@@ -183,4 +511,30 @@ class TestUserRepository:
             str(created_user.id), self.company_id
         )
 
-        assert response is None
+        assert response is True
+        assert (
+            await user_repository.find_by_id(created_user.id, self.company_id)
+            is None
+        )
+
+    async def test_delete_by_id_should_skip_the_excluded_user(
+        self, user_repository: UserRepository, sql_statements: List[str]
+    ):
+        user = await user_repository.create(
+            User(
+                name='User 1',
+                email='user1@test.com',
+                password='123456789',
+                company_id=self.company_id,
+            )
+        )
+        sql_statements.clear()
+
+        response = await user_repository.delete_by_id(
+            user.id, self.company_id, excluded_id=user.id
+        )
+
+        assert response is False
+        assert len(sql_statements) == 1
+        assert sql_statements[0].startswith('DELETE FROM users')
+        assert await user_repository.exists(user.id, self.company_id)
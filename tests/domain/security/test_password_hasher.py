@@ -37,3 +37,21 @@ class TestPasswordHasher:
         valid = await password_hasher.async_check(password, hashed_password)
 
         assert valid is False
+
+    def test_should_need_rehash_for_a_different_cost_factor(
+        self, password_hasher: PasswordHasher
+    ):
+        hashed_password = (
+            '$2b$04$zZvbpDt7Y2puEr50dK65x.LKRS63PrxL1L6YaW9p5ChgLOcBQrV9S'
+        )
+
+        assert password_hasher.needs_rehash(hashed_password)
+
+    def test_should_not_need_rehash_for_the_same_cost_factor(
+        self, password_hasher: PasswordHasher
+    ):
+        hashed_password = (
+            '$2b$10$zZvbpDt7Y2puEr50dK65x.LKRS63PrxL1L6YaW9p5ChgLOcBQrV9S'
+        )
+
+        assert password_hasher.needs_rehash(hashed_password) is False
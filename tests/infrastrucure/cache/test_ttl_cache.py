@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+
+from freezegun import freeze_time
+
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    def test_should_return_cached_value(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+
+        cache.set('a', 1)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+
+    def test_should_expire_entries_after_ttl(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+        now = datetime.now(tz=timezone.utc)
+
+        with freeze_time(now) as frozen_time:
+            cache.set('a', 1)
+            cache.set('b', 2, ttl=30)
+
+            frozen_time.tick(timedelta(seconds=11))
+
+            assert cache.get('a') is None
+            assert cache.get('b') == 2
+            assert len(cache) == 1
+
+    def test_should_evict_least_recently_used_entry(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_should_delete_and_clear_entries(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.delete('a')
+
+        assert cache.get('a') is None
+        assert len(cache) == 1
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_disabled_cache_should_not_store_values(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=0)
+
+        cache.set('a', 1)
+
+        assert cache.enabled is False
+        assert cache.get('a') is None
@@ -0,0 +1,69 @@
+from uuid import UUID
+
+import pytest
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_extensions import uuid7str
+
+from src.infrastructure.db.models.user_model import UserModel
+
+
+async def explain_query_plan(session: AsyncSession, stmt) -> str:
+    compiled = stmt.compile(
+        dialect=session.bind.dialect,
+        compile_kwargs={'literal_binds': True},
+    )
+    query = await session.execute(text(f'EXPLAIN QUERY PLAN {compiled}'))
+
+    return '\n'.join(row.detail for row in query)
+
+
+@pytest.mark.asyncio
+class TestUserModelIndexes:
+    company_id = UUID(uuid7str())
+    user_id = UUID(uuid7str())
+
+    async def test_list_company_users_should_use_company_id_id_index(
+        self, get_db_session: AsyncSession
+    ):
+        stmt = (
+            select(UserModel)
+            .filter(UserModel.company_id == self.company_id)
+            .order_by(UserModel.id)
+            .limit(10)
+        )
+
+        plan = await explain_query_plan(get_db_session, stmt)
+
+        assert 'ix_users_company_id_id' in plan
+        assert 'TEMP B-TREE' not in plan
+
+    async def test_list_company_users_after_id_should_use_index(
+        self, get_db_session: AsyncSession
+    ):
+        stmt = (
+            select(UserModel)
+            .filter(
+                UserModel.company_id == self.company_id,
+                UserModel.id > self.user_id,
+            )
+            .order_by(UserModel.id)
+            .limit(10)
+        )
+
+        plan = await explain_query_plan(get_db_session, stmt)
+
+        assert 'ix_users_company_id_id' in plan
+        assert 'TEMP B-TREE' not in plan
+
+    async def test_delete_company_user_should_use_index(
+        self, get_db_session: AsyncSession
+    ):
+        stmt = delete(UserModel).filter(
+            UserModel.id == self.user_id,
+            UserModel.company_id == self.company_id,
+        )
+
+        plan = await explain_query_plan(get_db_session, stmt)
+
+        assert 'SCAN' not in plan
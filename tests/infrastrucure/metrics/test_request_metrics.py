@@ -0,0 +1,68 @@
+from src.infrastructure.metrics.request_metrics import (
+    RequestMetrics,
+    RequestTimings,
+    current_request_timings,
+    record_hash,
+    record_sql,
+    render_gauges,
+)
+
+
+class TestRequestTimings:
+    def test_should_record_into_the_current_request(self):
+        timings = RequestTimings()
+        token = current_request_timings.set(timings)
+
+        try:
+            record_sql(0.002)
+            record_sql(0.003)
+            record_hash(0.05)
+        finally:
+            current_request_timings.reset(token)
+
+        assert timings.sql_statements == 2
+        assert timings.db_seconds == 0.005
+        assert timings.hash_seconds == 0.05
+
+    def test_should_ignore_records_outside_a_request(self):
+        record_sql(0.002)
+        record_hash(0.05)
+
+        assert current_request_timings.get() is None
+
+    def test_should_format_server_timing(self):
+        timings = RequestTimings(
+            sql_statements=3, db_seconds=0.0042, hash_seconds=0.1
+        )
+
+        assert timings.server_timing(0.25) == (
+            'app;dur=250.00, db;dur=4.20;desc="3 queries", hash;dur=100.00'
+        )
+
+
+class TestRequestMetrics:
+    def test_should_render_observed_requests(self):
+        metrics = RequestMetrics()
+        timings = RequestTimings(sql_statements=2, db_seconds=0.001)
+
+        metrics.observe('GET', 'user_get', 200, 0.02, timings)
+        metrics.observe('GET', 'user_get', 200, 0.2, timings)
+
+        lines = metrics.render()
+        labels = 'method="GET",handler="user_get",status="200"'
+
+        assert f'http_request_duration_seconds_count{{{labels}}} 2' in lines
+        assert (
+            f'http_request_duration_seconds_bucket{{{labels},le="0.025"}} 1'
+            in lines
+        )
+        assert (
+            f'http_request_duration_seconds_bucket{{{labels},le="0.25"}} 2'
+            in lines
+        )
+        assert f'http_request_sql_statements_total{{{labels}}} 4' in lines
+
+    def test_should_render_numeric_gauges_only(self):
+        lines = render_gauges('db_pool', {'pool': 'StaticPool', 'size': 5})
+
+        assert lines == ['# TYPE db_pool_size gauge', 'db_pool_size 5']
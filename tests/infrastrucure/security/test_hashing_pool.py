@@ -0,0 +1,71 @@
+import asyncio
+from threading import Event
+
+import pytest
+
+from src.domain.exceptions.exceptions import ServiceUnavailableException
+from src.infrastructure.security.hashing_pool import HashingPool
+
+
+@pytest.mark.asyncio
+class TestHashingPool:
+    async def test_should_run_job_and_record_stats(self):
+        pool = HashingPool(max_workers=1, max_queue_size=1)
+
+        result = await pool.run(sum, [1, 2, 3])
+
+        assert result == 6
+        assert pool.pending == 0
+        assert pool.stats.completed == 1
+        assert pool.stats.queue_wait_seconds_total >= 0
+        assert pool.stats.hash_seconds_total >= 0
+
+        pool.shutdown()
+
+    async def test_saturated_pool_should_raise_exception(self):
+        pool = HashingPool(max_workers=1, max_queue_size=1)
+        release = Event()
+
+        running = asyncio.ensure_future(pool.run(release.wait, 5))
+        queued = asyncio.ensure_future(pool.run(release.wait, 5))
+        await asyncio.sleep(0)
+
+        assert pool.pending == 2
+
+        with pytest.raises(ServiceUnavailableException) as exc:
+            await pool.run(release.wait, 5)
+
+        assert str(exc.value) == 'Service unavailable: Try again later'
+        assert pool.stats.rejected == 1
+
+        release.set()
+        await asyncio.gather(running, queued)
+
+        assert pool.pending == 0
+        assert pool.stats.completed == 2
+
+        pool.shutdown()
+
+    async def test_cancelled_job_should_stay_pending_until_it_ends(self):
+        pool = HashingPool(max_workers=1, max_queue_size=0)
+        started, release = Event(), Event()
+
+        def job():
+            started.set()
+            release.wait(5)
+
+        running = asyncio.ensure_future(pool.run(job))
+        await asyncio.to_thread(started.wait, 5)
+        running.cancel()
+        await asyncio.sleep(0)
+
+        assert running.cancelled()
+        assert pool.pending == 1
+
+        with pytest.raises(ServiceUnavailableException):
+            await pool.run(job)
+
+        release.set()
+        pool.shutdown()
+
+        assert pool.pending == 0
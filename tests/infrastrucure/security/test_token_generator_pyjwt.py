@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 from freezegun import freeze_time
 from uuid_extensions import uuid7str
@@ -14,6 +15,7 @@ from src.core.settings import settings
 from src.domain.entities.user_entity import User
 from src.domain.entities.user_role import UserRole
 from src.domain.security.token_generator import TokenGenerator
+from src.infrastructure.security import token_generator_pyjwt
 
 
 class TestTokenGeneratorPyJWT:
@@ -83,3 +85,42 @@ class TestTokenGeneratorPyJWT:
             )
 
         assert decoded_token is None
+
+    async def test_should_decode_a_cached_token_without_verifying_it_again(
+        self,
+        token_generator: TokenGenerator,
+        admin_user_token: TokenGeneratorEncodeOutputDTO,
+    ):
+        decoded_token = await token_generator.async_decode(
+            admin_user_token.access_token
+        )
+
+        with patch.object(token_generator_pyjwt, 'decode') as decode:
+            cached_decoded_token = await token_generator.async_decode(
+                admin_user_token.access_token
+            )
+
+        decode.assert_not_called()
+        assert cached_decoded_token == decoded_token
+
+    async def test_should_decode_an_expired_cached_token_and_return_none(
+        self,
+        token_generator: TokenGenerator,
+        admin_user_token: TokenGeneratorEncodeOutputDTO,
+    ):
+        decoded_token = await token_generator.async_decode(
+            admin_user_token.access_token
+        )
+
+        assert decoded_token is not None
+
+        future_date = datetime.now(tz=timezone.utc) + timedelta(
+            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES, seconds=1
+        )
+
+        with freeze_time(future_date):
+            decoded_token = await token_generator.async_decode(
+                admin_user_token.access_token
+            )
+
+        assert decoded_token is None
@@ -3,6 +3,10 @@ from httpx import AsyncClient
 
 from src.core.settings import settings
 from src.domain.entities.user_entity import User
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.security.password_hasher_bcrypt import (
+    PasswordHasherBcrypt,
+)
 
 
 class TestAuthSignupController:
@@ -121,6 +125,37 @@ class TestAuthSigninController:
         assert access_token['access_token'] != ''
         assert access_token['token_type'] == settings.ACCESS_TOKEN_TYPE
 
+    async def test_outdated_password_hash_should_be_rehashed_in_background(
+        self,
+        client: AsyncClient,
+        user_repository: UserRepository,
+        admin_user: User,
+        admin_user_info: dict,
+    ):
+        outdated_user = await user_repository.update_by_id(
+            str(admin_user.id),
+            str(admin_user.company_id),
+            {
+                'password': await PasswordHasherBcrypt(rounds=4).async_hash(
+                    admin_user_info['password']
+                )
+            },
+        )
+
+        response = await client.post(
+            '/auth/signin',
+            data={
+                'username': admin_user_info['email'],
+                'password': admin_user_info['password'],
+            },
+        )
+
+        user = await user_repository.find_by_email(admin_user_info['email'])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert user.password.startswith('$2b$10$')
+        assert user.version == outdated_user.version
+
     async def test_invalid_user_credentials_should_return_unauthorized_error(
         self, client: AsyncClient, admin_user: User, admin_user_info: dict
     ):
@@ -0,0 +1,28 @@
+from fastapi import status
+from httpx import AsyncClient
+
+from src.core.settings import settings
+
+
+class TestHealthDbPoolController:
+    async def test_should_return_pool_status(
+        self, client: AsyncClient, internal_token_headers: dict
+    ):
+        response = await client.get(
+            '/health/db-pool', headers=internal_token_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'pool' in response.json()
+
+    async def test_should_require_the_internal_token(
+        self, client: AsyncClient, monkeypatch
+    ):
+        disabled_response = await client.get('/health/db-pool')
+
+        monkeypatch.setattr(settings, 'INTERNAL_API_TOKEN', 'internal-token')
+
+        missing_response = await client.get('/health/db-pool')
+
+        assert disabled_response.status_code == status.HTTP_404_NOT_FOUND
+        assert missing_response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,74 @@
+import re
+
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dtos.security.token_generator_encode_dto import (
+    TokenGeneratorEncodeOutputDTO,
+)
+from src.core.settings import settings
+from src.domain.entities.user_entity import User
+from src.infrastructure.db.session import instrument_engine
+from src.infrastructure.metrics.request_metrics import request_metrics
+
+
+class TestMetricsController:
+    async def test_should_send_server_timing_header(
+        self,
+        client: AsyncClient,
+        get_db_session: AsyncSession,
+        admin_user: User,
+        admin_user_token: TokenGeneratorEncodeOutputDTO,
+    ):
+        instrument_engine(get_db_session.bind)
+
+        response = await client.get(
+            f'/users/{admin_user.id}',
+            headers={
+                'Authorization': f'Bearer {admin_user_token.access_token}'
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        server_timing = response.headers['Server-Timing']
+        queries = re.search(
+            r'db;dur=[\d.]+;desc="(\d+) queries"', server_timing
+        )
+
+        assert server_timing.startswith('app;dur=')
+        assert queries is not None
+        assert int(queries.group(1)) > 0
+
+    async def test_should_expose_prometheus_metrics(
+        self, client: AsyncClient, internal_token_headers: dict
+    ):
+        request_metrics.clear()
+
+        await client.get('/health/db-pool', headers=internal_token_headers)
+        response = await client.get('/metrics', headers=internal_token_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers['content-type'].startswith('text/plain')
+        assert (
+            'http_request_duration_seconds_count'
+            '{method="GET",handler="db_pool",status="200"} 1'
+        ) in response.text
+        assert 'password_hashing_pool_completed' in response.text
+
+    async def test_metrics_should_require_the_internal_token(
+        self, client: AsyncClient, monkeypatch
+    ):
+        disabled_response = await client.get('/metrics')
+
+        monkeypatch.setattr(settings, 'INTERNAL_API_TOKEN', 'internal-token')
+
+        missing_response = await client.get('/metrics')
+        wrong_response = await client.get(
+            '/metrics', headers={'Authorization': 'Bearer wrong-token'}
+        )
+
+        assert disabled_response.status_code == status.HTTP_404_NOT_FOUND
+        assert missing_response.status_code == status.HTTP_403_FORBIDDEN
+        assert wrong_response.status_code == status.HTTP_403_FORBIDDEN
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime, timedelta, timezone
 from typing import List, Tuple, TypeAlias
 
@@ -287,6 +288,97 @@ class TestUserCreateController:
         assert response2.json() == {'detail': 'Bad Request'}
 
 
+@pytest.mark.asyncio
+class TestUserBulkCreateController:
+    @pytest.fixture
+    def user_bulk_create_setup(self, setup: SetupType) -> UserCreateSetupType:
+        (
+            client,
+            admin_user_token_headers,
+            basic_user_token_headers,
+            empty_token_headers,
+            invalid_token_headers,
+            invalid_user_token_headers,
+            new_user_sample,
+            _,
+        ) = setup
+
+        return (
+            client,
+            admin_user_token_headers,
+            basic_user_token_headers,
+            empty_token_headers,
+            invalid_token_headers,
+            invalid_user_token_headers,
+            new_user_sample,
+        )
+
+    async def test_non_admin_requester_should_return_forbidden_error(
+        self, user_bulk_create_setup: UserCreateSetupType
+    ):
+        client, _, basic_user_token_headers, _, _, _, new_user_sample = (
+            user_bulk_create_setup
+        )
+
+        response = await client.post(
+            '/users/bulk',
+            headers=basic_user_token_headers,
+            json={'users': [new_user_sample]},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.json() == {'detail': 'Unauthorized'}
+
+    async def test_empty_users_should_return_unprocessable_error(
+        self, user_bulk_create_setup: UserCreateSetupType
+    ):
+        client, admin_user_token_headers, _, _, _, _, _ = (
+            user_bulk_create_setup
+        )
+
+        response = await client.post(
+            '/users/bulk', headers=admin_user_token_headers, json={'users': []}
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_bulk_create_should_return_per_user_report(
+        self, user_bulk_create_setup: UserCreateSetupType
+    ):
+        client, admin_user_token_headers, _, _, _, _, new_user_sample = (
+            user_bulk_create_setup
+        )
+        other_user_sample = {
+            **new_user_sample,
+            'email': 'other@mail.com',
+        }
+
+        response = await client.post(
+            '/users/bulk',
+            headers=admin_user_token_headers,
+            json={
+                'users': [
+                    new_user_sample,
+                    new_user_sample,
+                    other_user_sample,
+                ]
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        report = response.json()
+
+        assert report['created'] == 2
+        assert report['conflicts'] == 1
+        assert [r['status'] for r in report['results']] == [
+            'created',
+            'conflict',
+            'created',
+        ]
+        assert report['results'][1]['id'] is None
+
+
 @pytest.mark.asyncio
 class TestUserListController:
     @pytest.fixture
@@ -396,6 +488,31 @@ class TestUserListController:
                 == user_expected['updated_at']
             )
 
+    async def test_if_none_match_should_return_not_modified_until_a_write(
+        self, user_list_setup: UserListSetupType
+    ):
+        client, admin_user_token_headers, _, _, _, _, _, users = (
+            user_list_setup
+        )
+
+        response = await client.get('/users', headers=admin_user_token_headers)
+        etag = response.headers['ETag']
+        headers = {**admin_user_token_headers, 'If-None-Match': etag}
+
+        cached_response = await client.get('/users', headers=headers)
+        await client.patch(
+            f'/users/{users[1].id}',
+            headers=admin_user_token_headers,
+            json={'name': 'Updated Name'},
+        )
+        modified_response = await client.get('/users', headers=headers)
+
+        assert etag.startswith('W/')
+        assert cached_response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert cached_response.headers['ETag'] == etag
+        assert modified_response.status_code == status.HTTP_200_OK
+        assert modified_response.headers['ETag'] != etag
+
     async def test_should_use_limit_param_and_return_a_list_with_two_users(
         self, user_list_setup: UserListSetupType, datetime_to_web_iso
     ):
@@ -468,6 +585,49 @@ class TestUserListController:
                 == user_expected['updated_at']
             )
 
+    async def test_should_use_cursor_param_and_return_next_page(
+        self, user_list_setup: UserListSetupType
+    ):
+        client, admin_user_token_headers, _, _, _, _, _, users = (
+            user_list_setup
+        )
+
+        response = await client.get(
+            '/users?limit=4', headers=admin_user_token_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        next_cursor = response.json()['next_cursor']
+
+        assert next_cursor is not None
+
+        response = await client.get(
+            f'/users?limit=4&cursor={next_cursor}',
+            headers=admin_user_token_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        response_data = response.json()
+
+        assert [u['id'] for u in response_data['data']] == [
+            u.id for u in users[4:]
+        ]
+        assert response_data['next_cursor'] is None
+
+    async def test_invalid_cursor_should_return_bad_request_error(
+        self, user_list_setup: UserListSetupType
+    ):
+        client, admin_user_token_headers, _, _, _, _, _, _ = user_list_setup
+
+        response = await client.get(
+            '/users?cursor=invalid', headers=admin_user_token_headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {'detail': 'Invalid cursor'}
+
     async def test_should_return_an_empty_list(
         self, user_list_setup: UserListSetupType
     ):
@@ -488,6 +648,104 @@ class TestUserListController:
         assert len(users_expected) == 0
 
 
+@pytest.mark.asyncio
+class TestUserExportController:
+    async def test_non_admin_requester_should_return_forbidden_error(
+        self, setup: SetupType
+    ):
+        client, _, basic_user_token_headers, _, _, _, _, _ = setup
+
+        response = await client.get(
+            '/users/export', headers=basic_user_token_headers
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.json() == {'detail': 'Unauthorized'}
+
+    async def test_should_stream_users_as_ndjson(self, setup: SetupType):
+        client, admin_user_token_headers, _, _, _, _, _, users = setup
+
+        response = await client.get(
+            '/users/export', headers=admin_user_token_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers['content-type'] == 'application/x-ndjson'
+
+        exported_users = [
+            json.loads(line) for line in response.text.splitlines()
+        ]
+
+        assert [u['id'] for u in exported_users] == [u.id for u in users]
+
+    async def test_should_stream_users_as_csv(self, setup: SetupType):
+        client, admin_user_token_headers, _, _, _, _, _, users = setup
+
+        response = await client.get(
+            '/users/export?format=csv', headers=admin_user_token_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers['content-type'].startswith('text/csv')
+
+        lines = response.text.splitlines()
+
+        assert lines[0] == 'id,name,email,role,avatar,created_at,updated_at'
+        assert len(lines) == len(users) + 1
+
+
+@pytest.mark.asyncio
+class TestUserExistsController:
+    async def test_existing_user_should_return_ok_without_body(
+        self, setup: SetupType
+    ):
+        client, _, basic_user_token_headers, _, _, _, _, users = setup
+
+        response = await client.head(
+            f'/users/{users[0].id}', headers=basic_user_token_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == b''
+
+    async def test_not_found_user_should_return_not_found(
+        self, setup: SetupType
+    ):
+        client, admin_user_token_headers, _, _, _, _, _, _ = setup
+
+        response = await client.head(
+            f'/users/{uuid7str()}', headers=admin_user_token_headers
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.content == b''
+
+
+@pytest.mark.asyncio
+class TestUserCountController:
+    async def test_should_return_company_users_count(self, setup: SetupType):
+        client, admin_user_token_headers, _, _, _, _, _, users = setup
+
+        response = await client.get(
+            '/users/count', headers=admin_user_token_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {'count': len(users)}
+
+    async def test_non_admin_requester_should_return_forbidden_error(
+        self, setup: SetupType
+    ):
+        client, _, basic_user_token_headers, _, _, _, _, _ = setup
+
+        response = await client.get(
+            '/users/count', headers=basic_user_token_headers
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.json() == {'detail': 'Unauthorized'}
+
+
 @pytest.mark.asyncio
 class TestUserGetController:
     @pytest.fixture
@@ -611,6 +869,30 @@ class TestUserGetController:
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.json() == {'detail': 'Not found'}
 
+    async def test_if_none_match_should_return_not_modified(
+        self, user_get_setup: UserGetSetupType
+    ):
+        client, admin_user_token_headers, _, _, _, users = user_get_setup
+
+        response = await client.get(
+            f'/users/{users[1].id}', headers=admin_user_token_headers
+        )
+        etag = response.headers['ETag']
+
+        cached_response = await client.get(
+            f'/users/{users[1].id}',
+            headers={**admin_user_token_headers, 'If-None-Match': etag},
+        )
+        modified_response = await client.get(
+            f'/users/{users[1].id}',
+            headers={**admin_user_token_headers, 'If-None-Match': '"0"'},
+        )
+
+        assert cached_response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert cached_response.headers['ETag'] == etag
+        assert cached_response.content == b''
+        assert modified_response.status_code == status.HTTP_200_OK
+
 
 @pytest.mark.asyncio
 class TestUserDeleteController:
@@ -1000,6 +1282,65 @@ class TestUserUpdateController:
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.json() == {'detail': 'Not found'}
 
+    async def test_update_should_return_etag_with_new_version(
+        self, user_update_setup: UserUpdateSetupType
+    ):
+        (
+            client,
+            admin_user_token_headers,
+            _,
+            _,
+            _,
+            _,
+            update_user_info,
+            users,
+        ) = user_update_setup
+
+        response = await client.get(
+            f'/users/{users[1].id}', headers=admin_user_token_headers
+        )
+        etag = response.headers['ETag']
+
+        response = await client.put(
+            f'/users/{users[1].id}',
+            headers={**admin_user_token_headers, 'If-Match': etag},
+            json=update_user_info,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert etag == '"1"'
+        assert response.headers['ETag'] == '"2"'
+
+    async def test_stale_if_match_should_return_precondition_failed_error(
+        self, user_update_setup: UserUpdateSetupType
+    ):
+        (
+            client,
+            admin_user_token_headers,
+            _,
+            _,
+            _,
+            _,
+            update_user_info,
+            users,
+        ) = user_update_setup
+        headers = {**admin_user_token_headers, 'If-Match': '"1"'}
+
+        first_response = await client.put(
+            f'/users/{users[1].id}', headers=headers, json=update_user_info
+        )
+        second_response = await client.put(
+            f'/users/{users[1].id}', headers=headers, json=update_user_info
+        )
+
+        assert first_response.status_code == status.HTTP_200_OK
+        assert second_response.status_code == (
+            status.HTTP_412_PRECONDITION_FAILED
+        )
+        assert second_response.json() == {
+            'detail': 'Precondition failed: The resource was modified'
+        }
+
 
 @pytest.mark.asyncio
 class TestUserUpdatePartialController:
@@ -1348,3 +1689,25 @@ class TestUserUpdatePartialController:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.json() == {'detail': 'Not found'}
+
+    async def test_stale_if_match_should_return_precondition_failed_error(
+        self, user_update_partial_setup: UserUpdatePartialSetupType
+    ):
+        (
+            client,
+            admin_user_token_headers,
+            _,
+            _,
+            _,
+            _,
+            update_user_info,
+            users,
+        ) = user_update_partial_setup
+
+        response = await client.patch(
+            f'/users/{users[1].id}',
+            headers={**admin_user_token_headers, 'If-Match': '"2"'},
+            json={'name': update_user_info['name']},
+        )
+
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
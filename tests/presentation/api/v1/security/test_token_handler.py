@@ -0,0 +1,88 @@
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from src.application.dtos.security.token_generator_encode_dto import (
+    TokenGeneratorEncodeOutputDTO,
+)
+from src.domain.entities.user_entity import User
+from src.domain.exceptions.auth_exceptions import UnauthorizedException
+from src.domain.repositories.user_repository import UserRepository
+from src.domain.security.token_generator import TokenGenerator
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.repositories.user_repository_sqlalchemy import (
+    UserRepositorySQLAlchemy,
+)
+from src.presentation.api.v1.security.token_handler import (
+    get_requester_from_token,
+)
+
+
+@pytest.mark.asyncio
+class TestGetRequesterFromToken:
+    async def test_cached_requester_should_skip_repository_lookup(
+        self,
+        token_generator: TokenGenerator,
+        user_repository: UserRepository,
+        admin_user: User,
+        admin_user_token: TokenGeneratorEncodeOutputDTO,
+    ):
+        cache = TTLCache(maxsize=10, ttl=30)
+
+        requester = await get_requester_from_token(
+            admin_user_token.access_token,
+            token_generator,
+            user_repository,
+            cache,
+        )
+
+        with patch.object(
+            UserRepositorySQLAlchemy, 'find_by_id'
+        ) as find_by_id:
+            cached_requester = await get_requester_from_token(
+                admin_user_token.access_token,
+                token_generator,
+                user_repository,
+                cache,
+            )
+
+        find_by_id.assert_not_called()
+        assert cached_requester == requester
+        assert cached_requester is not requester
+
+    async def test_deleted_requester_should_be_invalidated(
+        self,
+        token_generator: TokenGenerator,
+        user_repository: UserRepository,
+        admin_company_users: List[User],
+        basic_user_token: TokenGeneratorEncodeOutputDTO,
+    ):
+        basic_user = admin_company_users[1]
+
+        with patch(
+            'src.infrastructure.cache.requester_cache.requester_cache',
+            TTLCache(maxsize=10, ttl=30),
+        ) as cache:
+            await get_requester_from_token(
+                basic_user_token.access_token,
+                token_generator,
+                user_repository,
+                cache,
+            )
+
+            assert len(cache) == 1
+
+            await user_repository.delete_by_id(
+                str(basic_user.id), str(basic_user.company_id)
+            )
+
+            assert len(cache) == 0
+
+            with pytest.raises(UnauthorizedException):
+                await get_requester_from_token(
+                    basic_user_token.access_token,
+                    token_generator,
+                    user_repository,
+                    cache,
+                )
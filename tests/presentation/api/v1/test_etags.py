@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.application.dtos.user.user_output_dto import UserOutputDTO
+from src.domain.exceptions.exceptions import PreconditionFailedException
+from src.presentation.api.v1.etags import (
+    parse_if_match,
+    parse_if_none_match,
+    user_etag,
+    user_version,
+    users_etag,
+)
+
+
+class TestUserEtag:
+    def test_should_quote_user_version(self):
+        dto = UserOutputDTO(
+            id='user-id',
+            name='User 1',
+            email='user1@test.com',
+            role='user',
+            avatar='',
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            version=3,
+        )
+
+        assert user_etag(dto.version) == '"3"'
+        assert 'version' not in dto.model_dump()
+
+    def test_users_etag_should_be_weak(self):
+        assert users_etag('5-17') == 'W/"5-17"'
+
+
+class TestParseIfMatch:
+    @pytest.mark.parametrize('if_match', [None, '*', ' * '])
+    def test_missing_or_any_should_accept_any_version(self, if_match):
+        assert parse_if_match(if_match) is None
+
+    def test_strong_etag_should_return_version(self):
+        assert parse_if_match('"7"') == 7
+        assert parse_if_match(' "12" ') == 12
+
+    @pytest.mark.parametrize(
+        'if_match', ['W/"7"', '7', '"a"', '""', '"1", "2"']
+    )
+    def test_unsupported_etag_should_raise_exception(self, if_match):
+        with pytest.raises(PreconditionFailedException):
+            parse_if_match(if_match)
+
+
+class TestParseIfNoneMatch:
+    def test_strong_or_weak_etag_should_return_version(self):
+        assert parse_if_none_match('"7"') == '7'
+        assert parse_if_none_match('W/"7-12"') == '7-12'
+
+    @pytest.mark.parametrize('if_none_match', [None, '*', '""', '"1", "2"'])
+    def test_unsupported_etag_should_return_none(self, if_none_match):
+        assert parse_if_none_match(if_none_match) is None
+
+
+class TestUserVersion:
+    def test_numeric_version_should_return_user_version(self):
+        assert user_version('7') == 7
+
+    @pytest.mark.parametrize('version', [None, '7-12', 'a'])
+    def test_other_version_should_return_none(self, version):
+        assert user_version(version) is None
@@ -0,0 +1,69 @@
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
+from src.application.dtos.user.user_output_dto import UserOutputDTO
+from src.domain.entities.user_role import UserRole
+from src.main import app
+from src.presentation.api.v1.responses import DTOResponse, FastJSONResponse
+
+
+class TestFastJSONResponse:
+    def test_should_render_uuids_enums_and_aware_datetimes(self):
+        response = FastJSONResponse(
+            {
+                'id': UUID('01890a5d-ac96-774b-bcce-b302099a8057'),
+                'role': UserRole.ADMIN,
+                'name': 'Usuário',
+                'at': datetime(2024, 1, 1, tzinfo=timezone.utc),
+            }
+        )
+
+        assert response.media_type == 'application/json'
+        assert response.body == (
+            b'{"id":"01890a5d-ac96-774b-bcce-b302099a8057","role":"admin",'
+            b'"name":"Usu\xc3\xa1rio","at":"2024-01-01T00:00:00Z"}'
+        )
+
+    def test_should_be_the_app_default_response_class(self):
+        assert app.router.default_response_class is FastJSONResponse
+
+
+class TestDTOResponse:
+    def test_should_render_dto_as_json(self):
+        dto = UserOutputDTO(
+            id='user-id',
+            name='User 1',
+            email='user1@test.com',
+            role='user',
+            avatar='',
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+        response = DTOResponse(dto, status_code=201)
+
+        assert response.status_code == 201
+        assert response.media_type == 'application/json'
+        assert json.loads(response.body) == {
+            'id': 'user-id',
+            'name': 'User 1',
+            'email': 'user1@test.com',
+            'role': 'user',
+            'avatar': '',
+            'created_at': '2024-01-01T00:00:00Z',
+            'updated_at': '2024-01-01T00:00:00Z',
+        }
+
+    def test_should_render_plain_content_as_json(self):
+        response = DTOResponse({'detail': 'ok'})
+
+        assert json.loads(response.body) == {'detail': 'ok'}
+
+    def test_user_routes_should_keep_response_schema(self):
+        paths = app.openapi()['paths']
+        list_response = paths['/users/']['get']['responses']['200']
+
+        assert list_response['content']['application/json']['schema'] == {
+            '$ref': '#/components/schemas/UserListOutputDTO'
+        }